@@ -0,0 +1,70 @@
+"""Benchmark comparison imports"""
+
+import argparse
+import json
+import sys
+
+THRESHOLD = 0.10  ## Relative increase reported as a regression
+
+METRICS = (
+    ("p50 ms", lambda r: r["latency_ms"]["p50"]),
+    ("p99 ms", lambda r: r["latency_ms"]["p99"]),
+    ("startup ms", lambda r: r["startup_ms"]),
+    ("B/key", lambda r: r["bytes_per_key"]),
+    ("writes/key", lambda r: r["writes_per_key"]),
+    ("flushes", lambda r: r["flushes"]),
+    ("peak KiB", lambda r: r.get("peak_alloc_kb")),
+)
+
+
+def compare(base, new, threshold=THRESHOLD):
+    """Yield `(scenario, metric, before, after, regressed)` for both runs.
+
+    Scenarios that only ran (or only succeeded) in one of them are skipped.
+    """
+    for name, after in new["results"].items():
+        before = base["results"].get(name)
+        if before is None or "error" in before or "error" in after:
+            continue
+        for metric, get in METRICS:
+            old, value = get(before), get(after)
+            if old is None or value is None:
+                continue
+            regressed = value > old * (1 + threshold) and value - old > 0.01
+            yield name, metric, old, value, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare two result files written by benchmarks/run.py."
+    )
+    parser.add_argument("base", help="results to compare against")
+    parser.add_argument("new", help="results of the change being measured")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="relative increase reported as a regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    regressions = 0
+    for name, metric, old, value, regressed in compare(base, new, args.threshold):
+        change = f"{(value - old) / old:+.0%}" if old else "new"
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{name:<28} {metric:<11} {old:>12.3f} -> {value:>12.3f} {change:>7}{flag}"
+        )
+        regressions += regressed
+    for name, result in new["results"].items():
+        if "error" in result:
+            print(f"{name:<28} {result['error']}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Import time benchmark imports"""
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from run import REPO, RESULTS, _meta
+
+RUNS = 20  ## Fresh interpreters per statement
+HEAVY = (
+    "dateutil",
+    "re",
+    "shutil",
+    "typing",
+    "asyncio",
+    "threading",
+)  ## Reported when loaded
+
+STATEMENTS = {
+    "import": "import rebullet",
+    "yesno": "from rebullet import YesNo",
+    "bullet": "from rebullet import Bullet",
+    "date": "from rebullet import Date",
+}
+
+
+def _measure(statement):
+    """Return `(total_us, self_us, loaded)` for one fresh run of `statement`.
+
+    `total_us` is the cumulative time of every module the statement
+    imported, the interpreter's own startup excluded; `self_us` maps
+    each module to its self time.
+    """
+    code = f"{statement}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=REPO)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO,
+        check=True,
+    )
+    total = 0
+    self_us = {}
+    started = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == "site" and not name.startswith("  "):
+            started = True  # Everything after site is the statement's
+            continue
+        if not started:
+            continue
+        self_us[name.strip()] = int(own)
+        if not name.startswith("  "):
+            total += int(cumulative)
+    modules = set(proc.stdout.split())
+    loaded = [name for name in HEAVY if name in modules]
+    return total, self_us, loaded
+
+
+def measure(statement, runs=RUNS):
+    """Time `statement` in `runs` fresh interpreters and summarize."""
+    totals = []
+    selves = {}
+    loaded = []
+    for _ in range(runs):
+        total, self_us, loaded = _measure(statement)
+        totals.append(total)
+        for name, value in self_us.items():
+            selves.setdefault(name, []).append(value)
+    slowest = sorted(
+        ((statistics.median(v), name) for name, v in selves.items()), reverse=True
+    )[:10]
+    return {
+        "statement": statement,
+        "runs": runs,
+        "ms": {
+            "median": statistics.median(totals) / 1000,
+            "min": min(totals) / 1000,
+            "max": max(totals) / 1000,
+        },
+        "slowest_self_ms": {name: us / 1000 for us, name in slowest},
+        "heavy_modules": loaded,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure how long importing rebullet takes with -X importtime."
+    )
+    parser.add_argument(
+        "statements",
+        nargs="*",
+        metavar="statement",
+        help=f"statements to time (default: all of {', '.join(STATEMENTS)})",
+    )
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="exit with status 1 if a median import time exceeds this many ms",
+    )
+    parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    args = parser.parse_args(argv)
+    for name in args.statements:
+        if name not in STATEMENTS:
+            parser.error(f"unknown statement {name!r}")
+
+    # Time imports, not compiling sources to bytecode.
+    compileall.compile_dir(os.path.join(REPO, "rebullet"), quiet=1)
+    results = {}
+    for name in args.statements or STATEMENTS:
+        result = results[name] = measure(STATEMENTS[name], args.runs)
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        print(
+            f"{name:<8} {result['statement']:<30} median {result['ms']['median']:7.2f} ms"
+            f"  (min {result['ms']['min']:.2f}, max {result['ms']['max']:.2f})"
+            f"  loads: {heavy}",
+            flush=True,
+        )
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS, exist_ok=True)
+        output = os.path.join(RESULTS, "importtime.json")
+    meta = _meta(None, None)
+    del meta["terminal"]
+    with open(output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"results written to {output}")
+    if args.budget is not None:
+        over = [n for n, r in results.items() if r["ms"]["median"] > args.budget]
+        if over:
+            print(f"over the {args.budget} ms budget: {', '.join(over)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+"""Benchmark imports"""
+
+import argparse
+import fcntl
+import json
+import os
+import platform
+import pty
+import select
+import signal
+import struct
+import subprocess
+import sys
+import termios
+import time
+import traceback
+from datetime import datetime
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(REPO, "benchmarks", "results")
+
+SIZES = (10, 1000, 100000)  ## Default numbers of choices (or pasted characters)
+TIMEOUT = 30  ## Seconds a scenario may run before it is reported as stuck
+WRITE_CHUNK = 1024  ## Bytes written to the terminal at once while sending a key
+
+UP = b"\033[A"
+DOWN = b"\033[B"
+LEFT = b"\033[D"
+PG_UP = b"\033[5~"
+PG_DOWN = b"\033[6~"
+SPACE = b" "
+BACK_SPACE = b"\x7f"
+ENTER = b"\r"
+PASTE_START = b"\033[200~"
+PASTE_END = b"\033[201~"
+
+WORDS = tuple(
+    "alpha bravo charlie delta echo foxtrot golf hotel"
+    " india juliet kilo lima mike november oscar papa".split()
+)
+
+
+def _words(n):
+    """Return `n` distinct choices of varying length."""
+    return [
+        f"{WORDS[i % len(WORDS)]} {WORDS[i * 7 % len(WORDS)]} {i:06d}" for i in range(n)
+    ]
+
+
+# Scenarios. Each one takes a size and returns a function that launches the
+# widget (called in the child, where the terminal is the pty) and the keys
+# to send, one `bytes` per keystroke. rebullet is only imported in the child
+# so that it sizes itself from the pty.
+
+
+def bullet(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import Bullet
+
+        return Bullet("Pick one: ", choices).launch()
+
+    return launch, [DOWN] * 50 + [UP] * 10 + [ENTER]
+
+
+def check(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import Check
+
+        return Check("Pick some: ", choices).launch()
+
+    return launch, [DOWN, SPACE] * 25 + [UP] * 10 + [ENTER]
+
+
+def check_dependencies(size):
+    # A binary tree: every choice depends on its parent.
+    choices = _words(size)
+    dep_tree = [(choices[0], ())] + [
+        (choice, (choices[(i - 1) // 2],)) for i, choice in enumerate(choices) if i
+    ]
+
+    def launch():
+        from rebullet import CheckDependencies
+
+        return CheckDependencies("Pick packages: ", dep_tree).launch()
+
+    keys = [DOWN] * 20 + [SPACE, UP, SPACE] * 5 + [UP] * 10 + [SPACE, SPACE]
+    return launch, keys + [ENTER]
+
+
+def scrollbar(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import ScrollBar
+
+        return ScrollBar("Pick one: ", choices, height=10).launch()
+
+    keys = [DOWN] * 50 + [PG_DOWN] * 5 + [PG_UP] * 5 + [UP] * 10
+    return launch, keys + [ENTER]
+
+
+def scrollbar_fullscreen(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import ScrollBar
+
+        return ScrollBar("Pick one: ", choices, fullscreen=True).launch()
+
+    keys = [DOWN] * 50 + [PG_DOWN] * 5 + [PG_UP] * 5 + [UP] * 10
+    return launch, keys + [ENTER]
+
+
+def scrollbar_hold(size):
+    # A held key: each burst of auto-repeats reaches the widget at once.
+    choices = _words(size)
+
+    def launch():
+        from rebullet import ScrollBar
+
+        return ScrollBar("Pick one: ", choices, height=10).launch()
+
+    keys = [DOWN * 60] * 10 + [PG_DOWN * 20] * 5 + [UP * 60] * 5
+    return launch, keys + [ENTER]
+
+
+def scrollbar_search(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import ScrollBar
+
+        return ScrollBar("Pick one: ", choices, height=10, search=True).launch()
+
+    keys = [b"e", b"c", b"h", b"0"] + [BACK_SPACE] * 2 + [DOWN] * 5
+    return launch, keys + [ENTER]
+
+
+def scroll_check(size):
+    choices = _words(size)
+
+    def launch():
+        from rebullet import ScrollCheck
+
+        return ScrollCheck("Pick some: ", choices, height=10, search=True).launch()
+
+    keys = [DOWN, SPACE] * 10 + [b"\x12", b"\x01", b"\x14", b"\x04"]
+    keys += [b"e", b"c", b"h", b"\x01", BACK_SPACE, BACK_SPACE, BACK_SPACE]
+    return launch, keys + [PG_DOWN] * 5 + [ENTER]
+
+
+def input_paste(size):
+    text = " ".join(_words(size // 20 + 1)).encode()[:size]
+
+    def launch():
+        from rebullet import Input
+
+        return Input("Paste here: ").launch()
+
+    keys = list(map(bytes, zip(b"typed "))) + [PASTE_START + text + PASTE_END]
+    return launch, keys + [LEFT] * 5 + [ENTER]
+
+
+SCENARIOS = {
+    "bullet": bullet,
+    "check": check,
+    "check-dependencies": check_dependencies,
+    "scrollbar": scrollbar,
+    "scrollbar-fullscreen": scrollbar_fullscreen,
+    "scrollbar-hold": scrollbar_hold,
+    "scrollbar-search": scrollbar_search,
+    "scroll-check": scroll_check,
+    "input-paste": input_paste,
+}
+
+
+def _child(launch, rows, cols, memory, sync):
+    """Run `launch` in the pty, reporting progress on the `sync` pipe.
+
+    Whenever the widget waits for a key the child reports the bytes, write
+    syscalls and frames written so far; when it returns, the peak memory
+    allocated by the widget (modules are imported before tracing starts).
+    """
+    status = 1
+    try:
+        fcntl.ioctl(0, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+        sys.path.insert(0, REPO)
+        import tracemalloc
+
+        # Imported up front, so the traced run measures the widget and not
+        # the modules every widget loads.
+        import rebullet.client  # noqa: F401
+        from rebullet import output, utils
+
+        class CountingOutput(output.FdOutput):
+            """The terminal widgets draw on, counting what reaches it."""
+
+            writes = size = frames = 0
+
+            def write(self, data):
+                self.frames += 1
+                return super().write(data)
+
+            def _write(self, data):
+                n = super()._write(data)
+                self.writes += 1
+                self.size += n
+                return n
+
+        # The controlling terminal: widgets draw there, not on stdout.
+        out = CountingOutput(os.open("/dev/tty", os.O_WRONLY), owned=True)
+        utils.set_output(out)
+
+        def report(tag, payload=""):
+            line = f"{tag} {out.size} {out.writes} {out.frames} {payload}\n"
+            os.write(sync, line.encode())
+
+        getchar = utils.getchar
+
+        def waiting_getchar():
+            # A key is done once the widget asks for the next one.
+            if not utils._reader.events:
+                report("R")
+            return getchar()
+
+        utils.getchar = waiting_getchar
+        if memory:
+            tracemalloc.start()
+        launch()
+        peak = tracemalloc.get_traced_memory()[1] if memory else 0
+        report("D", peak)
+        status = 0
+    except (
+        ArithmeticError,
+        AttributeError,
+        EOFError,
+        ImportError,
+        KeyboardInterrupt,
+        LookupError,
+        OSError,
+        RuntimeError,
+        TypeError,
+        ValueError,
+    ):
+        # Anything else still ends the child; the parent then reports that
+        # it exited without a report.
+        error = traceback.format_exc().replace("\n", "\\n")
+        os.write(sync, f"E {error}\n".encode())
+    finally:
+        os._exit(status)
+
+
+class _Driver:
+    """Parent end of one benchmark run."""
+
+    def __init__(self, master, sync, deadline):
+        self.master = master
+        self.sync = sync
+        self.deadline = deadline
+        self.lines = b""
+        self.tty_bytes = 0
+
+    def send(self, data):
+        """Write `data` to the terminal and wait for the widget to settle.
+
+        Returns:
+            tuple: The child's report, `(tag, bytes, writes, flushes, rest)`.
+        """
+        view = memoryview(data)
+        while True:
+            if b"\n" in self.lines:
+                line, self.lines = self.lines.split(b"\n", 1)
+                line = line.decode()
+                if line.startswith("E "):
+                    raise RuntimeError(line[2:].replace("\\n", "\n"))
+                if not view:
+                    tag, *counts, rest = line.split(" ", 4)
+                    return (tag, *map(int, counts), rest)
+                continue
+            timeout = self.deadline - time.perf_counter()
+            if timeout <= 0:
+                raise TimeoutError
+            writing = [self.master] if view else []
+            readable, writable, _ = select.select(
+                [self.master, self.sync], writing, [], timeout
+            )
+            if self.master in readable:
+                try:
+                    self.tty_bytes += len(os.read(self.master, 65536))
+                except OSError:
+                    pass  # The child closed the terminal
+            if writable:
+                n = os.write(self.master, view[:WRITE_CHUNK])
+                view = view[n:]
+            if self.sync in readable:
+                chunk = os.read(self.sync, 65536)
+                if not chunk:
+                    raise RuntimeError("benchmark child exited without a report")
+                self.lines += chunk
+
+
+def run_once(scenario, size, rows, cols, memory, timeout):
+    """Drive one scenario through a pty and return its raw measurements."""
+    launch, keys = SCENARIOS[scenario](size)
+    sync_r, sync_w = os.pipe()
+    pid, master = pty.fork()
+    if pid == 0:
+        os.close(sync_r)
+        _child(launch, rows, cols, memory, sync_w)
+    os.close(sync_w)
+    driver = _Driver(master, sync_r, time.perf_counter() + timeout)
+    latencies, bytes_per_key, writes_per_key = [], [], []
+    try:
+        start = time.perf_counter()
+        _, startup_bytes, written, _, _ = driver.send(b"")
+        startup = time.perf_counter() - start
+        total, writes = startup_bytes, written
+        for key in keys:
+            t = time.perf_counter()
+            before = total, writes
+            tag, total, writes, flushes, rest = driver.send(key)
+            latencies.append(time.perf_counter() - t)
+            bytes_per_key.append(total - before[0])
+            writes_per_key.append(writes - before[1])
+            if tag == "D":
+                break
+    except TimeoutError:
+        os.kill(pid, signal.SIGKILL)
+        return {"error": f"timed out after {timeout}s", "keys_done": len(latencies)}
+    except RuntimeError as error:
+        os.kill(pid, signal.SIGKILL)
+        return {"error": str(error).strip(), "keys_done": len(latencies)}
+    finally:
+        os.waitpid(pid, 0)
+        os.close(master)
+        os.close(sync_r)
+    return {
+        "startup_ms": startup * 1000,
+        "latencies_ms": [t * 1000 for t in latencies],
+        "startup_bytes": startup_bytes,
+        "bytes": total,
+        "bytes_per_key": bytes_per_key,
+        "writes": writes,
+        "writes_per_key": writes_per_key,
+        "flushes": flushes,
+        "peak_alloc_kb": int(rest) // 1024 if memory else None,
+    }
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def summarize(raw):
+    """Reduce the measurements of one run to the numbers worth comparing."""
+    if "error" in raw:
+        return raw
+    latencies = raw["latencies_ms"]
+    return {
+        "keys": len(latencies),
+        "startup_ms": round(raw["startup_ms"], 3),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p90": round(_percentile(latencies, 90), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "max": round(max(latencies), 3),
+            "mean": round(sum(latencies) / len(latencies), 3),
+        },
+        "bytes": raw["bytes"],
+        "startup_bytes": raw["startup_bytes"],
+        "bytes_per_key": round(sum(raw["bytes_per_key"]) / len(latencies), 1),
+        "writes": raw["writes"],
+        "writes_per_key": round(sum(raw["writes_per_key"]) / len(latencies), 2),
+        "flushes": raw["flushes"],
+    }
+
+
+def _meta(rows, cols):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "terminal": [cols, rows],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Drive rebullet widgets through a pseudo-terminal and "
+        "record keystroke latency, output volume and memory."
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, SIZES)),
+        help="comma separated numbers of choices (pasted characters for input-paste)",
+    )
+    parser.add_argument("--rows", type=int, default=40, help="terminal height")
+    parser.add_argument("--cols", type=int, default=120, help="terminal width")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the second, traced run that measures peak memory",
+    )
+    parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    args = parser.parse_args(argv)
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f"unknown scenario {scenario!r}")
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = {}
+    for scenario in args.scenarios or SCENARIOS:
+        for size in sizes:
+            name = f"{scenario}-{size}"
+            raw = run_once(scenario, size, args.rows, args.cols, False, args.timeout)
+            result = summarize(raw)
+            if not args.no_memory and "error" not in result:
+                traced = run_once(
+                    scenario, size, args.rows, args.cols, True, args.timeout
+                )
+                result["peak_alloc_kb"] = traced.get("peak_alloc_kb")
+            results[name] = result
+            print(_line(name, result), flush=True)
+
+    output = args.output or os.path.join(
+        RESULTS, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {"meta": _meta(args.rows, args.cols), "results": results}, f, indent=2
+        )
+    print(f"Saved to {output}")
+
+
+def _line(name, result):
+    if "error" in result:
+        return f"{name:<28} {result['error']} ({result['keys_done']} keys done)"
+    latency = result["latency_ms"]
+    return (
+        f"{name:<28} p50 {latency['p50']:8.3f}ms  p99 {latency['p99']:8.3f}ms  "
+        f"{result['bytes_per_key']:8.1f} B/key  {result['writes_per_key']:5.2f} "
+        f"writes/key  {result.get('peak_alloc_kb') or 0:8d} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
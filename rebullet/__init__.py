@@ -1,16 +1,43 @@
 """__init__"""
 
-# trunk-ignore(flake8/F401)
-from .client import (
-    Bullet,
-    Check,
-    CheckDependencies,
-    Date,
-    Input,
-    Numbers,
-    Password,
-    ScrollBar,
-    SlidePrompt,
-    VerticalPrompt,
-    YesNo,
-)
+# Widgets are imported on first use, so `import rebullet` stays cheap for
+# scripts that only need one prompt (or none, e.g. `rebullet.colors`).
+_LAZY = {
+    "Bullet": "client",
+    "Check": "client",
+    "CheckDependencies": "client",
+    "Date": "client",
+    "Input": "client",
+    "Numbers": "client",
+    "Password": "client",
+    "ScrollBar": "client",
+    "ScrollCheck": "client",
+    "SlidePrompt": "client",
+    "VerticalPrompt": "client",
+    "YesNo": "client",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    module = _LAZY.get(name)
+    if module is None:
+        # Submodules (`rebullet.colors`, `rebullet.utils`...) were attributes
+        # back when the widgets were imported eagerly; load them on demand.
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -7,7 +7,7 @@ LINE_BEGIN_KEY = 1
 LINE_END_KEY = 5
 TAB_KEY = ord("\t")
 NEWLINE_KEY = 13  # Could be platform dependent. Advised to check
-ESC_KEY = 27
+ESC_KEY = 27  # Also the Escape key itself, pressed alone
 BACK_SPACE_KEY = 127
 ARROW_KEY_FLAG = 1 << 8
 ARROW_KEY_INT = 91
@@ -33,6 +33,32 @@ BEEP_CHAR = 7
 BACK_SPACE_CHAR = 8
 SPACE_CHAR = ord(" ")
 INTERRUPT_KEY = 3
+PASTE_KEY = 1 << 10  # Text delivered as one bracketed paste
+PRINTABLE_KEY = 1 << 12  # Any typed character without a handler of its own
+CHOICES_KEY = 1 << 13  # A live choice source has new items to merge
+RESIZE_KEY = 1 << 14  # The terminal was resized
+DELETE_WORD_KEY = 23  # Ctrl + W
+ALT_KEY_FLAG = 1 << 11
+WORD_LEFT_KEY = ord("b") + ALT_KEY_FLAG  # Alt + B
+WORD_RIGHT_KEY = ord("f") + ALT_KEY_FLAG  # Alt + F
+SELECT_ALL_KEY = LINE_BEGIN_KEY  # Ctrl + A
+DESELECT_ALL_KEY = 4  # Ctrl + D
+SELECT_RANGE_KEY = 18  # Ctrl + R
+INVERT_KEY = 20  # Ctrl + T
+# Function keys, F1_KEY to F12_KEY
+FUNCTION_KEY_FLAG = 1 << 15
+F1_KEY, F2_KEY, F3_KEY, F4_KEY, F5_KEY, F6_KEY = range(
+    1 + FUNCTION_KEY_FLAG, 7 + FUNCTION_KEY_FLAG
+)
+F7_KEY, F8_KEY, F9_KEY, F10_KEY, F11_KEY, F12_KEY = range(
+    7 + FUNCTION_KEY_FLAG, 13 + FUNCTION_KEY_FLAG
+)
+# Modifiers held with arrows, Home, End, Insert, Delete, PgUp, PgDn and
+# function keys, e.g. ARROW_LEFT_KEY + CTRL_KEY_FLAG is Ctrl + Left. Alt
+# reuses ALT_KEY_FLAG; several modifiers add up.
+SHIFT_KEY_FLAG = 1 << 16
+CTRL_KEY_FLAG = 1 << 17
+BACK_TAB_KEY = TAB_KEY + SHIFT_KEY_FLAG  # Shift + Tab
 
 if sys.platform == "win32":
     WIN_CH_BUFFER = []
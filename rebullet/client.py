@@ -1,15 +1,21 @@
 """Client imports."""
 
-import re
 from collections import defaultdict
-from datetime import date
-
-from dateutil import parser as date_parser
+from contextlib import contextmanager
 
 from . import charDef as char
-from . import colors, cursor, keyhandler, utils
-from .exceptions import MissingDependenciesError
-from .wrap_text import wrap_text
+from . import colors, cursor, keyhandler, keys, screen, terminal, utils
+from .depgraph import DependencyGraph
+from .gapbuffer import GapBuffer
+from .search import FuzzySearch, Results
+from .selection import Selection
+from .sources import LazyChoices, LiveChoices, choices_from
+from .width import str_width, truncate
+from .wrap_text import wrap_lines
+
+TYPE_CHECKING = False  # Avoids importing typing (and datetime) at startup
+if TYPE_CHECKING:
+    from datetime import date
 
 PROMPT_EMPTY_ERROR = "Prompt can not be empty!"
 CHOICES_EMPTY_ERROR = "Choices can not be empty!"
@@ -17,6 +23,109 @@ INDENT_ERROR = "Indent must be > 0!"
 MARGIN_ERROR = "Margin must be > 0!"
 
 
+def _window_top(top, pos, height):
+    """Return the first row of a `height` row window that shows `pos`.
+
+    The window moves as little as possible from its current `top`.
+    """
+    return max(min(top, pos), pos - height + 1)
+
+
+def _prompt_lines(prompt, indent):
+    """Return the lines `prompt` is drawn on, wrapped to the terminal width.
+
+    Long lines are wrapped at word boundaries, so the rows counted for the
+    layout are the rows the prompt really takes.
+    """
+    return list(wrap_lines(prompt, utils.COLUMNS - indent))
+
+
+def _rows_below(prompt, shift, indent=0, fullscreen=False):
+    """Return the terminal rows left under `prompt` for a scrolling window.
+
+    One row is kept for a query or counter line and, unless drawing full
+    screen, one for the cursor.
+    """
+    reserved = 1 if fullscreen else 2
+    return max(1, utils.ROWS - reserved - len(_prompt_lines(prompt, indent)) - shift)
+
+
+def _draw_prompt(ui):
+    """Write the prompt of list widget `ui` and start its screen under it.
+
+    A full-screen widget clears the screen and starts at its top row. Every
+    wrapped line of the prompt is indented.
+    Returns the number of rows written, `shift` included.
+    """
+    rows = 0
+    if ui.fullscreen:
+        utils.force_write("\033[H\033[2J")
+    if ui.prompt:
+        lines = _prompt_lines(ui.prompt, ui.indent)
+        margin = " " * ui.indent
+        utils.force_write(
+            "".join(
+                margin + ui.prompt_color + line + colors.RESET + "\n" for line in lines
+            )
+        )
+        utils.force_write("\n" * ui.shift)
+        rows = len(lines) + ui.shift
+    ui.screen = screen.Screen(rows + 1 if ui.fullscreen else None)
+    return rows
+
+
+def _redraw_prompt(ui):
+    """Erase list widget `ui` up to its prompt and write the prompt again.
+
+    Used to reflow after a resize: the prompt is wrapped again to the new
+    width and the rows under it start from an empty screen.
+    """
+    if not ui.fullscreen:
+        up = ui.screen.row + ui.prompt_rows
+        utils.force_write((f"\033[{up}A" if up else "") + "\r\033[J")
+    ui.prompt_rows = _draw_prompt(ui)
+
+
+def _text_columns(prefix, pad_right):
+    """Return the columns a choice may take after `prefix` columns of row.
+
+    The padding and one column for the scroll indicator are kept free, so
+    rows never wrap.
+    """
+    return max(1, utils.COLUMNS - prefix - pad_right - 1)
+
+
+def _counter(pos, total, done):
+    """Return the "selected/total" text shown under live choice lists.
+
+    An ellipsis follows while more choices may arrive (`done` is false).
+    """
+    text = f"{pos + 1 if total else 0}/{total}"
+    return text if done else text + " …"
+
+
+def _out_of_range(choices, message):
+    """Return the `ValueError` for a `default` that is not in `choices`."""
+    if isinstance(choices, LiveChoices):
+        message += " Live choices only hold what was delivered before launch."
+    return ValueError(message)
+
+
+@contextmanager
+def _live_updates(choices):
+    """Deliver `CHOICES_KEY` events for the block if `choices` is live.
+
+    Starts the source and merges whatever it delivered before launch.
+    """
+    if not isinstance(choices, LiveChoices):
+        yield
+        return
+    choices.start()
+    choices.merge()
+    with utils.watch(choices.fileno(), keys.Key(chr(char.CHOICES_KEY))):
+        yield
+
+
 # Reusable private utility class
 class myInput:
     """
@@ -26,6 +135,11 @@ class myInput:
         word_color (str): Foreground color for input text. Available: black, red, green, yellow, blue, magenta, cyan, white, default.
         password (bool): If True, input is masked (for passwords).
         hidden (str): Character to display for masked input.
+        hint (callable): Optional. Called with the text after every key;
+            returns `None` or a `(note, color)` pair shown after the text.
+        validate (callable): Optional. Called with the text on Enter; if it
+            returns False, the input is not accepted and editing goes on.
+        offset (int): Columns left of the input, so hints fit on the line.
     """
 
     def __init__(
@@ -33,108 +147,164 @@ class myInput:
         word_color: str = colors.foreground["default"],
         password: bool = False,
         hidden: str = "*",
+        hint=None,
+        validate=None,
+        offset: int = 0,
     ):
-        self.buffer = []  # Buffer to store entered characters
-        self.pos = 0  # Current cursor position
+        self.buffer = GapBuffer()  # Buffer to store entered characters
         self.password = password
         self.hidden = hidden
         self.word_color = word_color
+        self.hint = hint
+        self.validate = validate
+        self.offset = offset
+
+    @property
+    def pos(self):
+        """Current cursor position."""
+        return self.buffer.cursor
+
+    def columns(self, start, end):
+        """Return the columns the buffer text from `start` to `end` is shown in."""
+        if self.password:
+            return str_width(self.hidden) * (end - start)
+        return str_width("".join(self.buffer[i] for i in range(start, end)))
 
     def move_cursor(self, pos):
         """Move cursort to pos in buffer."""
         if pos < 0 or pos > len(self.buffer):
             return False
-        if self.pos <= pos:
-            while self.pos != pos:
-                if self.password:
-                    utils.cprint(self.hidden, color=self.word_color, end="")
-                else:
-                    utils.cprint(self.buffer[self.pos], color=self.word_color, end="")
-                self.pos += 1
-        else:
-            while self.pos != pos:
-                utils.force_write("\b")
-                self.pos -= 1
+        if pos < self.pos:
+            cols = self.columns(pos, self.pos)
+            if cols:
+                utils.move_cursor_left(cols)
+        elif pos > self.pos:
+            cols = self.columns(self.pos, pos)
+            if cols:
+                utils.move_cursor_right(cols)
+        self.buffer.move(pos)
         return True
 
     def insert_char(self, c):
         """Insert character c to buffer at current position."""
-        self.buffer.insert(self.pos, c)
-        if self.password:
-            utils.cprint(
-                self.hidden * (len(self.buffer) - self.pos),
-                color=self.word_color,
-                end="",
-            )
-        else:
-            utils.cprint(
-                "".join(self.buffer[self.pos :]), color=self.word_color, end=""
-            )
-        utils.force_write("\b" * (len(self.buffer) - self.pos - 1))
-        self.pos += 1
+        self.insert_text(c)
+
+    def insert_text(self, s):
+        """Insert string s to buffer at current position with one repaint."""
+        if not s:
+            return
+        shown = self.hidden * len(s) if self.password else s
+        if self.pos < len(self.buffer) and str_width(shown):
+            utils.insert_blanks(str_width(shown))
+        utils.cprint(shown, color=self.word_color, end="")
+        self.buffer.insert(s)
 
     def get_input(self):
         """Return content in buffer."""
-        ret = "".join(self.buffer)
-        self.buffer = []
-        self.pos = 0
+        ret = str(self.buffer)
+        self.buffer.clear()
         return ret
 
-    def delete_char(self):
-        """Remove character at current cursor position."""
-        if self.pos == len(self.buffer):
-            return
-        self.buffer.pop(self.pos)
-        if self.hidden:
-            utils.force_write(self.hidden * (len(self.buffer) - self.pos) + " ")
-        else:
-            utils.force_write("".join(self.buffer[self.pos :]) + " ")
-        utils.force_write("\b" * (len(self.buffer) - self.pos + 1))
+    def delete_char(self, n=1):
+        """Remove n characters starting at current cursor position."""
+        cols = self.columns(self.pos, min(self.pos + n, len(self.buffer)))
+        if self.buffer.delete(n) and cols:
+            utils.delete_chars(cols)
+
+    def delete_word(self):
+        """Remove the word left of the cursor."""
+        start = self.buffer.word_start(self.pos)
+        n = self.pos - start
+        if self.move_cursor(start):
+            self.delete_char(n)
+
+    def show_hint(self):
+        """Show the hint for the text after it, leaving the cursor in place."""
+        hint = self.hint(str(self.buffer))
+        utils.force_write("\0337")  # Save cursor
+        after = self.columns(self.pos, len(self.buffer))
+        if after:
+            utils.move_cursor_right(after)
+        utils.force_write("\033[K")
+        room = utils.COLUMNS - self.offset - self.columns(0, len(self.buffer)) - 3
+        if hint and room > 0:
+            note, color = hint
+            utils.cprint("  " + truncate(note, room), color=color, end="")
+        utils.force_write("\0338")  # Restore cursor
 
     def input(self):
-        while True:
-            c = utils.getchar()
-            i = c if c == char.UNDEFINED_KEY else ord(c)
-
-            match i:
-                case char.NEWLINE_KEY:
-                    utils.force_write("\n")
-                    return self.get_input()
-                case char.LINE_BEGIN_KEY:
-                    return
-                case char.HOME_KEY:
-                    return
-                case char.LINE_END_KEY:
-                    return
-                case char.END_KEY:
-                    return
-                case char.ARROW_UP_KEY:
-                    return
-                case char.ARROW_DOWN_KEY:
-                    return
-                case char.PG_UP_KEY:
-                    return
-                case char.PG_DOWN_KEY:
-                    return
-                case char.TAB_KEY:
-                    return
-                case char.UNDEFINED_KEY:
-                    return
-                case char.BACK_SPACE_KEY:
-                    if self.move_cursor(self.pos - 1):
-                        self.delete_char()
-                case char.BACK_SPACE_CHAR:
-                    if self.move_cursor(self.pos - 1):
-                        self.delete_char()
-                case char.DELETE_KEY:
-                    self.delete_char()
-                case char.ARROW_RIGHT_KEY:
-                    self.move_cursor(self.pos + 1)
-                case char.ARROW_LEFT_KEY:
-                    self.move_cursor(self.pos - 1)
-                case _:
-                    if self.password and c != " " or not self.password:
-                        self.insert_char(c)
+        return utils.run(self.steps())
+
+    async def input_async(self):
+        return await utils.run_async(self.steps())
+
+    def steps(self):
+        """Input loop that yields for every key and returns the text."""
+        with utils.paste_mode():
+            if self.hint:
+                with utils.frame():
+                    self.show_hint()
+            while True:
+                c = yield
+                i = char.PRINTABLE_KEY if keys.is_text(c) else keys.code(c)
+                with utils.frame():
+                    match i:
+                        case char.NEWLINE_KEY if self.validate and not self.validate(str(self.buffer)):
+                            pass  # The hint already tells what is wrong
+                        case char.NEWLINE_KEY:
+                            utils.force_write("\n")
+                            return self.get_input()
+                        case char.LINE_BEGIN_KEY:
+                            return
+                        case char.HOME_KEY:
+                            return
+                        case char.LINE_END_KEY:
+                            return
+                        case char.END_KEY:
+                            return
+                        case char.ARROW_UP_KEY:
+                            return
+                        case char.ARROW_DOWN_KEY:
+                            return
+                        case char.PG_UP_KEY:
+                            return
+                        case char.PG_DOWN_KEY:
+                            return
+                        case char.TAB_KEY:
+                            return
+                        case char.UNDEFINED_KEY:
+                            return
+                        case char.BACK_SPACE_KEY:
+                            if self.move_cursor(self.pos - 1):
+                                self.delete_char()
+                        case char.BACK_SPACE_CHAR:
+                            if self.move_cursor(self.pos - 1):
+                                self.delete_char()
+                        case char.DELETE_KEY:
+                            self.delete_char()
+                        case char.ARROW_RIGHT_KEY:
+                            self.move_cursor(self.pos + 1)
+                        case char.ARROW_LEFT_KEY:
+                            self.move_cursor(self.pos - 1)
+                        case char.WORD_LEFT_KEY:
+                            self.move_cursor(self.buffer.word_start(self.pos))
+                        case char.WORD_RIGHT_KEY:
+                            self.move_cursor(self.buffer.word_end(self.pos))
+                        case char.DELETE_WORD_KEY:
+                            self.delete_word()
+                        case char.INTERRUPT_KEY:
+                            utils.force_write("\n")
+                            raise KeyboardInterrupt
+                        case char.PASTE_KEY:
+                            text = utils.printable(c)
+                            if self.password:
+                                text = text.replace(" ", "")
+                            self.insert_text(text)
+                        case char.PRINTABLE_KEY:
+                            if self.password and c != " " or not self.password:
+                                self.insert_char(c)
+                    if self.hint:
+                        self.show_hint()
 
 
 @keyhandler.init
@@ -158,8 +328,20 @@ class Bullet:
         margin (int): Margin between bullet and text.
         shift (int): Lines to shift down after prompt.
         return_index (bool): If True, return (choice, index).
+        fullscreen (bool): If True, draw on the alternate screen with the
+            window of choices using the whole terminal height. The screen
+            is restored on exit.
+
+    `choices` may also be a live source (`sources.LiveChoices`, a
+    `queue.Queue` or an async iterable). The prompt is then interactive
+    right away and new choices are merged in as they arrive, with a
+    "selected/total" counter under the list.
     """
 
+    # Shown on the first and last rendered rows when choices scroll
+    up_indicator = "↑"
+    down_indicator = "↓"
+
     def __init__(
         self,
         prompt: str = "",
@@ -177,8 +359,11 @@ class Bullet:
         margin: int = 0,
         shift: int = 0,
         return_index: bool = False,
+        fullscreen: bool = False,
     ):
-        if not choices:
+        choices = choices_from(choices)
+        self.live = isinstance(choices, LiveChoices)
+        if not self.live and not choices:
             raise ValueError(CHOICES_EMPTY_ERROR)
         if indent < 0:
             raise ValueError(INDENT_ERROR)
@@ -203,87 +388,156 @@ class Bullet:
         self.background_on_switch = utils.resolve_color(background_on_switch, colors.background)
         self.pad_right = pad_right
 
-        self.max_width = len(max(self.choices, key=len)) + self.pad_right
+        self.max_width = 0  # Widest choice rendered so far, plus padding
+        self.height = 0  # Rows in the rendered window, set on launch
+        self.room = 0  # Rows the window may grow to, set on launch
+        self.prompt_rows = 0  # Rows the prompt was drawn on, set on launch
+        self.top = 0  # Position of the top-most item rendered
         self.return_index = return_index
+        self.fullscreen = fullscreen
+
+    def fit_window(self):
+        """Size the window of rendered choices to fit below the prompt.
+
+        Lists taller than the terminal only render a window of them, which
+        scrolls with the selection.
+        """
+        reserved = (not self.fullscreen) + self.live  # Cursor and counter lines
+        if self.prompt:
+            reserved += len(_prompt_lines(self.prompt, self.indent)) + self.shift
+        self.room = max(1, utils.ROWS - reserved)
+        self.height = min(self.room, self.choices.fill(self.room))
+        self.top = _window_top(0, self.pos, self.height)
+
+    def text_columns(self):
+        """Return the columns a choice may take without wrapping its row."""
+        return _text_columns(
+            self.indent + self.align + str_width(self.bullet) + self.margin,
+            self.pad_right,
+        )
 
     def render_bullets(self):
-        for i in range(len(self.choices)):
-            self.print_bullet(i)
-            utils.force_write("\n")
+        """Redraw the window of choices starting at `self.top`."""
+        visible = self.choices[self.top : self.top + self.height]
+        widest = min(max(map(str_width, visible), default=0), self.text_columns())
+        self.max_width = max(self.max_width, widest + self.pad_right)
+        for row in range(self.height):
+            self.print_bullet(self.top + row)
+        self.render_footer()
+        self.screen.refresh()
+
+    def render_footer(self):
+        """Schedule the counter under a live list to be redrawn."""
+        if self.live:
+            self.screen.update(
+                self.height,
+                screen.cells(" " * (self.indent + self.align))
+                + screen.cells(
+                    _counter(self.pos, len(self.choices), self.choices.exhausted)
+                ),
+            )
+
+    def indicator(self, idx):
+        """Return the scroll indicator shown after choice `idx`."""
+        if not self.choices.has(self.height):
+            return ""  # Every choice fits, no scrolling
+        if idx == self.top and self.top != 0:
+            return self.up_indicator
+        if idx == self.top + self.height - 1 and self.choices.has(idx + 1):
+            return self.down_indicator
+        return " "
 
     def print_bullet(self, idx):
-        utils.force_write(" " * (self.indent + self.align))
+        """Schedule choice `idx` to be redrawn on the next screen refresh."""
         back_color = (
             self.background_on_switch if idx == self.pos else self.background_color
         )
         word_color = self.word_on_switch if idx == self.pos else self.word_color
         if idx == self.pos:
-            utils.cprint(
-                f"{self.bullet}" + " " * self.margin,
-                self.bullet_color,
-                back_color,
-                end="",
-            )
+            bullet = f"{self.bullet}" + " " * self.margin
         else:
-            utils.cprint(
-                " " * (len(self.bullet) + self.margin),
-                self.bullet_color,
-                back_color,
-                end="",
+            bullet = " " * (str_width(self.bullet) + self.margin)
+        text = truncate(self.choices[idx], self.text_columns())
+        self.screen.update(
+            idx - self.top,
+            screen.cells(" " * (self.indent + self.align))
+            + screen.cells(bullet, back_color + self.bullet_color)
+            + screen.cells(text, back_color + word_color)
+            + screen.cells(
+                " " * (self.max_width - str_width(text)),
+                back_color + colors.foreground["default"],
             )
-        utils.cprint(self.choices[idx], word_color, back_color, end="")
-        utils.cprint(
-            " " * (self.max_width - len(self.choices[idx])), on=back_color, end=""
+            + screen.cells(self.indicator(idx)),
         )
-        utils.move_cursor_head()
+
+    def move_to(self, pos):
+        """Move the selection to `pos`, redrawing only the affected rows."""
+        old_pos = self.pos
+        self.pos = pos
+        top = _window_top(self.top, pos, self.height)
+        if top != self.top:
+            self.top = top
+            self.render_bullets()
+            return
+        self.print_bullet(old_pos)
+        self.print_bullet(self.pos)
+        self.render_footer()
+        self.screen.refresh()
 
     @keyhandler.register(char.ARROW_UP_KEY)
     def move_up(self):
+        steps = 1 + utils.fold_repeats(self.key)
         if self.pos < 1:
             return
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos -= 1
-        self.print_bullet(old_pos)
-        utils.move_cursor_up(1)
-        self.print_bullet(self.pos)
+        self.move_to(max(0, self.pos - steps))
 
     @keyhandler.register(char.ARROW_DOWN_KEY)
     def move_down(self):
-        if self.pos + 1 >= len(self.choices):
+        steps = 1 + utils.fold_repeats(self.key)
+        last = self.choices.fill(self.pos + steps + 1) - 1
+        if self.pos >= last:
             return
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos += 1
-        self.print_bullet(old_pos)
-        utils.move_cursor_down(1)
-        self.print_bullet(self.pos)
+        self.move_to(min(last, self.pos + steps))
 
     @keyhandler.register(char.HOME_KEY)
     def move_top(self):
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos = 0
-        self.print_bullet(old_pos)
-        while old_pos > 0:
-            utils.move_cursor_up(1)
-            old_pos -= 1
-        self.print_bullet(self.pos)
+        self.move_to(0)
 
     @keyhandler.register(char.END_KEY)
     def move_bottom(self):
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos = len(self.choices) - 1
-        self.print_bullet(old_pos)
-        while old_pos < len(self.choices) - 1:
-            utils.move_cursor_down(1)
-            old_pos += 1
-        self.print_bullet(self.pos)
+        if self.choices:
+            self.move_to(len(self.choices) - 1)
+
+    @keyhandler.register(char.CHOICES_KEY)
+    def add_choices(self):
+        """Merge the choices a live source delivered since the last merge.
+
+        The selection stays where it is. The window is only redrawn if it
+        reached the end of the list, as that is the only case where new
+        choices (or the scroll indicators) become visible.
+        """
+        at_end = self.top + self.height >= len(self.choices)
+        if self.choices.merge() and at_end:
+            self.height = min(self.room, len(self.choices))
+            self.top = _window_top(self.top, self.pos, self.height)
+            self.render_bullets()
+            return
+        self.render_footer()
+        self.screen.refresh()
+
+    @keyhandler.register(char.RESIZE_KEY)
+    def resize(self):
+        """Reflow the prompt and the window for the new terminal size."""
+        _redraw_prompt(self)
+        self.max_width = 0
+        self.fit_window()
+        self.render_bullets()
 
     @keyhandler.register(char.NEWLINE_KEY)
     def accept(self):
-        utils.move_cursor_down(len(self.choices) - self.pos)
+        if not self.choices.has(self.pos):
+            return  # A live source has not delivered anything yet
+        self.screen.move_to(self.height + self.live)
         ret = self.choices[self.pos]
         if self.return_index:
             return ret, self.pos
@@ -292,32 +546,40 @@ class Bullet:
 
     @keyhandler.register(char.INTERRUPT_KEY)
     def interrupt(self):
-        utils.move_cursor_down(len(self.choices) - self.pos)
+        self.screen.move_to(self.height + self.live)
         raise KeyboardInterrupt
 
     def launch(self, default=None):
-        if self.prompt:
-            utils.force_write(
-                " " * self.indent
-                + self.prompt_color
-                + self.prompt
-                + colors.RESET
-                + "\n"
-            )
-            utils.force_write("\n" * self.shift)
-        if default is not None:
-            if type(default).__name__ != "int":
-                raise TypeError("'default' should be an integer value!")
-            if not 0 <= int(default) < len(self.choices):
-                raise ValueError("'default' should be in range [0, len(choices))!")
-            self.pos = default
-        self.render_bullets()
-        utils.move_cursor_up(len(self.choices) - self.pos)
-        with cursor.hide():
-            while True:
-                ret = self.handle_input()
-                if ret is not None:
-                    return ret
+        return utils.run(self._run(default))
+
+    async def launch_async(self, default=None):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run(default))
+
+    def _run(self, default=None):
+        if default is not None and type(default).__name__ != "int":
+            raise TypeError("'default' should be an integer value!")
+        with (
+            terminal.session(),
+            _live_updates(self.choices),
+            utils.alternate_screen(self.fullscreen),
+        ):
+            if default is not None:
+                # Checked once a live source merged what it delivered so far.
+                if not self.choices.has(int(default)):
+                    raise _out_of_range(
+                        self.choices, "'default' should be in range [0, len(choices))!"
+                    )
+                self.pos = default
+            with utils.frame():
+                self.prompt_rows = _draw_prompt(self)
+                self.fit_window()
+                self.render_bullets()
+            with cursor.hide():
+                while True:
+                    ret = self.handle_key((yield))
+                    if ret is not None:
+                        return ret
 
 
 @keyhandler.init
@@ -342,8 +604,15 @@ class Check:
         margin (int): Margin between check and text.
         shift (int): Lines to shift down after prompt.
         return_index (bool): If True, return (choices, indices).
+        fullscreen (bool): If True, draw on the alternate screen with the
+            window of choices using the whole terminal height. The screen
+            is restored on exit.
     """
 
+    # Shown on the first and last rendered rows when choices scroll
+    up_indicator = "↑"
+    down_indicator = "↓"
+
     def __init__(
         self,
         prompt: str = "",
@@ -362,7 +631,9 @@ class Check:
         margin: int = 0,
         shift: int = 0,
         return_index: bool = False,
+        fullscreen: bool = False,
     ):
+        choices = LazyChoices(choices if choices is not None else ())
         if not choices:
             raise ValueError(CHOICES_EMPTY_ERROR)
         if indent < 0:
@@ -373,7 +644,7 @@ class Check:
         self.prompt = prompt
         self.prompt_color = utils.resolve_color(prompt_color, colors.foreground)
         self.choices = choices
-        self.checked = [False] * len(self.choices)
+        self.checked = Selection(self.choices.loaded)
         self.pos = 0
 
         self.indent = indent
@@ -391,114 +662,149 @@ class Check:
         self.background_on_switch = utils.resolve_color(background_on_switch, colors.background)
         self.pad_right = pad_right
 
-        self.max_width = len(max(self.choices, key=len)) + self.pad_right
+        self.max_width = 0  # Widest choice rendered so far, plus padding
+        self.height = 0  # Rows in the rendered window, set on launch
+        self.prompt_rows = 0  # Rows the prompt was drawn on, set on launch
+        self.top = 0  # Position of the top-most item rendered
         self.return_index = return_index
+        self.fullscreen = fullscreen
+
+    def fit_window(self):
+        """Size the window of rendered choices to fit below the prompt.
+
+        Lists taller than the terminal only render a window of them, which
+        scrolls with the cursor row.
+        """
+        reserved = not self.fullscreen  # Line the cursor rests on after the choices
+        if self.prompt:
+            reserved += len(_prompt_lines(self.prompt, self.indent)) + self.shift
+        rows = max(1, utils.ROWS - reserved)
+        self.height = min(rows, self.choices.fill(rows))
+        self.top = _window_top(0, self.pos, self.height)
+
+    def text_columns(self):
+        """Return the columns a choice may take without wrapping its row."""
+        return _text_columns(
+            self.indent + self.align + str_width(self.check) + self.margin,
+            self.pad_right,
+        )
 
     def render_rows(self):
-        for i in range(len(self.choices)):
-            self.print_row(i)
-            utils.force_write("\n")
+        """Redraw the window of choices starting at `self.top`."""
+        visible = self.choices[self.top : self.top + self.height]
+        widest = min(max(map(str_width, visible)), self.text_columns())
+        self.max_width = max(self.max_width, widest + self.pad_right)
+        self.checked.grow(self.choices.loaded)
+        for row in range(self.height):
+            self.print_row(self.top + row)
+        self.screen.refresh()
+
+    def indicator(self, idx):
+        """Return the scroll indicator shown after choice `idx`."""
+        if not self.choices.has(self.height):
+            return ""  # Every choice fits, no scrolling
+        if idx == self.top and self.top != 0:
+            return self.up_indicator
+        if idx == self.top + self.height - 1 and self.choices.has(idx + 1):
+            return self.down_indicator
+        return " "
 
     def print_row(self, idx):
-        utils.force_write(" " * (self.indent + self.align))
+        """Schedule choice `idx` to be redrawn on the next screen refresh."""
         back_color = (
             self.background_on_switch if idx == self.pos else self.background_color
         )
         word_color = self.word_on_switch if idx == self.pos else self.word_color
         check_color = self.check_on_switch if idx == self.pos else self.check_color
         if self.checked[idx]:
-            utils.cprint(
-                f"{self.check_value}" + " " * self.margin,
-                check_color,
-                back_color,
-                end="",
-            )
+            check = f"{self.check}" + " " * self.margin
         else:
-            utils.cprint(
-                " " * (len(self.check_value) + self.margin),
-                check_color,
-                back_color,
-                end="",
+            check = " " * (str_width(self.check) + self.margin)
+        text = truncate(self.choices[idx], self.text_columns())
+        self.screen.update(
+            idx - self.top,
+            screen.cells(" " * (self.indent + self.align))
+            + screen.cells(check, back_color + check_color)
+            + screen.cells(text, back_color + word_color)
+            + screen.cells(
+                " " * (self.max_width - str_width(text)),
+                back_color + colors.foreground["default"],
             )
-        utils.cprint(self.choices[idx], word_color, back_color, end="")
-        utils.cprint(
-            " " * (self.max_width - len(self.choices[idx])), on=back_color, end=""
+            + screen.cells(self.indicator(idx)),
         )
-        utils.move_cursor_head()
+
+    def move_to(self, pos):
+        """Move the cursor row to `pos`, redrawing only the affected rows."""
+        old_pos = self.pos
+        self.pos = pos
+        top = _window_top(self.top, pos, self.height)
+        if top != self.top:
+            self.top = top
+            self.render_rows()
+            return
+        self.print_row(old_pos)
+        self.print_row(self.pos)
+        self.screen.refresh()
 
     @keyhandler.register(char.SPACE_CHAR)
     def toggle_row(self):
         self.checked[self.pos] = not self.checked[self.pos]
         self.print_row(self.pos)
+        self.screen.refresh()
 
     @keyhandler.register(char.ARROW_UP_KEY)
     def move_up(self):
+        steps = 1 + utils.fold_repeats(self.key)
         if self.pos < 1:
             return
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos -= 1
-        self.print_row(old_pos)
-        utils.move_cursor_up(1)
-        self.print_row(self.pos)
+        self.move_to(max(0, self.pos - steps))
 
     @keyhandler.register(char.ARROW_DOWN_KEY)
     def move_down(self):
-        if self.pos + 1 >= len(self.choices):
+        steps = 1 + utils.fold_repeats(self.key)
+        last = self.choices.fill(self.pos + steps + 1) - 1
+        if self.pos >= last:
             return
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos += 1
-        self.print_row(old_pos)
-        utils.move_cursor_down(1)
-        self.print_row(self.pos)
+        self.move_to(min(last, self.pos + steps))
 
     @keyhandler.register(char.HOME_KEY)
     def move_top(self):
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos = 0
-        self.print_row(old_pos)
-        while old_pos > 0:
-            utils.move_cursor_up(1)
-            old_pos -= 1
-        self.print_row(self.pos)
+        self.move_to(0)
 
     @keyhandler.register(char.END_KEY)
     def move_bottom(self):
-        utils.clear_line()
-        old_pos = self.pos
-        self.pos = len(self.choices) - 1
-        self.print_row(old_pos)
-        while old_pos < len(self.choices) - 1:
-            utils.move_cursor_down(1)
-            old_pos += 1
-        self.print_row(self.pos)
+        self.move_to(len(self.choices) - 1)
+
+    @keyhandler.register(char.RESIZE_KEY)
+    def resize(self):
+        """Reflow the prompt and the window for the new terminal size."""
+        _redraw_prompt(self)
+        self.max_width = 0
+        self.fit_window()
+        self.render_rows()
 
     @keyhandler.register(char.NEWLINE_KEY)
     def accept(self):
-        utils.move_cursor_down(len(self.choices) - self.pos)
-        ret = [self.choices[i] for i in range(len(self.choices)) if self.checked[i]]
-        ret_idx = [i for i in range(len(self.choices)) if self.checked[i]]
+        self.screen.move_to(self.height)
+        ret_idx = list(self.checked.indices())
+        ret = [self.choices[i] for i in ret_idx]
         self.pos = 0
-        self.checked = [False] * len(self.choices)
+        self.checked = Selection(self.choices.loaded)
         return (ret, ret_idx) if self.return_index else ret
 
     @keyhandler.register(char.INTERRUPT_KEY)
     def interrupt(self):
-        utils.move_cursor_down(len(self.choices) - self.pos)
+        self.screen.move_to(self.height)
         raise KeyboardInterrupt
 
     def launch(self, default=None):
-        if self.prompt:
-            utils.force_write(
-                " " * self.indent
-                + self.prompt_color
-                + self.prompt
-                + colors.RESET
-                + "\n"
-            )
-            utils.force_write("\n" * self.shift)
+        return utils.run(self._run(default))
+
+    async def launch_async(self, default=None):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run(default))
+
+    def _run(self, default=None):
         if default is None:
             default = []
         if default:
@@ -506,19 +812,22 @@ class Check:
                 raise TypeError("`default` should be a list of integers!")
             if any(type(i).__name__ != "int" for i in default):
                 raise TypeError("Indices in `default` should be integer type!")
-            if not all(0 <= i < len(self.choices) for i in default):
+            if not all(self.choices.has(i) for i in default):
                 raise ValueError(
                     "All indices in `default` should be in range [0, len(choices))!"
                 )
             for i in default:
                 self.checked[i] = True
-        self.render_rows()
-        utils.move_cursor_up(len(self.choices))
-        with cursor.hide():
-            while True:
-                ret = self.handle_input()
-                if ret is not None:
-                    return ret
+        with terminal.session(), utils.alternate_screen(self.fullscreen):
+            with utils.frame():
+                self.prompt_rows = _draw_prompt(self)
+                self.fit_window()
+                self.render_rows()
+            with cursor.hide():
+                while True:
+                    ret = self.handle_key((yield))
+                    if ret is not None:
+                        return ret
 
 
 class CheckDependencies(Check):
@@ -529,6 +838,11 @@ class CheckDependencies(Check):
         prompt (str): Prompt text.
         dep_tree (tuple): Tuple of (choice, dependencies) pairs.
         All color arguments as in Check.
+
+    Raises:
+        MissingDependenciesError: A dependency is not one of the choices.
+        CyclicDependenciesError: A choice depends on itself, directly or
+            through other choices.
     """
 
     def __init__(self, prompt="", dep_tree=(), *args, **kwargs):
@@ -536,72 +850,87 @@ class CheckDependencies(Check):
         """
         dep_tree expected format:
         (
-            ("choice A", ("choice C", "Choice D")),
-            ("choice B", ("choice A", "Choice E")),
+            ("choice A", ("choice C", "choice D")),
+            ("choice B", ("choice A", "choice E")),
             ("choice C", ()),
             ("choice D", ("choice C",)),
-            ("choice E", ("choice B",)),
+            ("choice E", ()),
         #    ^choices^    ^dependencies list^
         )
         """
-        self.validateDependencies(dep_tree)
-        self.dependencies = dict(dep_tree)
-        self.dependants = defaultdict(set)
-        for k, deps in dep_tree:
-            for d in deps:
-                self.dependants[d].add(k)
+        self.graph = self.validateDependencies(dep_tree)
         choices = [c[0] for c in dep_tree]
         # trunk-ignore(ruff/B026)
         super().__init__(prompt=prompt, choices=choices, *args, **kwargs)
 
     def validateDependencies(self, dep_tree):
-        missing_dependencies = []
-        items = [item for item, dependencies in dep_tree]
-        for item, dependencies in dep_tree:
-            for dep in dependencies:
-                if dep not in items:
-                    missing_dependencies.append((item, dep))
-        if missing_dependencies:
-            raise MissingDependenciesError(missing_dependencies)
+        """Check `dep_tree` and return its `DependencyGraph`."""
+        return DependencyGraph(dep_tree)
+
+    @property
+    def dependencies(self):
+        """Dict of every choice to the choices it directly depends on."""
+        graph = self.graph
+        return {
+            choice: tuple(graph.choices[dep] for dep in deps)
+            for choice, deps in zip(graph.choices, graph.dependencies)
+        }
+
+    @property
+    def dependants(self):
+        """Dict of every choice to the set of choices directly depending on it."""
+        graph = self.graph
+        found = defaultdict(set)
+        for choice, deps in zip(graph.choices, graph.dependants):
+            if deps:
+                found[choice] = {graph.choices[dep] for dep in deps}
+        return found
 
     @keyhandler.register(char.SPACE_CHAR)
-    def toggleRow(self):
-        super().toggleRow()
+    def toggle_row(self):
+        self.checked[self.pos] = not self.checked[self.pos]
         if self.checked[self.pos]:
-            self.checkDependencies(self.choices[self.pos])
+            changed = self.checkDependencies(self.choices[self.pos])
         else:
-            self.uncheckDependants(self.choices[self.pos])
-        self.refresh()
-
-    def checkDependencies(self, choice, checks=None):
-        checks = checks or [choice]
-        deps = self.dependencies[choice]
-        for dep in deps:
-            if self.checked[self.choices.index(dep)] not in checks:
-                self.checked[self.choices.index(dep)] = True
-                checks.append(self.checked[self.choices.index(dep)])
-                self.checkDependencies(dep, checks)
-
-    def uncheckDependants(self, choice, unchecks=None):
-        unchecks = unchecks or [choice]
-        deps = self.dependants[choice]
-        for dep in deps:
-            if self.checked[self.choices.index(dep)] not in unchecks:
-                self.checked[self.choices.index(dep)] = False
-                unchecks.append(self.checked[self.choices.index(dep)])
-                self.uncheckDependants(dep, unchecks)
+            changed = self.uncheckDependants(self.choices[self.pos])
+        changed.append(self.pos)
+        for idx in changed:
+            if self.top <= idx < self.top + self.height:
+                self.print_row(idx)
+        self.screen.refresh()
+
+    def checkDependencies(self, choice):
+        """Check every choice `choice` depends on, directly or not.
+
+        Returns:
+            list: Indices of the choices that were not checked before.
+        """
+        changed = [
+            idx
+            for idx in self.graph.requires(self.graph.index[choice])
+            if not self.checked[idx]
+        ]
+        for idx in changed:
+            self.checked[idx] = True
+        return changed
+
+    def uncheckDependants(self, choice):
+        """Uncheck every choice that depends on `choice`, directly or not.
+
+        Returns:
+            list: Indices of the choices that were checked before.
+        """
+        changed = [
+            idx
+            for idx in self.graph.required_by(self.graph.index[choice])
+            if self.checked[idx]
+        ]
+        for idx in changed:
+            self.checked[idx] = False
+        return changed
 
     def refresh(self):
-        if self.pos != 0:
-            utils.move_cursor_up(self.pos)
-        utils.clear_line()
-        self.print_row(0)
-        for pos in range(1, len(self.choices)):
-            utils.move_cursor_down(0)
-            utils.clear_line()
-            self.print_row(pos)
-        if self.pos != len(self.choices) - 1:
-            utils.move_cursor_up(len(self.choices) - self.pos - 1)
+        self.render_rows()
 
 
 class YesNo:
@@ -642,35 +971,44 @@ class YesNo:
         ans = ans.lower()
         if "yes".startswith(ans) or "no".startswith(ans):
             return True
-        utils.move_cursor_up(self.prompt.count("\n") + 1)
-        utils.force_write(
-            " " * self.indent
-            + self.prompt_color
-            + self.prompt
-            + self.default
-            + colors.RESET
-        )
-        utils.force_write(" " * len(ans))
-        utils.force_write("\b" * len(ans))
+        with utils.frame():
+            utils.move_cursor_up(self.prompt.count("\n") + 1)
+            utils.force_write(
+                " " * self.indent
+                + self.prompt_color
+                + self.prompt
+                + self.default
+                + colors.RESET
+            )
+            utils.force_write(" " * str_width(ans))
+            utils.force_write("\b" * str_width(ans))
         return False
 
     def launch(self):
-        my_input = MyInput(word_color=self.word_color)
-        utils.force_write(
-            " " * self.indent
-            + self.prompt_color
-            + self.prompt
-            + self.default
-            + colors.RESET
-        )
-        while True:
-            ans = my_input.input()
-            if ans == "":
-                return self.default.strip("[]: ") == "y"
-            if not self.valid(ans):
-                continue
-            else:
-                return "yes".startswith(ans.lower())
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def _run(self):
+        with terminal.session():
+            my_input = myInput(word_color=self.word_color)
+            utils.force_write(
+                " " * self.indent
+                + self.prompt_color
+                + self.prompt
+                + self.default
+                + colors.RESET
+            )
+            while True:
+                ans = yield from my_input.steps()
+                if ans == "":
+                    return self.default.strip("[]: ") == "y"
+                if not self.valid(ans):
+                    continue
+                else:
+                    return "yes".startswith(ans.lower())
 
 
 class Input:
@@ -708,46 +1046,58 @@ class Input:
         self.pattern = pattern
 
     def valid(self, ans):
+        import re
+
         if not bool(re.match(self.pattern, ans)):
-            utils.move_cursor_up(1)
-            utils.force_write(" " * self.indent + self.prompt + self.default)
-            utils.force_write(" " * len(ans))
-            utils.force_write("\b" * len(ans))
+            with utils.frame():
+                utils.move_cursor_up(1)
+                utils.force_write(" " * self.indent + self.prompt + self.default)
+                utils.force_write(" " * str_width(ans))
+                utils.force_write("\b" * str_width(ans))
             return False
         return True
 
     def launch(self):
-        utils.force_write(
-            " " * self.indent
-            + self.prompt_color
-            + self.prompt
-            + self.default
-            + colors.RESET
-        )
-        sess = MyInput(word_color=self.word_color)
-        if not self.pattern:
-            while True:
-                result = sess.input()
-                if result != "":
-                    break
-                if self.default != "":
-                    return self.default[1:-1]
-                utils.move_cursor_up(1)
-                utils.force_write(
-                    " " * self.indent
-                    + self.prompt_color
-                    + self.prompt
-                    + self.default
-                    + colors.RESET
-                )
-                utils.force_write(" " * len(result))
-                utils.force_write("\b" * len(result))
-        else:
-            while True:
-                result = sess.input()
-                if self.valid(result):
-                    break
-        return result.strip() if self.strip else result
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def _run(self):
+        with terminal.session():
+            utils.force_write(
+                " " * self.indent
+                + self.prompt_color
+                + self.prompt
+                + self.default
+                + colors.RESET
+            )
+            sess = myInput(word_color=self.word_color)
+            if not self.pattern:
+                while True:
+                    result = yield from sess.steps()
+                    if result != "":
+                        break
+                    if self.default != "":
+                        return self.default[1:-1]
+                    with utils.frame():
+                        utils.move_cursor_up(1)
+                        utils.force_write(
+                            " " * self.indent
+                            + self.prompt_color
+                            + self.prompt
+                            + self.default
+                            + colors.RESET
+                        )
+                        utils.force_write(" " * str_width(result))
+                        utils.force_write("\b" * str_width(result))
+            else:
+                while True:
+                    result = yield from sess.steps()
+                    if self.valid(result):
+                        break
+            return result.strip() if self.strip else result
 
 
 class Password:
@@ -779,12 +1129,22 @@ class Password:
         self.word_color = utils.resolve_color(word_color, colors.foreground)
 
     def launch(self):
-        utils.force_write(
-            " " * self.indent + self.prompt_color + self.prompt + colors.RESET
-        )
-        return MyInput(
-            password=True, hidden=self.hidden, word_color=self.word_color
-        ).input()
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def _run(self):
+        with terminal.session():
+            utils.force_write(
+                " " * self.indent + self.prompt_color + self.prompt + colors.RESET
+            )
+            return (
+                yield from myInput(
+                    password=True, hidden=self.hidden, word_color=self.word_color
+                ).steps()
+            )
 
 
 class Numbers:
@@ -820,32 +1180,41 @@ class Numbers:
             self.type(ans)
             return True
         except Exception:
-            utils.move_cursor_up(1)
-            utils.force_write(
-                " " * self.indent + self.prompt_color + self.prompt + colors.RESET
-            )
-            utils.force_write(" " * len(ans))
-            utils.force_write("\b" * len(ans))
+            with utils.frame():
+                utils.move_cursor_up(1)
+                utils.force_write(
+                    " " * self.indent + self.prompt_color + self.prompt + colors.RESET
+                )
+                utils.force_write(" " * str_width(ans))
+                utils.force_write("\b" * str_width(ans))
             return False
 
     def launch(self, default=None):
+        return utils.run(self._run(default))
+
+    async def launch_async(self, default=None):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run(default))
+
+    def _run(self, default=None):
         if default is not None:
             try:
                 self.type(default)
             except Exception:
                 raise ValueError(f"`default` should be a {str(self.type)}") from None
-        my_input = MyInput(word_color=self.word_color)
-        utils.force_write(
-            " " * self.indent + self.prompt_color + self.prompt + colors.RESET
-        )
-        while True:
-            ans = my_input.input()
-            if ans == "" and default is not None:
-                return default
-            if not self.valid(ans):
-                continue
-            else:
-                return self.type(ans)
+        with terminal.session():
+            my_input = myInput(word_color=self.word_color)
+            utils.force_write(
+                " " * self.indent + self.prompt_color + self.prompt + colors.RESET
+            )
+            while True:
+                ans = yield from my_input.steps()
+                if ans == "" and default is not None:
+                    return default
+                if not self.valid(ans):
+                    continue
+                else:
+                    return self.type(ans)
 
 
 class VerticalPrompt:
@@ -872,9 +1241,7 @@ class VerticalPrompt:
         self.spacing = spacing
         self.separator = separator
         self.separator_color = utils.resolve_color(separator_color, colors.foreground)
-        self.separator_len = len(
-            max(self.components, key=lambda ui: len(ui.prompt)).prompt
-        )
+        self.separator_len = max(str_width(ui.prompt) for ui in self.components)
         self.result = []
 
     def summarize(self):
@@ -882,16 +1249,24 @@ class VerticalPrompt:
             print(prompt, answer)
 
     def launch(self):
-        self.result = []
-        for ui in self.components:
-            self.result.append((ui.prompt, ui.launch()))
-            if not self.separator:
-                utils.force_write("\n" * self.spacing)
-            else:
-                utils.cprint(
-                    self.separator * self.separator_len, color=self.separator_color
-                )
-        return self.result
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def _run(self):
+        with terminal.session():
+            self.result = []
+            for ui in self.components:
+                self.result.append((ui.prompt, (yield from ui._run())))
+                if not self.separator:
+                    utils.force_write("\n" * self.spacing)
+                else:
+                    utils.cprint(
+                        self.separator * self.separator_len, color=self.separator_color
+                    )
+            return self.result
 
 
 @keyhandler.init
@@ -917,8 +1292,17 @@ class ScrollBar:
         align (int): Additional alignment spaces.
         margin (int): Margin between pointer and text.
         shift (int): Lines to shift down after prompt.
-        height (int): Number of visible rows.
+        height (int): Number of visible rows. Defaults to what fits in
+            the terminal.
         return_index (bool): If True, return (choice, index).
+        search (bool): If True, typing filters the choices with a fuzzy
+            search. Backspace removes the last character of the query.
+        fullscreen (bool): If True, draw on the alternate screen with the
+            window using the whole terminal height, whatever `height` is.
+            The screen is restored on exit.
+
+    Like `Bullet`, accepts live sources as `choices`. Without an explicit
+    `height` the window then grows up to the height of the terminal.
     """
 
     def __init__(
@@ -942,8 +1326,12 @@ class ScrollBar:
         shift: int = 0,
         height=None,
         return_index: bool = False,
+        search: bool = False,
+        fullscreen: bool = False,
     ):
-        if not choices:
+        choices = choices_from(choices)
+        self.live = isinstance(choices, LiveChoices)
+        if not self.live and not choices:
             raise ValueError(CHOICES_EMPTY_ERROR)
         if indent < 0:
             raise ValueError(INDENT_ERROR)
@@ -971,11 +1359,11 @@ class ScrollBar:
         self.background_color = utils.resolve_color(background_color, colors.background)
         self.background_on_switch = utils.resolve_color(background_on_switch, colors.background)
 
-        self.max_width = len(max(self.choices, key=len)) + self.pad_right
-        self.height = min(
-            len(self.choices),  # Size of the scrollbar window.
-            height or len(self.choices),
-        )
+        self.max_width = 0  # Widest choice rendered so far, plus padding
+        # Rows the window may grow to; None follows the terminal height.
+        self.max_height = None if height is None else max(1, height)
+        self.height = 0  # Size of the window, set by fit_window()
+        self.prompt_rows = 0  # Rows the prompt was drawn on, set on launch
 
         self.top = 0  # Position of the top-most item rendered.
         # scrollbar won't move if pos is in range [top, top + height)
@@ -984,177 +1372,431 @@ class ScrollBar:
 
         self.return_index = return_index
 
+        self.search = search
+        self.footer = search or self.live  # Query and counter line
+        self.finder = None  # search.FuzzySearch, built on the first query
+        self.shown = self.choices  # Choices matching the query, as shown
+        self.fullscreen = fullscreen
+        self.fit_window()
+
+    def text_columns(self):
+        """Return the columns a choice may take without wrapping its row."""
+        return _text_columns(
+            self.indent + self.align + str_width(self.pointer) + self.margin,
+            self.pad_right,
+        )
+
     def render_rows(self):
-        self.print_row(self.top, indicator=self.up_indicator if self.top != 0 else " ")
-        utils.force_write("\n")
-
-        i = self.top
-        for i in range(self.top + 1, self.top + self.height - 1):
-            self.print_row(i)
-            utils.force_write("\n")
-
-        if i < len(self.choices) - 1:
-            self.print_row(
-                i + 1,
-                indicator=self.down_indicator
-                if self.top + self.height != len(self.choices)
-                else "",
-            )
-            utils.force_write("\n")
+        """Redraw the window of choices starting at `self.top`."""
+        visible = self.shown[self.top : self.top + self.height]
+        widest = min(max(map(str_width, visible), default=0), self.text_columns())
+        self.max_width = max(self.max_width, widest + self.pad_right)
+        for row in range(self.height):
+            if row == 0:
+                indicator = self.up_indicator if self.top != 0 else " "
+            elif row == self.height - 1 and self.shown.has(self.top + self.height):
+                indicator = self.down_indicator
+            else:
+                indicator = ""
+            self.print_row(self.top + row, indicator=indicator)
+        self.render_footer()
+        self.screen.refresh()
+
+    def render_footer(self):
+        """Schedule the query and counter line under the list to be redrawn."""
+        if self.footer:
+            self.screen.update(self.height, self.footer_cells())
+
+    def footer_cells(self):
+        """Return the cells of the line under the list."""
+        row = screen.cells(" " * (self.indent + self.align))
+        if self.search:
+            row += screen.cells("> ", self.prompt_color)
+            row += screen.cells(self.finder.query if self.finder else "")
+        if self.live:
+            counter = _counter(self.pos, len(self.shown), self.choices.exhausted)
+            row += screen.cells(("  " if self.search else "") + counter)
+        return row
+
+    def original(self, idx):
+        """Return the index in `choices` of the choice shown at `idx`."""
+        return idx if self.shown is self.choices else self.shown.order[idx]
+
+    def choice_cells(self, idx, text, style):
+        """Return the cells of `text`, shown for choice `idx`, in bold where
+        it matches the search query."""
+        if self.finder is None or not self.finder.query:
+            return screen.cells(text, style)
+        matched = set(self.finder.positions(self.original(idx)))
+        row = []
+        start = 0
+        for end in range(1, len(text) + 1):
+            if end == len(text) or (end in matched) != (start in matched):
+                bold = colors.BOLD if start in matched else ""
+                row += screen.cells(text[start:end], style + bold)
+                start = end
+        return row
 
     def print_row(self, idx, indicator=""):
-        utils.force_write(" " * (self.indent + self.align))
+        """Schedule choice `idx` to be redrawn on the next screen refresh."""
         back_color = (
             self.background_on_switch if idx == self.pos else self.background_color
         )
         word_color = self.word_on_switch if idx == self.pos else self.word_color
 
+        if not self.shown.has(idx):
+            self.screen.update(idx - self.top, [])
+            return
         if idx == self.pos:
-            utils.cprint(
-                f"{self.pointer}" + " " * self.margin,
-                self.pointer_color,
-                back_color,
-                end="",
-            )
+            pointer = f"{self.pointer}" + " " * self.margin
         else:
-            utils.cprint(
-                " " * (len(self.pointer) + self.margin),
-                self.pointer_color,
-                back_color,
-                end="",
+            pointer = " " * (str_width(self.pointer) + self.margin)
+        text = truncate(self.shown[idx], self.text_columns())
+        self.screen.update(
+            idx - self.top,
+            screen.cells(" " * (self.indent + self.align))
+            + screen.cells(pointer, back_color + self.pointer_color)
+            + self.choice_cells(idx, text, back_color + word_color)
+            + screen.cells(
+                " " * (self.max_width - str_width(text)),
+                back_color + colors.foreground["default"],
             )
-        utils.cprint(self.choices[idx], word_color, back_color, end="")
-        utils.cprint(
-            " " * (self.max_width - len(self.choices[idx])), on=back_color, end=""
+            + screen.cells(
+                indicator, colors.background["default"] + self.indicator_color
+            ),
         )
-        utils.cprint(indicator, color=self.indicator_color, end="")
-        utils.move_cursor_head()
+
+    def move_to(self, pos, top=None):
+        """Select `pos`, scrolling just enough to keep it in the window.
+
+        Args:
+            pos (int): Index of the choice to select. Must exist.
+            top (int): Optional. Index of the first row of the window.
+        """
+        if top is None:
+            top = _window_top(self.top, pos, self.height)
+        self.pos, self.top = pos, top
+        self.render_rows()
 
     @keyhandler.register(char.ARROW_UP_KEY)
     def move_up(self):
-        if self.pos == self.top:
-            if self.top == 0:
-                return  # Already reached top-most position
-            utils.clear_console_down(self.height)
-            self.pos, self.top = self.pos - 1, self.top - 1
-            self.render_rows()
-            utils.move_cursor_up(self.height)
-        else:
-            utils.clear_line()
-            old_pos = self.pos
-            self.pos -= 1
-            show_arrow = (
-                old_pos == self.top + self.height - 1
-                and self.top + self.height < len(self.choices)
-            )
-            self.print_row(old_pos, indicator=self.down_indicator if show_arrow else "")
-            utils.move_cursor_up(1)
-            self.print_row(self.pos)
+        steps = 1 + utils.fold_repeats(self.key)
+        if self.pos == 0:
+            return  # Already reached top-most position
+        self.move_to(max(0, self.pos - steps))
 
     @keyhandler.register(char.ARROW_DOWN_KEY)
     def move_down(self):
-        if self.pos == self.top + self.height - 1:
-            if self.top + self.height == len(self.choices):
-                return
-            else:
-                utils.moveCursorDown(self.height - (self.pos - self.top + 1))
-        else:
-            utils.moveCursorDown(self.height - (self.pos - self.top + 1))
-        utils.clearConsoleUp(self.height)
-        utils.moveCursorDown(1)
-        self.top = min(len(self.choices) - self.height, self.top + self.height)
-        self.pos = min(len(self.choices) - 1, self.pos + self.height)
-        self.renderRows()
-        utils.moveCursorUp(1 + self.height - (self.pos - self.top + 1))
+        steps = 1 + utils.fold_repeats(self.key)
+        last = self.shown.fill(self.pos + steps + 1) - 1
+        if self.pos >= last:
+            return  # Already reached bottom-most position
+        self.move_to(min(last, self.pos + steps))
 
     @keyhandler.register(char.HOME_KEY)
     def move_top(self):
-        if self.pos == self.top:
-            if self.top == 0:
-                return  # Already reached top-most position
-        else:
-            utils.move_cursor_up(self.pos - self.top)
-        utils.clear_console_down(self.height)
-        self.pos = self.top = 0
-        self.render_rows()
-        utils.move_cursor_up(self.height)
+        if self.pos == 0:
+            return
+        self.move_to(0, top=0)
 
     @keyhandler.register(char.END_KEY)
     def move_bottom(self):
-        if self.pos == self.top + self.height - 1:
-            if self.top + self.height == len(self.choices):
-                return  # Already reached bottom-most position
-        else:
-            utils.move_cursor_down(self.height - (self.pos - self.top + 1))
-        utils.clear_console_up(self.height)
-        utils.move_cursor_down(1)
-        self.top = len(self.choices) - self.height
-        self.pos = len(self.choices) - 1
-        self.render_rows()
-        utils.move_cursor_up(1)
+        last = len(self.shown) - 1
+        if self.pos >= last:
+            return
+        self.move_to(last, top=max(0, last - self.height + 1))
 
     @keyhandler.register(char.PG_UP_KEY)
     def move_page_up(self):
-        if self.pos == self.top:
-            if self.top == 0:
-                return  # Already reached top-most position
-        else:
-            utils.move_cursor_up(self.pos - self.top)
-        utils.clear_console_down(self.height)
-        self.top = max(0, self.top - self.height)
-        self.pos = max(0, self.pos - self.height)
-        self.render_rows()
-        utils.move_cursor_up(self.height - (self.pos - self.top))
+        rows = self.height * (1 + utils.fold_repeats(self.key))
+        if self.pos == 0:
+            return
+        self.move_to(max(0, self.pos - rows), top=max(0, self.top - rows))
 
     @keyhandler.register(char.PG_DOWN_KEY)
     def move_page_down(self):
-        if self.pos == self.top + self.height - 1:
-            if self.top + self.height == len(self.choices):
-                return  # Already reached bottom-most position
-            else:
-                utils.move_cursor_down(self.height - (self.pos - self.top + 1))
+        rows = self.height * (1 + utils.fold_repeats(self.key))
+        total = self.shown.fill(self.top + rows + self.height)
+        if self.pos >= total - 1:
+            return
+        self.move_to(
+            min(total - 1, self.pos + rows),
+            top=max(0, min(total - self.height, self.top + rows)),
+        )
+
+    @keyhandler.register(char.PRINTABLE_KEY)
+    def type_query(self):
+        if not self.search:
+            return
+        if self.finder is None:
+            self.finder = FuzzySearch(list(self.choices))
+        self.finder.push(self.key)
+        self.update_results()
+
+    @keyhandler.register(char.PASTE_KEY)
+    def paste_query(self):
+        text = utils.printable(self.key)
+        if not self.search or not text:
+            return
+        if self.finder is None:
+            self.finder = FuzzySearch(list(self.choices))
+        for ch in text:
+            self.finder.push(ch)
+        self.update_results()
+
+    @keyhandler.register(char.BACK_SPACE_KEY)
+    @keyhandler.register(char.BACK_SPACE_CHAR)
+    def erase_query(self):
+        if self.finder is None or not self.finder.query:
+            return
+        self.finder.pop()
+        self.update_results()
+
+    @keyhandler.register(char.CHOICES_KEY)
+    def add_choices(self):
+        """Merge the choices a live source delivered since the last merge.
+
+        The selected choice stays selected, even when a search ranks new
+        matches above it. Without a query the window is only redrawn if it
+        reached the end of the list.
+        """
+        start = len(self.choices)
+        at_end = self.top + self.height >= len(self.shown)
+        if not self.choices.merge():
+            self.render_footer()
+            self.screen.refresh()
+            return
+        self.fit_window()
+        if self.finder is not None:
+            self.finder.extend(self.choices[start:])
+        if self.finder is not None and self.finder.query:
+            selected = self.shown.order[self.pos] if self.shown else None
+            self.shown = Results(self.choices, self.finder.results)
+            if selected is not None:
+                self.pos = self.shown.order.index(selected)
+            self.move_to(self.pos)
+        elif at_end:
+            self.move_to(self.pos)
+        else:
+            self.render_footer()
+            self.screen.refresh()
+
+    def update_results(self):
+        """Show the choices matching the current query, best first."""
+        if self.finder.query:
+            self.shown = Results(self.choices, self.finder.results)
         else:
-            utils.move_cursor_down(self.height - (self.pos - self.top + 1))
-        utils.clear_console_up(self.height)
-        utils.move_cursor_down(1)
-        self.top = min(len(self.choices) - self.height, self.top + self.height)
-        self.pos = min(len(self.choices) - 1, self.pos + self.height)
+            self.shown = self.choices
+        self.pos = self.top = 0
+        self.render_rows()
+
+    def fit_window(self):
+        """Size the window to the choices, `max_height` and the terminal.
+
+        Keeps the selected choice in the window. Called again on resize, so
+        without a `height` the window follows the terminal.
+        """
+        rows = _rows_below(self.prompt, self.shift, self.indent, self.fullscreen)
+        if self.max_height is not None and not self.fullscreen:
+            rows = min(self.max_height, rows)
+        self.height = min(rows, self.choices.fill(rows))
+        self.top = _window_top(self.top, self.pos, self.height)
+
+    @keyhandler.register(char.RESIZE_KEY)
+    def resize(self):
+        """Reflow the prompt and the window for the new terminal size."""
+        _redraw_prompt(self)
+        self.max_width = 0
+        self.fit_window()
         self.render_rows()
-        utils.move_cursor_up(1 + self.height - (self.pos - self.top + 1))
 
     @keyhandler.register(char.NEWLINE_KEY)
     def accept(self):
-        d = self.top + self.height - self.pos
-        utils.move_cursor_down(d)
-        ret = self.choices[self.pos]
+        if not self.shown:
+            return  # Nothing matches the query
+        self.screen.move_to(self.height + self.footer)
+        ret = self.shown[self.pos]
+        idx = self.original(self.pos)
         if self.return_index:
-            return ret, self.pos
+            return ret, idx
         self.pos = 0
         return ret
 
     @keyhandler.register(char.INTERRUPT_KEY)
     def interrupt(self):
-        d = self.top + self.height - self.pos
-        utils.move_cursor_down(d)
+        self.screen.move_to(self.height + self.footer)
         raise KeyboardInterrupt
 
     def launch(self):
-        if self.prompt:
-            utils.force_write(
-                " " * self.indent
-                + self.prompt_color
-                + self.prompt
-                + colors.RESET
-                + "\n"
-            )
-            utils.force_write("\n" * self.shift)
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def apply_default(self, default):
+        """Apply the `default` a subclass' `launch()` takes.
+
+        Called once a live source merged what it delivered before launch.
+        """
+
+    def _run(self, default=None):
+        with (
+            terminal.session(),
+            _live_updates(self.choices),
+            utils.alternate_screen(self.fullscreen),
+            utils.paste_mode(self.search),
+        ):
+            if default:
+                self.apply_default(default)
+            with utils.frame():
+                self.prompt_rows = _draw_prompt(self)
+                self.pos = self.top = 0
+                self.fit_window()
+                self.finder = None
+                self.shown = self.choices
+                self.render_rows()
+            with cursor.hide():
+                while True:
+                    ret = self.handle_key((yield))
+                    if ret is not None:
+                        return ret
+
+
+class ScrollCheck(ScrollBar):
+    """
+    Scrollable multiple-choice selector for long lists.
+
+    Only the rows in the window are ever drawn and the selection is a
+    bitset, so lists of a million choices stay responsive, bulk actions
+    included.
+
+    Args:
+        prompt (str): Prompt text.
+        choices (list): List of choices to display.
+        check (str): Mark shown next to selected choices.
+        check_color (str): Foreground color for the mark. Available: black, red, green, yellow, blue, magenta, cyan, white, default.
+        height (int): Number of visible rows. Defaults to what fits in
+            the terminal.
+        return_index (bool): If True, return (choices, indices).
+        Other arguments as in ScrollBar.
+
+    Keys: **space** toggles the current choice, **ctrl+a** selects every
+    choice shown (with a search query, every match), **ctrl+d** deselects
+    them, **ctrl+t** inverts them and **ctrl+r** selects the range from the
+    last toggled choice to the current one.
+    """
+
+    def __init__(
+        self,
+        prompt: str = "",
+        choices: list = None,
+        check: str = "√",
+        check_color: str = colors.foreground["default"],
+        height=None,
+        shift: int = 0,
+        **kwargs,
+    ):
+        super().__init__(prompt, choices, height=height, shift=shift, **kwargs)
+        self.check = check
+        self.check_color = utils.resolve_color(check_color, colors.foreground)
+        self.checked = Selection(self.choices.loaded)
+        self.anchor = 0  # Position last toggled, start of ctrl+r ranges
+        self.footer = True  # Shows how many choices are selected
+
+    def text_columns(self):
+        return max(1, super().text_columns() - str_width(self.check) - 1)
+
+    def choice_cells(self, idx, text, style):
+        """Return the check mark and the cells of `text`, shown for `idx`."""
+        if self.checked[self.original(idx)]:
+            mark = screen.cells(self.check, style + self.check_color)
+        else:
+            mark = screen.cells(" " * str_width(self.check), style)
+        return mark + screen.cells(" ", style) + super().choice_cells(idx, text, style)
+
+    def footer_cells(self):
+        row = super().footer_cells()
+        return row + screen.cells(f"  {self.checked.count()} selected")
+
+    def shown_mask(self):
+        """Return the bitmask of every choice shown, or matching the query."""
+        if self.shown is self.choices:
+            return Selection.range_mask(0, len(self.choices))
+        return Selection.mask(self.shown.order)
+
+    @keyhandler.register(char.SPACE_CHAR)
+    def toggle_row(self):
+        if not self.shown:
+            return
+        self.checked.toggle(self.original(self.pos))
+        self.anchor = self.pos
         self.render_rows()
-        utils.move_cursor_up(self.height)
-        with cursor.hide():
-            while True:
-                ret = self.handle_input()
-                if ret is not None:
-                    return ret
+
+    @keyhandler.register(char.SELECT_ALL_KEY)
+    def select_all(self):
+        self.checked.add(self.shown_mask())
+        self.render_rows()
+
+    @keyhandler.register(char.DESELECT_ALL_KEY)
+    def deselect_all(self):
+        self.checked.discard(self.shown_mask())
+        self.render_rows()
+
+    @keyhandler.register(char.INVERT_KEY)
+    def invert(self):
+        self.checked.flip(self.shown_mask())
+        self.render_rows()
+
+    @keyhandler.register(char.SELECT_RANGE_KEY)
+    def select_range(self):
+        if not self.shown:
+            return
+        start, stop = sorted((min(self.anchor, len(self.shown) - 1), self.pos))
+        if self.shown is self.choices:
+            self.checked.add(Selection.range_mask(start, stop + 1))
+        else:
+            self.checked.add(Selection.mask(self.shown.order[start : stop + 1]))
+        self.anchor = self.pos
+        self.render_rows()
+
+    def update_results(self):
+        super().update_results()
+        self.anchor = 0
+
+    @keyhandler.register(char.NEWLINE_KEY)
+    def accept(self):
+        self.screen.move_to(self.height + self.footer)
+        ret_idx = list(self.checked.indices())
+        ret = [self.choices[i] for i in ret_idx]
+        self.pos = 0
+        self.checked = Selection(self.choices.loaded)
+        return (ret, ret_idx) if self.return_index else ret
+
+    def launch(self, default=None):
+        return utils.run(self._run(default))
+
+    async def launch_async(self, default=None):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run(default))
+
+    def _run(self, default=None):
+        if default:
+            if type(default).__name__ != "list":
+                raise TypeError("`default` should be a list of integers!")
+            if any(type(i).__name__ != "int" for i in default):
+                raise TypeError("Indices in `default` should be integer type!")
+        self.anchor = 0
+        return (yield from super()._run(default))
+
+    def apply_default(self, default):
+        """Check the indices in `default`, once live choices are merged."""
+        if not all(self.choices.has(i) for i in default):
+            raise _out_of_range(
+                self.choices,
+                "All indices in `default` should be in range [0, len(choices))!",
+            )
+        self.checked.add(Selection.mask(default))
 
 
 class SlidePrompt:
@@ -1177,29 +1819,47 @@ class SlidePrompt:
             print(prompt, answer)
 
     def launch(self):
-        self.result = []
-        for ui in self.components:
-            self.result.append((ui.prompt, ui.launch()))
-            d = 1
-            if type(ui).__name__ in ["Bullet", "Check"]:
-                d = 1 + ui.shift + len(ui.choices)
-            utils.clear_console_up(d + 1)
-            utils.move_cursor_down(1)
-        return self.result
+        return utils.run(self._run())
+
+    async def launch_async(self):
+        """Like `launch()`, but awaits keys without blocking the event loop."""
+        return await utils.run_async(self._run())
+
+    def _run(self):
+        with terminal.session():
+            self.result = []
+            for ui in self.components:
+                self.result.append((ui.prompt, (yield from ui._run())))
+                if getattr(ui, "fullscreen", False):
+                    continue  # Drawn on the alternate screen, gone already
+                d = 1
+                if type(ui).__name__ in ["Bullet", "Check"]:
+                    d = (
+                        len(_prompt_lines(ui.prompt, ui.indent))
+                        + ui.shift
+                        + ui.height
+                        + isinstance(ui.choices, LiveChoices)
+                    )
+                with utils.frame():
+                    utils.clear_console_up(d + 1)
+                    utils.move_cursor_down(1)
+            return self.result
 
 
 class Date(Input):
     """Prompt user for a `date` value until successfully parsed.
 
-    String provided by user can be provided in any format recognized by
-    `dateutil.parser`.
+    The date the input parses to is shown after it as the user types, and
+    Enter is only accepted once it parses. Besides `format_str`, ISO and
+    numeric dates, relative ones ("today", "+3d", "next friday") are
+    understood, and anything else recognized by `dateutil.parser`.
 
     Args:_
         prompt (str): Required. Text to display to user before input prompt.
         default (date): Optional. Default `date` value if user provides no
             input.
-        format_str (str): Format string used to display default value,
-            defaults to '%m/%d/%Y'
+        format_str (str): Format string used to display dates and to parse
+            input, defaults to '%m/%d/%Y'
         indent (int): Distance between left-boundary and start of prompt.
         word_color (str): Optional. The color of the prompt and user input.
     """
@@ -1207,33 +1867,61 @@ class Date(Input):
     def __init__(
         self,
         prompt: str,
-        default: date = None,
+        default: "date" = None,
         format_str: str = "%m/%d/%Y",
         indent: int = 0,
         word_color: str = colors.foreground["default"],
     ):
+        self.default_date = default
+        self.format_str = format_str
         if default:
             default = default.strftime(format_str)
         super().__init__(prompt, default=default, indent=indent, word_color=utils.resolve_color(word_color, colors.foreground))
 
-    def launch(self):
-        while True:
-            result = super().launch()
-            if not result:
-                continue
-            try:
-                date = date_parser.parse(result)
-                return date.date()
-            except ValueError:
-                error = f"Error! '{result}' could not be parsed as a valid date.\n"
-                help_message = (
-                    "You can use any format recognized by dateutil.parser."
-                    " For example, all of "
-                    "the strings below are valid ways to represent the same date:\n"
-                )
-                examples = '\n"2018-5-13" -or- "05/13/2018" -or- "May 13 2018"\n'
-                utils.cprint(error, color=colors.bright(colors.foreground["red"]))
-                utils.cprint(
-                    wrap_text(help_message, max_len=70), color=colors.foreground["red"]
-                )
-                utils.cprint(examples, color=colors.foreground["red"])
+    def parse(self, text):
+        """Return the `date` `text` stands for; raises ValueError if none."""
+        from . import dates
+
+        return dates.parse_date(text, self.format_str)
+
+    def accepts(self, text):
+        """Return True if Enter may submit `text`."""
+        if not text.strip():
+            return self.default_date is not None
+        try:
+            self.parse(text)
+        except ValueError:
+            return False
+        return True
+
+    def hint(self, text):
+        """Return the note shown after `text` while it is typed."""
+        if not text.strip():
+            return None
+        try:
+            date = self.parse(text)
+        except ValueError:
+            return ("not a date, try e.g. 2018-05-13, +3d or next friday", colors.foreground["red"])
+        return (f"= {date:%a} {date.strftime(self.format_str)}", colors.foreground["green"])
+
+    def _run(self):
+        with terminal.session():
+            utils.force_write(
+                " " * self.indent
+                + self.prompt_color
+                + self.prompt
+                + self.default
+                + colors.RESET
+            )
+            sess = myInput(
+                word_color=self.word_color,
+                hint=self.hint,
+                validate=self.accepts,
+                offset=self.indent + str_width(self.prompt + self.default),
+            )
+            result = yield from sess.steps()
+            if result is None:
+                return None
+            if not result.strip():
+                return self.default_date
+            return self.parse(result)
@@ -24,6 +24,7 @@ background = {
     "default": "\u001b[49m",
 }
 
+BOLD = "\u001b[1m"
 REVERSE = "\u001b[7m"
 RESET_REVERSE = "\u001b[27m"
 
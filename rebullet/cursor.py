@@ -3,6 +3,8 @@
 import sys
 from contextlib import contextmanager
 
+from . import utils
+
 # Show and hide cursors
 
 if sys.platform == "win32":
@@ -29,8 +31,7 @@ def _hide_cursor():
         ci.visible = False
         ctypes.windll.kernel32.SetConsoleCursorInfo(handle, ctypes.byref(ci))
     elif sys.platform in ("linux", "linux2", "darwin"):
-        sys.stdout.write("\033[?25l")
-        sys.stdout.flush()
+        utils.force_write("\033[?25l")
 
 
 def _show_cursor():
@@ -41,5 +42,4 @@ def _show_cursor():
         ci.visible = True
         ctypes.windll.kernel32.SetConsoleCursorInfo(handle, ctypes.byref(ci))
     elif sys.platform in ("linux", "linux2", "darwin"):
-        sys.stdout.write("\033[?25h")
-        sys.stdout.flush()
+        utils.force_write("\033[?25h")
@@ -0,0 +1,258 @@
+"""Dates imports"""
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+CACHE_SIZE = 512  ## Distinct inputs whose parsed date is remembered
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+UNITS = {
+    "d": "days",
+    "day": "days",
+    "days": "days",
+    "w": "weeks",
+    "week": "weeks",
+    "weeks": "weeks",
+    "m": "months",
+    "month": "months",
+    "months": "months",
+    "y": "years",
+    "year": "years",
+    "years": "years",
+}  ## Unit words of relative dates ("+3d", "in 2 weeks")
+NAMED = {"today": 0, "now": 0, "tomorrow": 1, "yesterday": -1}  ## Days from today
+_DIGITS = {
+    "%Y": (4, 4),
+    "%y": (2, 2),
+    "%m": (1, 2),
+    "%d": (1, 2),
+    "%-m": (1, 2),
+    "%-d": (1, 2),
+}
+
+
+def parse_date(
+    text: str, format_str: str = "%m/%d/%Y", today: date | None = None
+) -> date:
+    """Parse what a user typed into a `date`.
+
+    Tries, in order: relative dates ("today", "tomorrow", "+3d", "-2w",
+    "+10 days", "in 3 days", "2 weeks ago", "next friday", "last month",
+    "fri"), the `format_str` the prompt displays dates in, ISO dates and
+    the numeric forms "2018-5-13", "2018/05/13", "05/13/2018" and
+    "5.13.18", and only then `dateutil.parser`. Results, failures
+    included, are cached, so parsing again while the user edits the same
+    text costs a lookup.
+
+    Args:
+        text (str): Text to parse.
+        format_str (str): Format the prompt displays dates in.
+        today (date): Optional. Date relative dates count from, defaults
+            to `date.today()`.
+    Raises:
+        ValueError: If `text` is not a date in any supported form.
+    """
+    parsed = _parse(" ".join(text.lower().split()), format_str, today or date.today())
+    if parsed is None:
+        raise ValueError(f"{text!r} could not be parsed as a valid date.")
+    return parsed
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(text, format_str, today):
+    if not text:
+        return None
+    for parse in (_relative, _formatted, _numeric):
+        try:
+            parsed = parse(text, format_str, today)
+        except (ValueError, OverflowError):
+            continue  # A number out of range, e.g. month 13
+        if parsed is not None:
+            return parsed
+    return _fallback(text)
+
+
+def _relative(text, format_str, today):
+    if text in NAMED:
+        return today + timedelta(days=NAMED[text])
+    words = text.split(" ")
+    if len(words) <= 2 and text[0] in "+-":
+        number, unit = _split_number(text[1:])
+        if number is None:
+            return None
+        return _shift(today, -number if text[0] == "-" else number, unit)
+    if len(words) == 3 and words[0] == "in":
+        return _shift(today, _number(words[1]), words[2])
+    if len(words) == 3 and words[2] == "ago":
+        return _shift(today, -_number(words[0]), words[1])
+    if len(words) == 2 and words[0] in ("next", "last", "this"):
+        step = {"next": 1, "last": -1, "this": 0}[words[0]]
+        weekday = _weekday(words[1])
+        if weekday is None:
+            return _shift(today, step, words[1]) if step else None
+        days = (weekday - today.weekday()) % 7
+        if step > 0:
+            return today + timedelta(days=days or 7)
+        if step < 0:
+            return today - timedelta(days=(today.weekday() - weekday) % 7 or 7)
+        return today + timedelta(days=days)
+    if len(words) == 1:
+        weekday = _weekday(text)
+        if weekday is not None:
+            return today + timedelta(days=(weekday - today.weekday()) % 7)
+    return None
+
+
+def _split_number(text):
+    """Split "3d" into `(3, "d")`."""
+    end = len(text) - len(text.lstrip("0123456789"))
+    if not end:
+        return None, None
+    return int(text[:end]), text[end:].strip() or "d"
+
+
+def _number(word):
+    if not word.isdigit():
+        raise ValueError(word)
+    return int(word)
+
+
+def _weekday(word):
+    if len(word) < 3:
+        return None
+    for idx, name in enumerate(WEEKDAYS):
+        if name.startswith(word):
+            return idx
+    return None
+
+
+def _shift(day, number, unit):
+    """Return `day` moved by `number` `unit`s ("d", "weeks", ...)."""
+    unit = UNITS.get(unit)
+    if unit == "days":
+        return day + timedelta(days=number)
+    if unit == "weeks":
+        return day + timedelta(weeks=number)
+    if unit == "months":
+        return _add_months(day, number)
+    if unit == "years":
+        return _add_months(day, 12 * number)
+    raise ValueError(unit)
+
+
+def _add_months(day, months):
+    """Move `day` by `months`, clamping to the end of shorter months."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    month += 1
+    following = date(year + month // 12, month % 12 + 1, 1)
+    last = (following - timedelta(days=1)).day
+    return date(year, month, min(day.day, last))
+
+
+@lru_cache(maxsize=16)
+def _compile_format(format_str):
+    """Split `format_str` into numeric directives and literal text.
+
+    Returns `None` for formats with other directives (month names,
+    weekdays...), which are left to `datetime.strptime`.
+    """
+    parts = []
+    idx = 0
+    while idx < len(format_str):
+        if format_str[idx] != "%":
+            end = format_str.find("%", idx)
+            end = len(format_str) if end < 0 else end
+            parts.append(format_str[idx:end].lower())
+            idx = end
+            continue
+        size = 3 if format_str[idx + 1 : idx + 2] == "-" else 2
+        directive = format_str[idx : idx + size]
+        if directive == "%%":
+            parts.append("%")
+        elif directive in _DIGITS:
+            parts.append(directive)
+        else:
+            return None
+        idx += size
+    return tuple(parts)
+
+
+def _formatted(text, format_str, today):
+    parts = _compile_format(format_str)
+    if parts is None:
+        return datetime.strptime(text, format_str).date()
+    values = {}
+    pos = 0
+    for part in parts:
+        if part not in _DIGITS:
+            if not text.startswith(part, pos):
+                return None
+            pos += len(part)
+            continue
+        shortest, longest = _DIGITS[part]
+        end = pos
+        while end < len(text) and end - pos < longest and text[end].isdigit():
+            end += 1
+        if end - pos < shortest:
+            return None
+        values[part.replace("-", "")] = int(text[pos:end])
+        pos = end
+    if pos != len(text) or "%d" not in values or "%m" not in values:
+        return None
+    if "%Y" in values:
+        year = values["%Y"]
+    elif "%y" in values:
+        year = _full_year(values["%y"], today)
+    else:
+        year = today.year
+    return date(year, values["%m"], values["%d"])
+
+
+def _numeric(text, format_str, today):
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        pass
+    for sep in "-/. ":
+        parts = text.split(sep)
+        if len(parts) == 3:
+            break
+    else:
+        return None
+    if not all(part.isdigit() for part in parts):
+        return None
+    first, second, third = map(int, parts)
+    if len(parts[0]) == 4:
+        return date(first, second, third)  # Year first
+    # Month first, like dateutil's default.
+    year = third if len(parts[2]) == 4 else _full_year(third, today)
+    return date(year, first, second)
+
+
+def _full_year(year, today):
+    """Expand a two digit year to the one closest to `today`'s."""
+    year += today.year // 100 * 100
+    if year > today.year + 50:
+        year -= 100
+    elif year <= today.year - 50:
+        year += 100
+    return year
+
+
+def _fallback(text):
+    # Loaded on first use, as it takes longer to import than the rest of
+    # rebullet put together.
+    from dateutil import parser as date_parser
+
+    try:
+        return date_parser.parse(text).date()
+    except (ValueError, OverflowError):
+        return None
@@ -0,0 +1,87 @@
+"""Dependency graph imports"""
+
+from collections import deque
+
+from .exceptions import CyclicDependenciesError, MissingDependenciesError
+
+
+class DependencyGraph:
+    """Dependencies between choices, indexed by position.
+
+    Built once from a `CheckDependencies` dep tree. Construction checks that
+    every dependency exists and that there are no cycles, in time linear in
+    the number of choices and edges. The transitive closures of a choice
+    (everything it needs, everything that needs it) are found by walking
+    only the affected part of the graph the first time they are asked for,
+    then cached.
+    """
+
+    def __init__(self, dep_tree):
+        self.choices = [choice for choice, _ in dep_tree]
+        self.index = {choice: idx for idx, choice in enumerate(self.choices)}
+        missing = [
+            (choice, dep)
+            for choice, deps in dep_tree
+            for dep in deps
+            if dep not in self.index
+        ]
+        if missing:
+            raise MissingDependenciesError(missing)
+
+        index = self.index
+        self.dependencies = [tuple(index[dep] for dep in deps) for _, deps in dep_tree]
+        dependants = [[] for _ in self.choices]
+        for idx, deps in enumerate(self.dependencies):
+            for dep in deps:
+                dependants[dep].append(idx)
+        self.dependants = [tuple(d) for d in dependants]
+        self._check_cycles()
+        self._requires = {}
+        self._required_by = {}
+
+    def _check_cycles(self):
+        """Raise `CyclicDependenciesError` if a choice depends on itself."""
+        pending = [len(deps) for deps in self.dependencies]
+        ready = deque(idx for idx, count in enumerate(pending) if not count)
+        done = 0
+        while ready:
+            idx = ready.popleft()
+            done += 1
+            for dependant in self.dependants[idx]:
+                pending[dependant] -= 1
+                if not pending[dependant]:
+                    ready.append(dependant)
+        if done == len(self.choices):
+            return
+        # Every choice left waits on another one left; follow them until
+        # one repeats to report a cycle.
+        idx = next(idx for idx, count in enumerate(pending) if count)
+        path, seen = [], {}
+        while idx not in seen:
+            seen[idx] = len(path)
+            path.append(idx)
+            idx = next(dep for dep in self.dependencies[idx] if pending[dep])
+        cycle = path[seen[idx] :] + [idx]
+        raise CyclicDependenciesError([self.choices[i] for i in cycle])
+
+    def requires(self, idx):
+        """Return the indices of every choice `idx` depends on."""
+        return self._closure(idx, self.dependencies, self._requires)
+
+    def required_by(self, idx):
+        """Return the indices of every choice that depends on `idx`."""
+        return self._closure(idx, self.dependants, self._required_by)
+
+    def _closure(self, idx, edges, cache):
+        found = cache.get(idx)
+        if found is None:
+            seen = {idx}
+            stack = list(edges[idx])
+            while stack:
+                other = stack.pop()
+                if other not in seen:
+                    seen.add(other)
+                    stack.extend(edges[other])
+            seen.discard(idx)
+            found = cache[idx] = tuple(seen)
+        return found
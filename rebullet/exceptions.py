@@ -15,3 +15,14 @@ class MissingDependenciesError(Exception):
             ]
         )
         super().__init__(message)
+
+
+class CyclicDependenciesError(Exception):
+    """CyclicDependenciesError Class"""
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        message = "Dependencies form a cycle: {path}.".format(
+            path=" -> ".join(f"'{choice}'" for choice in cycle)
+        )
+        super().__init__(message)
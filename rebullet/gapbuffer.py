@@ -0,0 +1,96 @@
+"""Gap buffer imports"""
+
+
+class GapBuffer:
+    """Editable line of text with a gap kept at the cursor.
+
+    Characters before the cursor live at the start of `data` and characters
+    after it at the end, with unused slots (the gap) in between. Inserting
+    or deleting at the cursor only touches the gap; moving the cursor by `k`
+    copies `k` characters across it.
+    """
+
+    def __init__(self, text: str = "", capacity: int = 64):
+        capacity = max(capacity, 2 * len(text))
+        self.data = list(text) + [""] * (capacity - len(text))
+        self.cursor = len(text)  # Start of the gap
+        self.gap_end = capacity
+
+    def __len__(self):
+        return len(self.data) - (self.gap_end - self.cursor)
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("GapBuffer index out of range")
+        return self.data[idx if idx < self.cursor else idx + self.gap_end - self.cursor]
+
+    def __str__(self):
+        return self.before() + self.after()
+
+    def before(self) -> str:
+        """Return the text left of the cursor."""
+        return "".join(self.data[: self.cursor])
+
+    def after(self) -> str:
+        """Return the text right of the cursor."""
+        return "".join(self.data[self.gap_end :])
+
+    def move(self, pos: int):
+        """Move the cursor (and the gap) to `pos`."""
+        if pos < self.cursor:
+            k = self.cursor - pos
+            self.data[self.gap_end - k : self.gap_end] = self.data[pos : self.cursor]
+            self.cursor, self.gap_end = pos, self.gap_end - k
+        elif pos > self.cursor:
+            k = pos - self.cursor
+            self.data[self.cursor : pos] = self.data[self.gap_end : self.gap_end + k]
+            self.cursor, self.gap_end = pos, self.gap_end + k
+
+    def insert(self, s: str):
+        """Insert `s` at the cursor and move the cursor past it."""
+        if len(s) > self.gap_end - self.cursor:
+            self._grow(len(s))
+        self.data[self.cursor : self.cursor + len(s)] = s
+        self.cursor += len(s)
+
+    def delete(self, n: int = 1) -> int:
+        """Delete up to `n` characters right of the cursor.
+
+        Returns:
+            int: Number of characters actually deleted.
+        """
+        n = min(n, len(self.data) - self.gap_end)
+        self.gap_end += n
+        return n
+
+    def clear(self):
+        """Remove all text."""
+        self.cursor = 0
+        self.gap_end = len(self.data)
+
+    def word_start(self, pos: int) -> int:
+        """Return the start of the word left of `pos`, skipping spaces."""
+        while pos > 0 and self[pos - 1].isspace():
+            pos -= 1
+        while pos > 0 and not self[pos - 1].isspace():
+            pos -= 1
+        return pos
+
+    def word_end(self, pos: int) -> int:
+        """Return the end of the word right of `pos`, skipping spaces."""
+        size = len(self)
+        while pos < size and self[pos].isspace():
+            pos += 1
+        while pos < size and not self[pos].isspace():
+            pos += 1
+        return pos
+
+    def _grow(self, needed: int):
+        tail = self.data[self.gap_end :]
+        capacity = max(2 * len(self.data), len(self) + needed)
+        self.gap_end = capacity - len(tail)
+        self.data = (
+            self.data[: self.cursor] + [""] * (self.gap_end - self.cursor) + tail
+        )
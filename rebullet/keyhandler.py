@@ -1,13 +1,17 @@
 """Keyhandler imports"""
 
-from . import utils
-from .charDef import UNDEFINED_KEY
+from . import keys, utils
+from .charDef import PRINTABLE_KEY
 
 
 def register(key):
     """
     Mark the function with the key code that it handles so
     that it can found by _KeyHandlerRegisterer.
+
+    While a handler runs, the key event that triggered it is available as
+    `self.key`. Handlers registered for `PRINTABLE_KEY` receive every typed
+    character that has no handler of its own.
     """
 
     def wrap(func):
@@ -37,6 +41,7 @@ class _KeyHandlerRegisterer(type):
             # inherited classes from changing parent.
             result._key_handler = result._key_handler.copy()
         result.handle_input = _KeyHandlerRegisterer.handle_input
+        result.handle_key = _KeyHandlerRegisterer.handle_key
 
         for value in classdict.values():
             handled_keys = getattr(value, "_handle_key", [])
@@ -48,7 +53,16 @@ class _KeyHandlerRegisterer(type):
     # TODO - This method is static and also using self. Figure out which should be kept!
     @staticmethod
     def handle_input(self):
-        c = utils.getchar()
-        i = c if c == UNDEFINED_KEY else ord(c)
-        handler = self._key_handler.get(i)
-        return handler(self) if handler is not None else None
+        return self.handle_key(utils.getchar())
+
+    @staticmethod
+    def handle_key(self, key):
+        """Run the handler registered for `key` and return its result."""
+        handler = self._key_handler.get(keys.code(key))
+        if handler is None and keys.is_text(key):
+            handler = self._key_handler.get(PRINTABLE_KEY)
+        if handler is None:
+            return None
+        self.key = key
+        with utils.frame():
+            return handler(self)
@@ -0,0 +1,292 @@
+"""Key reader imports"""
+
+import codecs
+import os
+import select
+import time
+from collections import deque
+
+from . import charDef as char
+from . import metrics
+
+READ_SIZE = 4096  ## Maximum bytes taken from the console per read
+ESC_TIMEOUT = 0.025  ## Seconds to wait for the rest of an escape sequence
+PASTE_START = "\033[200~"
+PASTE_END = "\033[201~"
+
+_CONTROL_KEYS = frozenset(
+    (
+        char.LINE_BEGIN_KEY,
+        char.LINE_END_KEY,
+        char.TAB_KEY,
+        char.INTERRUPT_KEY,
+        char.NEWLINE_KEY,
+        char.BACK_SPACE_KEY,
+        char.BACK_SPACE_CHAR,
+        char.DELETE_WORD_KEY,
+        char.DESELECT_ALL_KEY,
+        char.SELECT_RANGE_KEY,
+        char.INVERT_KEY,
+    )
+)
+
+_ESC = chr(char.ESC_KEY)
+
+
+def _modifier_flags(param):
+    """Return the key flags of an xterm modifier parameter (2 is Shift...)."""
+    bits = param - 1
+    flags = 0
+    if bits & 1:
+        flags += char.SHIFT_KEY_FLAG
+    if bits & 2:
+        flags += char.ALT_KEY_FLAG
+    if bits & 4:
+        flags += char.CTRL_KEY_FLAG
+    return flags
+
+
+def _sequences():
+    """Return the escape sequences understood (without their ESC) -> key code."""
+    letters = {
+        "A": char.ARROW_UP_KEY,
+        "B": char.ARROW_DOWN_KEY,
+        "C": char.ARROW_RIGHT_KEY,
+        "D": char.ARROW_LEFT_KEY,
+        "H": char.HOME_KEY,
+        "F": char.END_KEY,
+        "P": char.F1_KEY,
+        "Q": char.F2_KEY,
+        "R": char.F3_KEY,
+        "S": char.F4_KEY,
+    }
+    numbers = {
+        1: char.HOME_KEY,
+        2: char.INSERT_KEY,
+        3: char.DELETE_KEY,
+        4: char.END_KEY,
+        5: char.PG_UP_KEY,
+        6: char.PG_DOWN_KEY,
+        7: char.HOME_KEY,  # rxvt
+        8: char.END_KEY,  # rxvt
+        11: char.F1_KEY,
+        12: char.F2_KEY,
+        13: char.F3_KEY,
+        14: char.F4_KEY,
+        15: char.F5_KEY,
+        17: char.F6_KEY,
+        18: char.F7_KEY,
+        19: char.F8_KEY,
+        20: char.F9_KEY,
+        21: char.F10_KEY,
+        23: char.F11_KEY,
+        24: char.F12_KEY,
+    }
+    seqs = {"[Z": char.BACK_TAB_KEY}
+    for letter, key in letters.items():
+        seqs["O" + letter] = key  # SS3, sent in application cursor mode
+        if letter in "ABCDHF":
+            seqs["[" + letter] = key
+        for param in range(2, 9):
+            seqs[f"[1;{param}{letter}"] = key + _modifier_flags(param)
+    for number, key in numbers.items():
+        seqs[f"[{number}~"] = key
+        for param in range(2, 9):
+            seqs[f"[{number};{param}~"] = key + _modifier_flags(param)
+    for idx, letter in enumerate("abcd"):
+        arrow = char.ARROW_UP_KEY + idx
+        seqs["[" + letter] = arrow + char.SHIFT_KEY_FLAG  # rxvt
+        seqs["O" + letter] = arrow + char.CTRL_KEY_FLAG  # rxvt
+        seqs[_ESC + "[" + "ABCD"[idx]] = arrow + char.ALT_KEY_FLAG
+    for idx, letter in enumerate("ABCDE"):
+        seqs["[[" + letter] = char.F1_KEY + idx  # Linux console
+    return seqs
+
+
+def _compile(sequences):
+    """Build a trie of nested dicts, one level per character, ending in key codes."""
+    trie = {}
+    for seq, key in sequences.items():
+        node = trie
+        for c in seq[:-1]:
+            node = node.setdefault(c, {})
+        node[seq[-1]] = key
+    return trie
+
+
+_TRIE = {}  ## Escape sequences, read one character per level; built by `_trie()`
+
+
+def _trie():
+    """Return `_TRIE`, compiling it on the first escape sequence read."""
+    if not _TRIE:
+        _TRIE.update(_compile(_sequences()))
+    return _TRIE
+
+
+class Key(str):
+    """Special key (arrow, Home, ...) encoded as `chr(code)`.
+
+    Compares equal to the plain string so existing handlers keep working,
+    but is never mistaken for typed text.
+    """
+
+
+class Paste(str):
+    """Text the terminal delivered as one bracketed paste."""
+
+
+def code(key) -> int:
+    """Return the integer key code of an event returned by `getchar()`.
+
+    Special keys are encoded above `charDef.ARROW_KEY_FLAG`, where typed
+    characters live too ("ł" is 322, `ARROW_DOWN_KEY`). Only `Key` events
+    and characters below it map to their own code, any other typed
+    character is `charDef.PRINTABLE_KEY` (`UNDEFINED_KEY` if unprintable).
+    """
+    if isinstance(key, Paste):
+        return char.PASTE_KEY
+    if key == char.UNDEFINED_KEY:
+        return key
+    if isinstance(key, Key) or ord(key) < char.ARROW_KEY_FLAG:
+        return ord(key)
+    return char.PRINTABLE_KEY if key.isprintable() else char.UNDEFINED_KEY
+
+
+def is_text(key) -> bool:
+    """Return `True` if `key` is a typed printable character."""
+    return type(key) is str and key.isprintable()
+
+
+class KeyReader:
+    """Turn raw console input into key events.
+
+    Input is decoded incrementally, so a multi-byte character or an escape
+    sequence split across two reads is completed by the next one. Every
+    complete key found in a chunk is queued in `events`, either as the
+    one-character string `getchar()` has always returned, as
+    `charDef.UNDEFINED_KEY`, or as a `Paste` holding a whole bracketed
+    paste.
+
+    Escape sequences are matched against a trie of the sequences terminals
+    send (see `_sequences()`), one step per character. Special keys are
+    queued as `Key(chr(code))`, with the `charDef` modifier flags added
+    for Shift, Alt and Ctrl. ESC followed by any other ASCII character is
+    that character plus `ALT_KEY_FLAG`; a lone ESC is the Escape key.
+    """
+
+    def __init__(self):
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.pending = ""  # Start of an escape sequence awaiting more input
+        self.events = deque()
+
+    def read(self, fd: int, timeout: float = ESC_TIMEOUT):
+        """Read whatever input is available on `fd` with a single syscall.
+
+        Blocks until at least one byte arrives. If the input stops inside
+        an escape sequence, waits up to `timeout` seconds for the rest of
+        it before taking what came as typed (see `flush()`).
+        """
+        data = os.read(fd, READ_SIZE)
+        if not data:
+            raise EOFError
+        self.feed(data)
+        while self.pending and not self.pending.startswith(PASTE_START):
+            ready, _, _ = select.select([fd], [], [], timeout)
+            data = os.read(fd, READ_SIZE) if ready else b""
+            if not data:
+                self.flush()
+                return
+            self.feed(data)
+
+    def flush(self):
+        """Queue the keys of a partial escape sequence no more input completes.
+
+        ESC alone is the Escape key, and ESC with one character (ESC [,
+        ESC O) that character with Alt.
+        """
+        pending, self.pending = self.pending, ""
+        if not pending.strip(_ESC):
+            self.events.extend(Key(_ESC) for _ in pending)
+        elif len(pending) == 2:
+            self.events.append(Key(chr(ord(pending[1]) + char.ALT_KEY_FLAG)))
+        else:
+            self.events.append(char.UNDEFINED_KEY)
+
+    def feed(self, data: bytes):
+        """Queue the key events found in the raw bytes `data`."""
+        record = metrics.recorder
+        if record is None:
+            self.feed_text(self.decoder.decode(data))
+            return
+        start = time.perf_counter()
+        self.feed_text(self.decoder.decode(data))
+        record.decoded += time.perf_counter() - start
+
+    def feed_text(self, text: str):
+        """Queue the key events found in the decoded string `text`."""
+        buf = self.pending + text
+        events = self.events
+        i, n = 0, len(buf)
+        while i < n:
+            c = buf[i]
+            code = ord(c)
+            if code != char.ESC_KEY:
+                if code in _CONTROL_KEYS or c.isprintable():
+                    events.append(c)
+                else:
+                    events.append(char.UNDEFINED_KEY)
+                i += 1
+                continue
+
+            if buf.startswith(PASTE_START[: n - i], i):
+                end = buf.find(PASTE_END, i + len(PASTE_START))
+                if end < 0:
+                    break  # Wait for the rest of the paste
+                events.append(Paste(buf[i + len(PASTE_START) : end]))
+                i = end + len(PASTE_END)
+                continue
+            node = _TRIE or _trie()
+            j = i + 1
+            while j < n and type(node) is dict:
+                node = node.get(buf[j])
+                j += 1
+            if type(node) is int:
+                events.append(Key(chr(node)))
+                i = j
+                continue
+            if node is not None:
+                break  # Wait for the rest of the sequence
+            end = self._skip_unknown(buf, i, j)
+            if end is None:
+                break
+            i = end
+        self.pending = buf[i:]
+
+    def _skip_unknown(self, buf, i, j):
+        """Queue the event for an escape sequence at `i` the trie lacks.
+
+        `j` is just past the first character that matched no sequence.
+        Returns where the next key starts, or `None` to wait for more input.
+        """
+        second = buf[i + 1]
+        if second == _ESC:
+            self.events.append(Key(_ESC))  # Escape, then a new sequence
+            return i + 1
+        if j == i + 2:
+            if ord(second) < 128:
+                self.events.append(Key(chr(ord(second) + char.ALT_KEY_FLAG)))
+            else:
+                self.events.append(char.UNDEFINED_KEY)
+            return j
+        if second == "[":
+            # Skip a whole CSI sequence: parameters up to a final byte.
+            end = i + 2
+            while end < len(buf) and "\x20" <= buf[end] <= "\x3f":
+                end += 1
+            if end == len(buf):
+                return None
+            self.events.append(char.UNDEFINED_KEY)
+            return end + 1 if "\x40" <= buf[end] <= "\x7e" else end
+        self.events.append(char.UNDEFINED_KEY)
+        return j
@@ -0,0 +1,149 @@
+"""Metrics imports"""
+
+import time
+
+enabled = False  ## Record metrics for every prompt launched
+recorder = None  ## Recorder of the prompt being answered, while enabled
+last = None  ## `PromptMetrics` of the last prompt launched
+_callbacks = []  ## Called with the `PromptMetrics` of every prompt
+
+
+def enable(callback=None):
+    """Start recording metrics for every prompt.
+
+    Args:
+        callback: Optional. Called with the `PromptMetrics` of each prompt
+            once it is answered or interrupted. Can be given several times
+            to register several callbacks.
+    """
+    global enabled
+    enabled = True
+    if callback is not None:
+        _callbacks.append(callback)
+
+
+def disable():
+    """Stop recording and drop the registered callbacks."""
+    global enabled
+    enabled = False
+    _callbacks.clear()
+
+
+class KeySample:
+    """Where the time went for one key event, in seconds.
+
+    Attributes:
+        code (int): `keys.code()` of the event.
+        wait (float): Time `getchar()` waited for input to arrive.
+        decode (float): Time spent turning the input into key events. A
+            chunk holding several keys is charged to the first of them.
+        handle (float): Time the widget took for the key, render and write
+            included.
+        render (float): Part of `handle` spent computing screen updates.
+        write (float): Part of `handle` spent writing to the terminal.
+        bytes (int): Bytes written to the terminal.
+        flushes (int): Number of flushes of the terminal output.
+    """
+
+    __slots__ = (
+        "bytes",
+        "code",
+        "decode",
+        "flushes",
+        "handle",
+        "render",
+        "wait",
+        "write",
+    )
+
+    def __init__(self, code=None):
+        self.code = code
+        self.wait = self.decode = self.handle = self.render = self.write = 0.0
+        self.bytes = self.flushes = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PromptMetrics:
+    """Measurements of one launch of a widget.
+
+    Attributes:
+        widget (str): Name of the widget class.
+        startup (KeySample): Drawing the prompt, before the first key.
+        keys (list): A `KeySample` per key event handled.
+        time_to_answer (float): Seconds from launch until the widget
+            returned (or was interrupted).
+        answered (bool): `False` if the prompt ended with an exception.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.startup = KeySample()
+        self.keys = []
+        self.time_to_answer = None
+        self.answered = False
+
+    def total(self, field):
+        """Sum `field` over the startup and every key."""
+        return getattr(self.startup, field) + sum(getattr(k, field) for k in self.keys)
+
+    def as_dict(self):
+        return {
+            "widget": self.widget,
+            "time_to_answer": self.time_to_answer,
+            "answered": self.answered,
+            "startup": self.startup.as_dict(),
+            "keys": [sample.as_dict() for sample in self.keys],
+        }
+
+
+class Recorder:
+    """Collects the `PromptMetrics` of the prompt being answered.
+
+    `utils.run()` opens one per launch while metrics are enabled; the key
+    reader, the screen and the output code report into `recorder`.
+    """
+
+    def __init__(self, widget):
+        self.metrics = PromptMetrics(widget)
+        self.sample = self.metrics.startup  # Sample being filled
+        self.decoded = 0.0  # Decode time not charged to a key yet
+        self.started = time.perf_counter()
+        self.parent = None  # Recorder of an enclosing prompt
+
+    def key(self, key_code, waited):
+        """Start the sample of a key `getchar()` returned after `waited` s."""
+        self.sample = KeySample(key_code)
+        self.sample.decode, self.decoded = self.decoded, 0.0
+        self.sample.wait = max(0.0, waited - self.sample.decode)
+        self.metrics.keys.append(self.sample)
+
+    def wrote(self, size, seconds):
+        self.sample.bytes += size
+        self.sample.flushes += 1
+        self.sample.write += seconds
+
+
+def begin(steps):
+    """Open a recorder for the widget input loop `steps`, if enabled."""
+    global recorder
+    if not enabled:
+        return None
+    current = Recorder(steps.__qualname__.split(".")[0])
+    current.parent, recorder = recorder, current
+    return current
+
+
+def end(current, answered):
+    """Close `current` and hand its metrics to the callbacks."""
+    global recorder, last
+    if current is None:
+        return
+    recorder = current.parent
+    current.metrics.time_to_answer = time.perf_counter() - current.started
+    current.metrics.answered = answered
+    last = current.metrics
+    # A callback may call enable() or disable(), which change the list.
+    for callback in tuple(_callbacks):
+        callback(current.metrics)
@@ -0,0 +1,99 @@
+"""Output imports"""
+
+import os
+import sys
+
+TTY_PATH = "/dev/tty"  ## Controlling terminal, drawn on when it can be opened
+
+
+class FdOutput:
+    """Terminal file descriptor that frames are written to as bytes.
+
+    Each frame is encoded once and handed to the kernel with one
+    `os.write`, repeated only if the terminal takes part of it. There is
+    no text layer or buffer in between, and nothing to flush.
+
+    Args:
+        fd (int): Descriptor to write to.
+        encoding (str): Optional. Encoding of the terminal, by default the
+            one of `sys.stdout`, or UTF-8.
+        owned (bool): If True, `close()` closes `fd`.
+    """
+
+    def __init__(self, fd: int, encoding: str | None = None, owned: bool = False):
+        self.fd = fd
+        self.encoding = encoding or getattr(sys.stdout, "encoding", None) or "utf-8"
+        self.owned = owned
+
+    def write(self, data: str) -> int:
+        """Write `data` and return the number of bytes it took."""
+        view = memoryview(data.encode(self.encoding, "replace"))
+        size = len(view)
+        while view:
+            view = view[self._write(view) :]
+        return size
+
+    def _write(self, data) -> int:
+        return os.write(self.fd, data)
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def close(self):
+        if self.owned:
+            os.close(self.fd)
+
+
+class StreamOutput:
+    """Text stream frames are written to, then flushed.
+
+    Used where no terminal descriptor can be written to directly: on
+    Windows, or when `sys.stdout` was replaced by an object without one.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data: str) -> int:
+        self.stream.write(data)
+        self.stream.flush()
+        return len(
+            data.encode(getattr(self.stream, "encoding", None) or "utf-8", "replace")
+        )
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def close(self):
+        pass
+
+
+def open_terminal():
+    """Return an `FdOutput` on the controlling terminal, or `None`.
+
+    Writing the interface there leaves `sys.stdout` to the results, so
+    `choice=$(python pick.py)` captures only what the program prints.
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        fd = os.open(TTY_PATH, os.O_WRONLY | os.O_NOCTTY | os.O_CLOEXEC)
+    except OSError:
+        return None  # No controlling terminal (a daemon, some CI runners)
+    return FdOutput(fd, owned=True)
+
+
+def default():
+    """Return the output widgets draw on when none was chosen.
+
+    The controlling terminal if there is one, else `sys.stdout`.
+    """
+    out = open_terminal()
+    if out is not None:
+        return out
+    if sys.platform != "win32":
+        try:
+            return FdOutput(sys.stdout.fileno())
+        except (AttributeError, ValueError, OSError):
+            pass  # Replaced by an object without a descriptor
+    return StreamOutput(sys.stdout)
@@ -0,0 +1,172 @@
+"""Screen imports"""
+
+import time
+
+from . import colors, metrics, sgr, utils
+from .width import VS16, char_width
+
+BLANK = (" ", "")  ## Cell of an empty, unstyled column
+MERGE_GAP = 4  ## Unchanged cells worth rewriting to save a cursor move
+
+
+def cells(s: str, style: str = "") -> list:
+    """Split `s` into `(char, style)` cells, one per terminal column.
+
+    A double-width character is followed by a `("", style)` continuation
+    cell; zero-width characters join the cell before them.
+    """
+    if s.isascii():
+        return [(ch, style) for ch in s]
+    out = []
+    for ch in s:
+        w = char_width(ch)
+        if w == 1:
+            out.append((ch, style))
+        elif w == 2:
+            out.append((ch, style))
+            out.append(("", style))
+        elif out:
+            widen = ch == VS16 and out[-1][0] != ""
+            out[-1] = (out[-1][0] + ch, style)
+            if widen:
+                out.append(("", style))
+    return out
+
+
+class Screen:
+    """Model of the rows a widget has drawn, used to repaint only changes.
+
+    Row 0 is the line the cursor was on when the screen was created, or,
+    given `origin`, terminal row `origin` (counted from 1): the cursor is
+    then placed with absolute addressing, so moves cost the same wherever
+    the rows are and never scroll the terminal. Rows are lists of
+    `(char, style)` cells, where `style` is the escape sequence prefix the
+    character is drawn with. Widgets hand new rows to `update()` and call
+    `refresh()` once per key; only the cells that differ from what is
+    already on the terminal are written, and only the attributes that
+    differ from the previous cell written are selected.
+    """
+
+    def __init__(self, origin: int | None = None):
+        self.rows = []  # Cells currently on the terminal
+        self.damage = {}  # Row index -> cells to draw on next refresh
+        self.origin = origin  # Terminal row of row 0, for absolute moves
+        self.row = 0 if origin is None else -1  # Cursor position, relative to row 0
+        self.col = 0
+        self.height = 1  # Rows that exist below row 0 (incl. row 0)
+        self.pen = sgr.DEFAULT  # Attributes selected on the terminal
+
+    def update(self, idx: int, row: list):
+        """Schedule row `idx` to be drawn as `row` on the next refresh."""
+        self.damage[idx] = row
+
+    def refresh(self):
+        """Write the changed cells of every damaged row."""
+        record = metrics.recorder
+        began = time.perf_counter()
+        for idx in sorted(self.damage):
+            row = self.damage[idx]
+            while len(self.rows) <= idx:
+                self.rows.append([])
+            old = self.rows[idx]
+            for start, end in _changed_spans(old, row):
+                start, end = _whole_chars(old, row, start, end)
+                self.move_to(idx, start)
+                self._write_cells(
+                    [row[c] if c < len(row) else BLANK for c in range(start, end)]
+                )
+            self.rows[idx] = row
+        self.damage.clear()
+        self.reset_pen()
+        if record is not None:
+            record.sample.render += time.perf_counter() - began
+
+    def move_to(self, row: int, col: int = 0):
+        """Move the cursor to `row`, `col`, creating new lines if needed."""
+        out = []
+        if self.origin is not None:
+            if row != self.row:
+                utils.force_write(f"\033[{self.origin + row};{col + 1}H")
+                self.row, self.col = row, col
+                return
+        elif row >= self.height:
+            self.reset_pen()  # New lines would take the background color
+            if self.row < self.height - 1:
+                out.append(f"\033[{self.height - 1 - self.row}B")
+            out.append("\n" * (row - self.height + 1))
+            self.height = row + 1
+            self.row, self.col = row, 0
+        elif row < self.row:
+            out.append(f"\033[{self.row - row}A")
+        elif row > self.row:
+            out.append(f"\033[{row - self.row}B")
+        self.row = row
+        if col != self.col:
+            if col == 0:
+                out.append("\r")
+            elif col > self.col:
+                out.append(f"\033[{col - self.col}C")
+            elif col < self.col - col:
+                out.append(f"\r\033[{col}C")
+            else:
+                out.append(f"\033[{self.col - col}D")
+            self.col = col
+        if out:
+            utils.force_write("".join(out))
+
+    def reset_pen(self):
+        """Return the terminal to default attributes if they were changed."""
+        if self.pen != sgr.DEFAULT:
+            utils.force_write(colors.RESET)
+            self.pen = sgr.DEFAULT
+
+    def _write_cells(self, span):
+        out = []
+        pen = self.pen
+        last = None
+        for ch, cell_style in span:
+            if cell_style is not last:
+                last = cell_style
+                style = sgr.compile_style(cell_style)
+                if style != pen:
+                    out.append(sgr.transition(pen, style))
+                    pen = style
+            out.append(ch)
+        self.pen = pen
+        utils.force_write("".join(out))
+        self.col += len(span)
+
+
+def _cell(row, col):
+    return row[col] if col < len(row) else BLANK
+
+
+def _whole_chars(old, new, start, end):
+    """Widen `start`, `end` so the span splits no double-width character."""
+    while start > 0 and "" in (_cell(old, start)[0], _cell(new, start)[0]):
+        start -= 1
+    while "" in (_cell(old, end)[0], _cell(new, end)[0]):
+        end += 1
+    return start, end
+
+
+def _changed_spans(old, new):
+    """Yield `(start, end)` column ranges where `new` differs from `old`.
+
+    Ranges closer than `MERGE_GAP` cells are merged into one.
+    """
+    width = max(len(old), len(new))
+    start = end = None
+    for col in range(width):
+        before = old[col] if col < len(old) else BLANK
+        after = new[col] if col < len(new) else BLANK
+        if before == after:
+            continue
+        if start is not None and col - end > MERGE_GAP:
+            yield start, end
+            start = None
+        if start is None:
+            start = col
+        end = col + 1
+    if start is not None:
+        yield start, end
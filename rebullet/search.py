@@ -0,0 +1,165 @@
+"""Fuzzy search imports"""
+
+CONSECUTIVE_BONUS = 4  ## Match right after the previous one
+WORD_START_BONUS = 3  ## Match at the start of the text or of a word
+MAX_GAP_PENALTY = 3  ## Cap on the penalty for skipped characters
+
+
+def _score(text: str, pos: int, prev: int) -> int:
+    """Score of matching the character at `pos` after a match at `prev`."""
+    score = 1
+    if pos == prev + 1:
+        score += CONSECUTIVE_BONUS
+    elif prev >= 0:
+        score -= min(pos - prev - 1, MAX_GAP_PENALTY)
+    if pos == 0 or not text[pos - 1].isalnum():
+        score += WORD_START_BONUS
+    return score
+
+
+def match(query: str, text: str):
+    """Find the characters of `query` in order in `text`, ignoring case.
+
+    Returns:
+        list | None: Positions of the matched characters in `text`, or
+            `None` if `text` does not contain `query` as a subsequence.
+    """
+    text = text.lower()
+    positions = []
+    pos = -1
+    for ch in query.lower():
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+        positions.append(pos)
+    return positions
+
+
+class _Level:
+    """Candidates matching one query, with the state needed to extend it."""
+
+    def __init__(self, query, indices, last, scores):
+        self.query = query
+        self.indices = indices  # Matching choices, in their original order
+        self.last = last  # Position of the last matched character of each
+        self.scores = scores
+        self.sort()
+
+    def add(self, indices, last, scores):
+        """Append matches found among choices added after the search began."""
+        self.indices += indices
+        self.last += last
+        self.scores += scores
+        self.sort()
+
+    def sort(self):
+        # Best match first; ties keep the original order.
+        indices = self.indices
+        self.order = [
+            indices[k] for k in sorted(range(len(indices)), key=self.scores.__getitem__)
+        ]
+
+
+class FuzzySearch:
+    """Incremental fuzzy filter over a list of choices.
+
+    Every query typed so far keeps its result set. Appending a character
+    only searches the candidates of the previous query, continuing each
+    match from where it stopped; removing one returns the cached set.
+    """
+
+    def __init__(self, choices):
+        self.choices = choices
+        self.lowered = [c.lower() for c in choices]
+        self.levels = []
+
+    @property
+    def query(self) -> str:
+        return self.levels[-1].query if self.levels else ""
+
+    @property
+    def results(self):
+        """Original indices of the matching choices, best match first.
+
+        `None` while the query is empty.
+        """
+        return self.levels[-1].order if self.levels else None
+
+    def push(self, ch: str):
+        """Append `ch` to the query and narrow the results."""
+        ch = ch.lower()
+        if self.levels:
+            prev = self.levels[-1]
+            candidates = zip(prev.indices, prev.last, prev.scores)
+        else:
+            # Skip the non-matching majority without a Python-level loop.
+            candidates = (
+                (i, -1, 0) for i, text in enumerate(self.lowered) if ch in text
+            )
+        indices, last, scores = self._narrow(ch, candidates)
+        self.levels.append(_Level(self.query + ch, indices, last, scores))
+
+    def extend(self, choices):
+        """Add choices appended to the source after the search was built.
+
+        Every cached query level gains the new matches, so the results stay
+        complete without searching the earlier choices again.
+        """
+        start = len(self.lowered)
+        self.lowered.extend(c.lower() for c in choices)
+        candidates = [(i, -1, 0) for i in range(start, len(self.lowered))]
+        for level in self.levels:
+            indices, last, scores = self._narrow(level.query[-1], candidates)
+            level.add(indices, last, scores)
+            candidates = list(zip(indices, last, scores))
+
+    def _narrow(self, ch, candidates):
+        """Continue each `(index, last position, score)` match with `ch`."""
+        lowered = self.lowered
+        indices, last, scores = [], [], []
+        for idx, prev_pos, score in candidates:
+            text = lowered[idx]
+            pos = text.find(ch, prev_pos + 1)
+            if pos >= 0:
+                indices.append(idx)
+                last.append(pos)
+                # Scores are negated so that sorting puts the best first.
+                scores.append(score - _score(text, pos, prev_pos))
+        return indices, last, scores
+
+    def pop(self):
+        """Remove the last character of the query."""
+        if self.levels:
+            self.levels.pop()
+
+    def positions(self, idx: int):
+        """Return the positions of the query's characters in choice `idx`."""
+        return match(self.query, self.lowered[idx])
+
+
+class Results:
+    """The choices matching a search, in the order they are shown.
+
+    Offers the parts of `LazyChoices` that widgets navigate with.
+    """
+
+    def __init__(self, choices, order):
+        self.choices = choices
+        self.order = order
+
+    def fill(self, n: int) -> int:
+        return len(self.order)
+
+    def has(self, idx: int) -> bool:
+        return 0 <= idx < len(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __bool__(self):
+        return bool(self.order)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self.choices[i] for i in self.order[idx]]
+        return self.choices[self.order[idx]]
@@ -0,0 +1,172 @@
+"""SGR imports"""
+
+CSI = "\x1b["  ## Introduces every SGR sequence
+FLAG_OFF = {
+    1: 22,
+    2: 22,
+    3: 23,
+    4: 24,
+    5: 25,
+    7: 27,
+    8: 28,
+    9: 29,
+}  ## Code turning each flag off
+CACHE_SIZE = 4096  ## Distinct prefixes and transitions remembered
+
+
+class Style(str):
+    """Compiled set of terminal attributes.
+
+    A `Style` is the shortest escape sequence selecting its attributes, so
+    it can be used wherever a color string is expected. Parsed attributes
+    let `transition()` write only what changes between two styles, instead
+    of resetting and setting everything for each fragment.
+
+    Args:
+        fg (str): Optional. SGR parameters of the foreground color, e.g.
+            "36" or "38;5;208".
+        bg (str): Optional. SGR parameters of the background color.
+        flags (frozenset): SGR codes of the flags set (1 bold, 7 reverse...).
+    """
+
+    def __new__(cls, fg=None, bg=None, flags=frozenset()):
+        params = [str(flag) for flag in sorted(flags)]
+        if fg:
+            params.append(fg)
+        if bg:
+            params.append(bg)
+        self = super().__new__(cls, f"\x1b[{';'.join(params)}m" if params else "")
+        self.fg = fg
+        self.bg = bg
+        self.flags = flags
+        return self
+
+    def __getnewargs__(self):
+        # Without it copy and pickle rebuild the style from its escape
+        # sequence, which `__new__` would take for a foreground color.
+        return (self.fg, self.bg, self.flags)
+
+    def __add__(self, other):
+        if isinstance(other, Style):
+            return compile_style(str(self) + other)
+        return str(self) + other
+
+
+DEFAULT = Style()  ## Attributes of a freshly reset terminal
+_compiled = {}  # Prefix -> Style
+_transitions = {}  # (Style, Style) -> shortest escape sequence between them
+
+
+def compile_style(prefix: str) -> Style:
+    """Return the `Style` a string of SGR escape sequences leaves selected.
+
+    Styles are cached, so compiling the same prefix again (colors joined
+    for every row drawn) is one dictionary lookup. Strings that are not
+    only SGR sequences are returned unchanged.
+    """
+    if isinstance(prefix, Style):
+        return prefix
+    style = _compiled.get(prefix)
+    if style is None:
+        style = _parse(prefix)
+        if len(_compiled) >= CACHE_SIZE:
+            _compiled.clear()
+        _compiled[prefix] = style
+    return style
+
+
+def _sgr_params(prefix):
+    """Return the parameters of each SGR sequence `prefix` is made of.
+
+    Returns `None` if `prefix` holds anything else.
+    """
+    if not prefix:
+        return []
+    head, *sequences = prefix.split(CSI)
+    if head:
+        return None
+    params = []
+    for seq in sequences:
+        if not seq.endswith("m") or seq[:-1].strip("0123456789;"):
+            return None
+        params.append(seq[:-1])
+    return params
+
+
+def _parse(prefix):
+    sequences = _sgr_params(prefix)
+    if sequences is None:
+        return prefix  # Not only SGR sequences, keep as it is
+    fg = bg = None
+    flags = set()
+    for params in sequences:
+        codes = [int(p) if p else 0 for p in params.split(";")]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code in (38, 48):
+                size = 3 if codes[i + 1 : i + 2] == [5] else 5
+                color = ";".join(map(str, codes[i : i + size]))
+                if code == 38:
+                    fg = color
+                else:
+                    bg = color
+                i += size
+                continue
+            if code == 0:
+                fg = bg = None
+                flags.clear()
+            elif code in FLAG_OFF:
+                flags.add(code)
+            elif code in FLAG_OFF.values():
+                flags.difference_update(f for f, off in FLAG_OFF.items() if off == code)
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                fg = str(code)
+            elif code == 39:
+                fg = None
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                bg = str(code)
+            elif code == 49:
+                bg = None
+            i += 1
+    return Style(fg, bg, frozenset(flags))
+
+
+def transition(current, style) -> str:
+    """Return the shortest escape sequence from `current` to `style`.
+
+    Args:
+        current (Style): Attributes the terminal has selected.
+        style (Style): Attributes the next characters are drawn with.
+    """
+    if current == style:
+        return ""
+    key = (current, style)
+    seq = _transitions.get(key)
+    if seq is None:
+        seq = _transition(current, style)
+        if len(_transitions) >= CACHE_SIZE:
+            _transitions.clear()
+        _transitions[key] = seq
+    return seq
+
+
+def _transition(current, style):
+    if not isinstance(current, Style) or not isinstance(style, Style):
+        return "\x1b[0m" + style  # Opaque prefix, start from a reset
+    params = []
+    dropped = current.flags - style.flags
+    offs = sorted({FLAG_OFF[flag] for flag in dropped})
+    params += map(str, offs)
+    # 22 turns off both bold and dim; turn back on the one that stays.
+    restore = style.flags - current.flags
+    if 22 in offs:
+        restore |= style.flags & {1, 2}
+    params += map(str, sorted(restore))
+    if style.fg != current.fg:
+        params.append(style.fg or "39")
+    if style.bg != current.bg:
+        params.append(style.bg or "49")
+    diff = f"\x1b[{';'.join(params)}m"
+    reset = "\x1b[0;" + style[2:] if style else "\x1b[0m"
+    return diff if len(diff) <= len(reset) else reset
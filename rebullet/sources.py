@@ -0,0 +1,275 @@
+"""Choice source imports"""
+
+import os
+import sys
+
+
+class LazyChoices:
+    """Sequence view over an iterable of choices that pulls items on demand.
+
+    Lists and tuples are used as they are. Any other iterable (a generator,
+    a cursor over a remote listing, ...) is only advanced as far as the
+    widget reads, so the first screen can be drawn before the source is
+    exhausted. `len()` and negative indices need every item and drain the
+    source.
+    """
+
+    def __init__(self, iterable):
+        if isinstance(iterable, (list, tuple)):
+            self.items = iterable
+            self._source = None
+        else:
+            self.items = []
+            self._source = iter(iterable)
+
+    @property
+    def exhausted(self) -> bool:
+        """`True` once every item of the source has been pulled."""
+        return self._source is None
+
+    @property
+    def loaded(self) -> int:
+        """Number of items pulled so far."""
+        return len(self.items)
+
+    def fill(self, n: int) -> int:
+        """Pull items until at least `n` are loaded or the source runs out.
+
+        Returns:
+            int: Number of items loaded, which may be more or less than `n`.
+        """
+        items = self.items
+        while len(items) < n and self._source is not None:
+            try:
+                items.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return len(items)
+
+    def has(self, idx: int) -> bool:
+        """Return `True` if there is an item at index `idx`."""
+        return idx >= 0 and self.fill(idx + 1) > idx
+
+    def __len__(self):
+        return self.fill(float("inf"))
+
+    def __bool__(self):
+        return self.has(0)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            if idx.stop is None or idx.stop < 0 or (idx.start or 0) < 0:
+                len(self)
+            else:
+                self.fill(idx.stop)
+            return self.items[idx]
+        if idx < 0:
+            len(self)
+        else:
+            self.fill(idx + 1)
+        return self.items[idx]
+
+    def __iter__(self):
+        idx = 0
+        while self.has(idx):
+            yield self.items[idx]
+            idx += 1
+
+    def index(self, value) -> int:
+        for idx, item in enumerate(self):
+            if item == value:
+                return idx
+        raise ValueError(f"{value!r} is not in choices")
+
+
+class LiveChoices:
+    """Choices that keep arriving while the widget is already interactive.
+
+    Producers add items from any thread with `append()` or `extend()` and
+    call `close()` once there are no more. The constructor can also pump a
+    `source` itself:
+
+    - an iterable, read in a background thread, so it may block (a slow
+      API listing, `iter(queue.get, None)`, ...);
+    - a `queue.Queue`, read until it returns `None`;
+    - an async iterable, read on the running event loop by `launch_async()`
+      (or in a thread with its own loop by `launch()`).
+
+    Items only become visible when the widget calls `merge()` on its own
+    thread, so a frame is always drawn from a consistent list. Producers
+    wake the widget through a pipe (see `fileno()`); on Windows, where
+    pipes can not be waited on with the console, new items show up with the
+    next key press. Nothing ever blocks waiting for the source: `len()` is
+    the number of items merged so far.
+    """
+
+    exhausted = False  # Set once the source is closed and fully merged
+
+    def __init__(self, source=None):
+        self.items = []
+        self.error = None  # Exception raised by the source, if any
+        self._pending = []
+        self._closed = False
+        import threading
+
+        self._lock = threading.Lock()
+        self._signaled = False
+        self._task = None
+        self._wake_r = self._wake_w = None
+        if sys.platform != "win32":
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+        self._source = source
+        if source is not None and not hasattr(source, "__aiter__"):
+            if _is_queue(source):
+                source = iter(source.get, None)
+            threading.Thread(target=self._pump, args=(source,), daemon=True).start()
+            self._source = None
+
+    def __del__(self):
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+
+    def fileno(self):
+        """Return the descriptor that becomes readable when items arrive.
+
+        `None` on Windows.
+        """
+        return self._wake_r
+
+    def append(self, item):
+        """Add one item. Safe to call from any thread."""
+        self.extend((item,))
+
+    def extend(self, items):
+        """Add several items at once. Safe to call from any thread."""
+        with self._lock:
+            self._pending.extend(items)
+            self._signal()
+
+    def close(self, error=None):
+        """Mark the source as complete, or as failed with `error`."""
+        with self._lock:
+            self._closed = True
+            self.error = error
+            self._signal()
+
+    def _signal(self):
+        # Called with the lock held. One byte per batch wakes the widget;
+        # everything added before it merges is picked up at once.
+        if not self._signaled and self._wake_w is not None:
+            self._signaled = True
+            try:
+                os.write(self._wake_w, b"\0")
+            except BlockingIOError:
+                pass
+
+    def _pump(self, iterable):
+        try:
+            for item in iterable:
+                self.append(item)
+        # The source is the caller's code and may raise anything; merge()
+        # re-raises it on the widget's thread instead of losing it here.
+        except Exception as error:  # noqa: BLE001
+            self.close(error)
+        else:
+            self.close()
+
+    async def _pump_async(self, aiterable):
+        try:
+            async for item in aiterable:
+                self.append(item)
+        except Exception as error:  # noqa: BLE001 (re-raised by merge())
+            self.close(error)
+        else:
+            self.close()
+
+    def start(self):
+        """Start reading an async source, if there is one to read.
+
+        Called by the widget when it launches. Inside a running event loop
+        the source is read by a task on that loop; otherwise it gets a
+        thread and an event loop of its own.
+        """
+        import asyncio
+
+        source, self._source = self._source, None
+        if source is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            import threading
+
+            threading.Thread(
+                target=asyncio.run, args=(self._pump_async(source),), daemon=True
+            ).start()
+        else:
+            self._task = loop.create_task(self._pump_async(source))
+
+    def merge(self) -> int:
+        """Make the items added since the last merge visible.
+
+        Returns:
+            int: Number of items merged.
+
+        Raises:
+            Exception: Whatever the source raised, once its items are merged.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._signaled = False
+            self.exhausted = self._closed
+            error, self.error = self.error, None
+        self.items.extend(pending)
+        if error is not None:
+            raise error
+        return len(pending)
+
+    @property
+    def loaded(self) -> int:
+        """Number of items merged so far."""
+        return len(self.items)
+
+    def fill(self, n: int) -> int:
+        return len(self.items)
+
+    def has(self, idx: int) -> bool:
+        return 0 <= idx < len(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def __getitem__(self, idx):
+        return self.items[idx]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def index(self, value) -> int:
+        return self.items.index(value)
+
+
+def _is_queue(source):
+    # queue is only imported by programs that use it, nothing else can be
+    # a Queue; checking sys.modules keeps it out of rebullet's startup.
+    queue = sys.modules.get("queue")
+    return queue is not None and isinstance(source, queue.Queue)
+
+
+def choices_from(choices):
+    """Wrap the `choices` argument of a widget in a choice source.
+
+    Live sources (a `LiveChoices`, a `queue.Queue` or an async iterable)
+    keep delivering items after launch; anything else is a `LazyChoices`.
+    """
+    if isinstance(choices, LiveChoices):
+        return choices
+    if _is_queue(choices) or hasattr(choices, "__aiter__"):
+        return LiveChoices(choices)
+    return LazyChoices(choices if choices is not None else ())
@@ -1,6 +1,11 @@
 """Styles imports"""
 
 from . import colors
+from .sgr import compile_style
+
+# Colors compiled once, so widgets using a preset resolve nothing at launch
+_FG = {name: compile_style(code) for name, code in colors.foreground.items()}
+_BG = {name: compile_style(code) for name, code in colors.background.items()}
 
 Example = {
     "choices": [f"Item {i}" for i in range(1, 6)],
@@ -13,48 +18,48 @@ Example = {
 # Styles for Bullet Class
 Ocean = {
     "bullet": "",
-    "bullet_color": colors.foreground["cyan"],
-    "word_color": colors.foreground["cyan"],
-    "word_on_switch": colors.foreground["blue"],
-    "background_color": colors.background["blue"],
-    "background_on_switch": colors.background["cyan"],
+    "bullet_color": _FG["cyan"],
+    "word_color": _FG["cyan"],
+    "word_on_switch": _FG["blue"],
+    "background_color": _BG["blue"],
+    "background_on_switch": _BG["cyan"],
 }
 
 Greece = {
     "bullet": "α",
-    "bullet_color": colors.foreground["white"],
-    "word_color": colors.foreground["blue"],
-    "word_on_switch": colors.foreground["white"],
-    "background_color": colors.background["white"],
-    "background_on_switch": colors.background["blue"],
+    "bullet_color": _FG["white"],
+    "word_color": _FG["blue"],
+    "word_on_switch": _FG["white"],
+    "background_color": _BG["white"],
+    "background_on_switch": _BG["blue"],
 }
 
 Christmas = {
     "bullet": "★",
-    "bullet_color": colors.foreground["white"],
-    "word_color": colors.foreground["white"],
-    "word_on_switch": colors.foreground["red"],
-    "background_color": colors.background["red"],
-    "background_on_switch": colors.background["green"],
+    "bullet_color": _FG["white"],
+    "word_color": _FG["white"],
+    "word_on_switch": _FG["red"],
+    "background_color": _BG["red"],
+    "background_on_switch": _BG["green"],
 }
 
 Lime = {
     "bullet": "⊙",
-    "bullet_color": colors.foreground["green"],
-    "word_color": colors.foreground["yellow"],
-    "word_on_switch": colors.foreground["green"],
-    "background_color": colors.background["green"],
-    "background_on_switch": colors.background["yellow"],
+    "bullet_color": _FG["green"],
+    "word_color": _FG["yellow"],
+    "word_on_switch": _FG["green"],
+    "background_color": _BG["green"],
+    "background_on_switch": _BG["yellow"],
 }
 
 # Use other default styles!
 
 Exam = {
     "check": "√",
-    "check_color": colors.foreground["red"],
-    "check_on_switch": colors.foreground["red"],
-    "word_color": colors.foreground["black"],
-    "word_on_switch": colors.foreground["black"],
-    "background_color": colors.background["white"],
-    "background_on_switch": colors.background["yellow"],
+    "check_color": _FG["red"],
+    "check_on_switch": _FG["red"],
+    "word_color": _FG["black"],
+    "word_on_switch": _FG["black"],
+    "background_color": _BG["white"],
+    "background_on_switch": _BG["yellow"],
 }
@@ -0,0 +1,63 @@
+"""Terminal session imports"""
+
+import sys
+from contextlib import contextmanager
+
+_depth = 0  ## Number of nested sessions currently open
+
+
+def _raw_mode(attrs):
+    """Return a copy of the `tcgetattr` list `attrs` switched to raw input.
+
+    Unlike `tty.setraw`, output post-processing is left on so that "\\n"
+    still moves to the start of the next line.
+    """
+    import termios
+
+    iflag, oflag, cflag, lflag, ispeed, ospeed, cc = attrs
+    iflag &= ~(
+        termios.BRKINT | termios.ICRNL | termios.INPCK | termios.ISTRIP | termios.IXON
+    )
+    cflag = (cflag & ~(termios.CSIZE | termios.PARENB)) | termios.CS8
+    lflag &= ~(termios.ECHO | termios.ICANON | termios.IEXTEN | termios.ISIG)
+    cc = list(cc)
+    cc[termios.VMIN] = 1
+    cc[termios.VTIME] = 0
+    return [iflag, oflag, cflag, lflag, ispeed, ospeed, cc]
+
+
+@contextmanager
+def session():
+    """Keep the terminal in raw mode for the duration of the block.
+
+    Raw mode is entered once when the outermost session opens and the
+    original settings are restored when it closes, even if the block
+    raises. Nested sessions (a widget launched from a `SlidePrompt`, or a
+    read outside of any widget) reuse the one already open. Does nothing on
+    Windows or when stdin is not a terminal.
+    """
+    global _depth
+    if _depth or sys.platform not in ("linux", "linux2", "darwin"):
+        _depth += 1
+        try:
+            yield
+        finally:
+            _depth -= 1
+        return
+
+    import termios
+
+    fd = sys.stdin.fileno()
+    try:
+        old_settings = termios.tcgetattr(fd)
+    except termios.error:
+        old_settings = None
+    else:
+        termios.tcsetattr(fd, termios.TCSANOW, _raw_mode(old_settings))
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        if old_settings is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
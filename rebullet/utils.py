@@ -1,12 +1,61 @@
 """Utils imports"""
 
-import shutil
+import os
+import select
 import sys
+import time
+from contextlib import contextmanager
 
 from . import charDef as char
-from . import colors
+from . import colors, keys, metrics, output, sgr, terminal
 
-COLUMNS, _ = shutil.get_terminal_size()  ## Size of console
+
+def console_size():
+    """Return the `(columns, rows)` of the console.
+
+    Same rules as `shutil.get_terminal_size()` (the COLUMNS and LINES
+    environment variables win, 80x24 if unknown), without importing shutil
+    and the archive modules it loads at startup.
+    """
+    sizes = []
+    for name in ("COLUMNS", "LINES"):
+        try:
+            sizes.append(int(os.environ[name]))
+        except (KeyError, ValueError):
+            sizes.append(0)
+    columns, rows = sizes
+    if columns <= 0 or rows <= 0:
+        size = _terminal_size()
+        columns = columns if columns > 0 else size.columns or 80
+        rows = rows if rows > 0 else size.lines or 24
+    return columns, rows
+
+
+def _terminal_size():
+    """Return the size of the first terminal among the output and stdio.
+
+    stdout is not enough: in `choice=$(python pick.py)` it is a pipe.
+    """
+    for stream in (_output, sys.__stdout__, sys.__stderr__, sys.__stdin__):
+        try:
+            return os.get_terminal_size(stream.fileno())
+        except (AttributeError, ValueError, OSError):
+            continue
+    return os.terminal_size((0, 0))
+
+
+_output = None  ## Where frames are written, see `set_output()`; opened on first write
+COLUMNS, ROWS = console_size()  ## Size of console, kept current by `resize_events()`
+
+# Write every fragment straight to the console instead of batching it into
+# frames. Useful when debugging rendering code.
+IMMEDIATE = bool(os.environ.get("REBULLET_IMMEDIATE"))
+
+_frame = None  ## Frame currently collecting output, if any
+_reader = keys.KeyReader()  ## Key events read but not consumed yet
+_watched = {}  ## Descriptors waited on with the console -> event they deliver
+_resize_pipe = None  ## (read, write) pipe SIGWINCH wakes the key reader with
+_resize_depth = 0  ## Number of nested `resize_events()` blocks open
 
 
 def handle_windows_input():
@@ -33,11 +82,8 @@ def handle_prefix_char(ch, msvcrt, encoding):
         chx = chr(char.WIN_CHAR_MAP[ch2.encode(encoding)])
         char.WIN_CH_BUFFER.append(chr(char.MOD_KEY_INT))
         char.WIN_CH_BUFFER.append(chx)
-        if ord(chx) in (
-            char.INSERT_KEY - char.MOD_KEY_FLAG,
-            char.DELETE_KEY - char.MOD_KEY_FLAG,
-            char.PG_UP_KEY - char.MOD_KEY_FLAG,
-            char.PG_DOWN_KEY - char.MOD_KEY_FLAG,
+        if ord(chx) + char.MOD_KEY_FLAG in range(
+            char.MOD_KEY_BEGIN, char.MOD_KEY_END + 1
         ):
             char.WIN_CH_BUFFER.append(chr(char.MOD_KEY_DUMMY))
         return chr(char.ESC_KEY)
@@ -46,76 +92,250 @@ def handle_prefix_char(ch, msvcrt, encoding):
 
 
 def handle_unix_input():
-    import termios
-    import tty
+    """Read the next chunk of console input into the key reader.
+
+    While descriptors are watched (see `watch()`), waits for them too and
+    queues the event of every one that became readable.
+    """
+    # Widgets keep a session open for their whole launch(); this only
+    # switches modes when called outside of one.
+    with terminal.session():
+        fd = sys.stdin.fileno()
+        if _watched:
+            ready, _, _ = select.select([fd, *_watched], [], [])
+            for wake in ready:
+                if wake in _watched:
+                    _drain(wake)
+                    _reader.events.append(_watched[wake])
+            if fd not in ready:
+                return
+        _reader.read(fd)
+
+
+def _drain(fd):
+    try:
+        os.read(fd, keys.READ_SIZE)
+    except BlockingIOError:
+        pass
 
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)  # type: ignore
+
+@contextmanager
+def watch(fd, event):
+    """Deliver `event` from `getchar()` whenever `fd` becomes readable.
+
+    Lets a background source (see `sources.LiveChoices`) wake a widget that
+    is waiting for keys. `fd` is drained before the event is queued. Does
+    nothing if `fd` is `None` or on Windows.
+    """
+    if fd is None or sys.platform == "win32":
+        yield
+        return
+    _watched[fd] = event
     try:
-        tty.setraw(fd)  # type: ignore
-        return sys.stdin.read(1)
+        yield
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)  # type: ignore
+        del _watched[fd]
 
 
-def mygetc():
-    """Get raw characters from input."""
-    if sys.platform == "win32":
-        return handle_windows_input()
-    elif sys.platform in ("linux", "linux2", "darwin"):
-        return handle_unix_input()
+def update_size():
+    """Read the console size into `COLUMNS` and `ROWS`."""
+    global COLUMNS, ROWS
+    COLUMNS, ROWS = console_size()
+
+
+def _on_resize(signum, frame):
+    update_size()
+    try:
+        os.write(_resize_pipe[1], b"\0")
+    except BlockingIOError:
+        pass  # A wake up is already pending
+
+
+@contextmanager
+def resize_events():
+    """Keep `COLUMNS` and `ROWS` current and report resizes for the block.
+
+    The outermost block installs a SIGWINCH handler: the console size is
+    read once per resize (not every time a width is needed) and
+    `getchar()` delivers a `charDef.RESIZE_KEY` event for the widget to
+    reflow. Nested blocks reuse it. Without SIGWINCH (Windows), or outside
+    of the main thread, only the size is read on entry.
+    """
+    global _resize_depth, _resize_pipe
+    import signal
+    import threading
+
+    if not _resize_depth:
+        update_size()
+    if (
+        _resize_depth
+        or not hasattr(signal, "SIGWINCH")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        _resize_depth += 1
+        try:
+            yield
+        finally:
+            _resize_depth -= 1
+        return
+    if _resize_pipe is None:
+        _resize_pipe = os.pipe()
+        for fd in _resize_pipe:
+            os.set_blocking(fd, False)
+    previous = signal.signal(signal.SIGWINCH, _on_resize)
+    _resize_depth += 1
+    try:
+        with watch(_resize_pipe[0], keys.Key(chr(char.RESIZE_KEY))):
+            yield
+    finally:
+        _resize_depth -= 1
+        signal.signal(signal.SIGWINCH, previous)
 
 
 def getchar():
-    """Character input parser."""
-    c = mygetc()
-    match ord(c):
-        case char.LINE_BEGIN_KEY:
-            return c
-        case char.LINE_END_KEY:
-            return c
-        case char.TAB_KEY:
-            return c
-        case char.INTERRUPT_KEY:
-            return c
-        case char.NEWLINE_KEY:
-            return c
-        case char.BACK_SPACE_KEY:
-            return c
-        case char.BACK_SPACE_CHAR:
-            return c
-
-        case char.ESC_KEY:
-            combo = mygetc()
-            if ord(combo) != char.MOD_KEY_INT:
-                return getchar()
-
-            key = mygetc()
-            if (
-                ord(key) >= char.MOD_KEY_BEGIN - char.MOD_KEY_FLAG
-                and ord(key) <= char.MOD_KEY_END - char.MOD_KEY_FLAG
-            ):
-                if ord(key) in (
-                    char.HOME_KEY - char.MOD_KEY_FLAG,
-                    char.END_KEY - char.MOD_KEY_FLAG,
-                ):
-                    return chr(ord(key) + char.MOD_KEY_FLAG)
-                trail = mygetc()
-                return (
-                    chr(ord(key) + char.MOD_KEY_FLAG)
-                    if ord(trail) == char.MOD_KEY_DUMMY
-                    else chr(char.UNDEFINED_KEY)
-                )
-            elif (
-                char.ARROW_KEY_BEGIN - char.ARROW_KEY_FLAG
-                <= ord(key)
-                <= char.ARROW_KEY_END - char.ARROW_KEY_FLAG
-            ):
-                return chr(ord(key) + char.ARROW_KEY_FLAG)
-            else:
-                return chr(char.UNDEFINED_KEY)
-        case _:
-            return c if is_printable(c) else chr(char.UNDEFINED_KEY)
+    """Return the next key event.
+
+    Returns:
+        str | int: A one-character string (printable characters, control
+            keys and the `charDef` special keys as `chr(code)`), or
+            `charDef.UNDEFINED_KEY` for input that maps to no key.
+    """
+    while not _reader.events:
+        if sys.platform == "win32":
+            _reader.feed_text(handle_windows_input())
+            if _reader.pending and not char.WIN_CH_BUFFER:
+                _reader.flush()  # Escape itself, translated keys are buffered whole
+        else:
+            handle_unix_input()
+    return _reader.events.popleft()
+
+
+async def getchar_async():
+    """Return the next key event without blocking the running event loop.
+
+    On Unix the loop watches stdin with `add_reader` and the input is read
+    once it is ready. Windows consoles can not be watched, so the read runs
+    in the loop's default executor instead.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    while not _reader.events:
+        if sys.platform == "win32":
+            _reader.feed_text(await loop.run_in_executor(None, handle_windows_input))
+            if _reader.pending and not char.WIN_CH_BUFFER:
+                _reader.flush()
+            continue
+        fds = [sys.stdin.fileno(), *_watched]
+        ready = loop.create_future()
+        for fd in fds:
+            loop.add_reader(
+                fd, lambda ready=ready: ready.done() or ready.set_result(None)
+            )
+        try:
+            await ready
+        finally:
+            for fd in fds:
+                loop.remove_reader(fd)
+        handle_unix_input()
+    return _reader.events.popleft()
+
+
+def fold_repeats(key) -> int:
+    """Take the repeats of `key` waiting right behind it and count them.
+
+    Holding a key queues auto-repeats faster than a slow repaint consumes
+    them, and they keep moving the selection long after the key is let
+    go. A handler calling this right after `key` arrived gets every
+    identical event already queued, or readable without blocking, folded
+    into its own: it can apply `1 + fold_repeats(key)` moves at once and
+    draw one frame for them.
+    """
+    events = _reader.events
+    count = 0
+    while True:
+        if events:
+            if type(events[0]) is not type(key) or events[0] != key:
+                return count
+            events.popleft()
+            count += 1
+            continue
+        if sys.platform == "win32":
+            return count
+        fd = sys.stdin.fileno()
+        if not select.select([fd], [], [], 0)[0]:
+            return count
+        _reader.read(fd)
+
+
+def run(steps):
+    """Drive a widget's input loop, feeding it keys from `getchar()`.
+
+    `steps` is a generator that yields whenever it needs the next key and
+    returns the widget's result. While `metrics` are enabled, every key is
+    timed. Resizes are delivered as `charDef.RESIZE_KEY` events (see
+    `resize_events()`).
+    """
+    _flush_stdout()
+    record = metrics.begin(steps)
+    answered = False
+    try:
+        with resize_events():
+            _send(record, steps, None)
+            while True:
+                start = time.perf_counter()
+                key = getchar()
+                _send(record, steps, key, time.perf_counter() - start)
+    except StopIteration as stop:
+        answered = True
+        return stop.value
+    finally:
+        steps.close()
+        metrics.end(record, answered)
+
+
+async def run_async(steps):
+    """Like `run()`, but waits for keys with `getchar_async()`."""
+    _flush_stdout()
+    record = metrics.begin(steps)
+    answered = False
+    try:
+        with resize_events():
+            _send(record, steps, None)
+            while True:
+                start = time.perf_counter()
+                key = await getchar_async()
+                _send(record, steps, key, time.perf_counter() - start)
+    except StopIteration as stop:
+        answered = True
+        return stop.value
+    finally:
+        steps.close()
+        metrics.end(record, answered)
+
+
+def _flush_stdout():
+    """Write out what was printed before a widget draws on the terminal.
+
+    Widgets bypass `sys.stdout`, so text still in its buffer would
+    otherwise show up after them.
+    """
+    if sys.stdout is not None:
+        sys.stdout.flush()
+
+
+def _send(record, steps, key, waited=0.0):
+    """Hand `key` to `steps`, charging the time to `record` if there is one."""
+    if record is None:
+        steps.send(key)
+        return
+    if key is not None:
+        record.key(keys.code(key), waited)
+    start = time.perf_counter()
+    try:
+        steps.send(key)
+    finally:
+        record.sample.handle = time.perf_counter() - start
 
 
 # Basic command line functions
@@ -141,6 +361,16 @@ def move_cursor_down(n):
     force_write(f"\033[{n}B")
 
 
+def insert_blanks(n):
+    """Shift the rest of the line right, opening n blank columns."""
+    force_write(f"\033[{n}@")
+
+
+def delete_chars(n):
+    """Delete n columns, shifting the rest of the line left."""
+    force_write(f"\033[{n}P")
+
+
 def move_cursor_head():
     """Move cursor to the start of line."""
     force_write("\r")
@@ -148,7 +378,7 @@ def move_cursor_head():
 
 def clear_line():
     """Clear content of one line on the console."""
-    force_write(" " * COLUMNS)
+    force_write("\033[2K")
     move_cursor_head()
 
 
@@ -168,9 +398,131 @@ def clear_console_down(n):
 
 
 def force_write(s, end=""):
-    """Dump everthing in the buffer to the console."""
-    sys.stdout.write(s + end)
-    sys.stdout.flush()
+    """Dump everthing in the buffer to the console.
+
+    Inside a `frame()` the string is queued and written when the frame ends.
+    """
+    if _frame is not None:
+        _frame.append(s + end)
+        return
+    _emit(s + end)
+
+
+def _emit(data):
+    """Write `data` to the console with a single write."""
+    out = _output or _open_output()
+    record = metrics.recorder
+    if record is None:
+        out.write(data)
+        return
+    start = time.perf_counter()
+    size = out.write(data)
+    record.wrote(size, time.perf_counter() - start)
+
+
+def _open_output():
+    global _output
+    _output = output.default()
+    return _output
+
+
+def set_output(out=None):
+    """Choose where widgets draw.
+
+    By default they draw on the controlling terminal (`/dev/tty`), not on
+    `sys.stdout`, which is left free for results, as `fzf` does. Only
+    without a controlling terminal, or on Windows, is `sys.stdout` used.
+
+    Args:
+        out: A file descriptor, an object with a `write(str) -> int`
+            method such as `output.FdOutput`, or `None` for the default.
+    """
+    global _output
+    if isinstance(out, int):
+        out = output.FdOutput(out)
+    if _output is not None and _output is not out:
+        _output.close()
+    _output = out
+
+
+class Frame:
+    """Output collected during one screen update."""
+
+    def __init__(self):
+        self.parts = []
+
+    def append(self, s: str):
+        self.parts.append(s)
+
+    def flush(self):
+        """Write everything collected so far with a single flush."""
+        if self.parts:
+            data = "".join(self.parts)
+            self.parts = []
+            _emit(data)
+
+
+@contextmanager
+def frame():
+    """Collect everything written in the block and flush it once at the end.
+
+    Frames nest: only the outermost one writes to the console. When
+    `IMMEDIATE` is set (or `REBULLET_IMMEDIATE` is in the environment) output
+    is written as it is produced.
+    Yields:
+        Frame: The active frame, or `None` in immediate mode.
+    """
+    global _frame
+    if _frame is not None or IMMEDIATE:
+        yield _frame
+        return
+    _frame = Frame()
+    try:
+        yield _frame
+    finally:
+        current, _frame = _frame, None
+        current.flush()
+
+
+@contextmanager
+def paste_mode(enabled: bool = True):
+    """Ask the terminal to bracket pasted text for the duration of the block.
+
+    Pastes then arrive from `getchar()` as a single `keys.Paste` event.
+    Does nothing unless `enabled`.
+    """
+    if not enabled or sys.platform not in ("linux", "linux2", "darwin"):
+        yield
+        return
+    force_write("\033[?2004h")
+    try:
+        yield
+    finally:
+        force_write("\033[?2004l")
+
+
+@contextmanager
+def alternate_screen(enabled: bool = True):
+    """Draw the block on the terminal's alternate screen buffer.
+
+    The buffer starts empty, and the original screen and cursor position
+    come back when the block ends, as in full-screen programs like `less`.
+    Does nothing unless `enabled`.
+    """
+    if not enabled:
+        yield
+        return
+    force_write("\033[?1049h")
+    try:
+        yield
+    finally:
+        force_write("\033[?1049l")
+
+
+def set_immediate(flag: bool = True):
+    """Switch frame buffering off (`True`) or back on (`False`)."""
+    global IMMEDIATE
+    IMMEDIATE = flag
 
 
 def cprint(
@@ -188,7 +540,11 @@ def cprint(
     Returns:
         None
     """
-    force_write(on + color + s + colors.RESET, end=end)
+    style = sgr.compile_style(on + color)
+    if style:
+        force_write(style + s + colors.RESET, end=end)
+    else:
+        force_write(s, end=end)
 
 
 def is_printable(s: str) -> bool:
@@ -199,10 +555,18 @@ def is_printable(s: str) -> bool:
         bool: `True` if all characters in `s` are printable. `False` if any
             characters in `s` can not be printed.
     """
-    # Ref: https://stackoverflow.com/a/50731077
-    return not any(repr(ch).startswith(("'\\x", "'\\u")) for ch in s)
+    return s.isprintable()
+
+
+def printable(s: str) -> str:
+    """Return `s` without the characters that can not be printed."""
+    if s.isprintable():
+        return s
+    return "".join(filter(str.isprintable, s))
+
 
 def resolve_color(color, mapping):
     if isinstance(color, str):
-        return mapping.get(color, color)  # if string, get ANSI; else assume already ANSI
+        # Name or ANSI code, compiled once so rows combine it cheaply
+        return sgr.compile_style(mapping.get(color, color))
     return color
@@ -1,8 +1,8 @@
 """Wrap_Text imports"""
 
-import re
+from .width import char_width, str_width
 
-WORD_REGEX = re.compile(r"\s?(?P<word>\b\w+\b)\s?")
+TOKEN_PATTERN = r"\s+|\S+"
 
 
 def wrap_text(s: str, max_len: int):
@@ -10,28 +10,78 @@ def wrap_text(s: str, max_len: int):
 
     Args:
         s (str): The string to be wrapped.
-        max_len (int): Maximum length of each substring
+        max_len (int): Maximum width of each line, in terminal columns.
     Returns:
-        str: Multiline string where the length of each line is less than or
+        str: Multiline string where the width of each line is less than or
             equal to `max_len`. Wrapping will not occur in the middle of a
-            word for prettier output.
+            word for prettier output, unless the word alone is too wide.
+            Line breaks already in `s` are kept.
     """
-    substrings = []
+    return "\n".join(wrap_lines(s, max_len))
+
+
+def wrap_lines(s: str, max_len: int):
+    """Yield the lines of `s` wrapped to `max_len` columns, one at a time.
+
+    Like `wrap_text()`, but lazy: each line is produced as it is needed, in
+    a single pass over `s`. A string with `n` line breaks yields at least
+    `n + 1` lines, as `str.split("\\n")` would.
+    """
+    max_len = max(1, max_len)
+    start = 0
     while True:
-        if len(s) <= max_len:
-            substrings.append(s)
-            break
-        (wrapped, s) = _wrap_string(s, max_len)
-        substrings.append(wrapped)
-    return "\n".join(substrings)
-
-
-def _wrap_string(s, max_len):
-    last_word_boundary = max_len
-    for match in WORD_REGEX.finditer(s):
-        if match.end("word") > max_len:
-            break
-        last_word_boundary = match.end("word") + 1
-    wrapped = s[:last_word_boundary]
-    s = s[last_word_boundary:].strip()
-    return (wrapped, s)
+        end = s.find("\n", start)
+        if end < 0:
+            yield from _wrap_line(s[start:], max_len)
+            return
+        yield from _wrap_line(s[start:end], max_len)
+        start = end + 1
+
+
+def _wrap_line(line, max_len):
+    if str_width(line) <= max_len:
+        yield line
+        return
+    import re  # Only lines that need wrapping are split into words
+
+    parts, cols = [], 0
+    for match in re.finditer(TOKEN_PATTERN, line):
+        token = match.group()
+        token_width = str_width(token)
+        if cols + token_width <= max_len:
+            parts.append(token)
+            cols += token_width
+            continue
+        if token.isspace():
+            # Break here; spaces at the end and start of lines are dropped.
+            yield "".join(parts)
+            parts, cols = [], 0
+            continue
+        if cols:
+            yield "".join(parts).rstrip()
+            parts, cols = [], 0
+        if token_width <= max_len:
+            parts.append(token)
+            cols = token_width
+            continue
+        *full, last = _split_word(token, max_len)
+        yield from full
+        parts, cols = [last], str_width(last)
+    if parts:
+        yield "".join(parts).rstrip()
+
+
+def _split_word(word, max_len):
+    """Yield pieces of `word` no wider than `max_len` columns."""
+    if word.isascii():
+        for start in range(0, len(word), max_len):
+            yield word[start : start + max_len]
+        return
+    start = cols = 0
+    for idx, ch in enumerate(word):
+        w = char_width(ch)
+        if cols + w > max_len and idx > start:
+            yield word[start:idx]
+            start, cols = idx, 0
+        cols += w
+    yield word[start:]
@@ -0,0 +1,161 @@
+"""Dates tests"""
+
+from datetime import date
+
+import pytest
+
+from rebullet.dates import _compile_format, _full_year, _numeric, _parse, parse_date
+
+TODAY = date(2026, 1, 31)  # A Saturday, and the last day of a long month
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("today", date(2026, 1, 31)),
+        ("now", date(2026, 1, 31)),
+        ("tomorrow", date(2026, 2, 1)),
+        ("yesterday", date(2026, 1, 30)),
+        ("+3d", date(2026, 2, 3)),
+        ("+3", date(2026, 2, 3)),  # Days by default
+        ("-2w", date(2026, 1, 17)),
+        ("+10 days", date(2026, 2, 10)),
+        ("-1y", date(2025, 1, 31)),
+        ("in 3 days", date(2026, 2, 3)),
+        ("in 1 week", date(2026, 2, 7)),
+        ("2 weeks ago", date(2026, 1, 17)),
+        ("3 years ago", date(2023, 1, 31)),
+        ("next friday", date(2026, 2, 6)),
+        ("last friday", date(2026, 1, 30)),
+        ("this friday", date(2026, 2, 6)),
+        ("fri", date(2026, 2, 6)),
+        ("saturday", date(2026, 1, 31)),
+        ("next saturday", date(2026, 2, 7)),  # A week ahead, not today
+        ("last saturday", date(2026, 1, 24)),
+        ("this saturday", date(2026, 1, 31)),
+        ("last year", date(2025, 1, 31)),
+        ("  In  2   WEEKS ", date(2026, 2, 14)),  # Case and spaces
+    ],
+)
+def test_relative(text, expected):
+    assert parse_date(text, today=TODAY) == expected
+
+
+@pytest.mark.parametrize(
+    "text, today, expected",
+    [
+        ("+1m", date(2026, 1, 31), date(2026, 2, 28)),
+        ("next month", date(2026, 1, 31), date(2026, 2, 28)),
+        ("+1m", date(2024, 1, 31), date(2024, 2, 29)),  # Leap year
+        ("-1m", date(2026, 3, 31), date(2026, 2, 28)),
+        ("+1m", date(2026, 3, 31), date(2026, 4, 30)),
+        ("+13m", date(2026, 1, 31), date(2027, 2, 28)),
+        ("-13m", date(2026, 1, 15), date(2024, 12, 15)),
+        ("+1y", date(2024, 2, 29), date(2025, 2, 28)),
+        ("+4y", date(2024, 2, 29), date(2028, 2, 29)),
+        ("last month", date(2026, 12, 31), date(2026, 11, 30)),
+        ("+1m", date(2026, 12, 15), date(2027, 1, 15)),
+    ],
+)
+def test_months_clamp_to_the_last_day(text, today, expected):
+    assert parse_date(text, today=today) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "   ", "blah", "+3x", "in x days", "3 fortnights ago", "2/30/2026", "fr"],
+)
+def test_invalid(text):
+    with pytest.raises(ValueError, match="could not be parsed"):
+        parse_date(text, today=TODAY)
+
+
+@pytest.mark.parametrize(
+    "format_str, parts",
+    [
+        ("%m/%d/%Y", ("%m", "/", "%d", "/", "%Y")),
+        ("%d.%m.%y", ("%d", ".", "%m", ".", "%y")),
+        ("%-m/%-d", ("%-m", "/", "%-d")),
+        ("%Y%%%m%d", ("%Y", "%", "%m", "%d")),
+        ("Day %d Mo %m", ("day ", "%d", " mo ", "%m")),  # Matched lowercased
+        ("%b %d, %Y", None),  # Month names are left to strptime
+        ("%A %d/%m", None),
+    ],
+)
+def test_compile_format(format_str, parts):
+    assert _compile_format(format_str) == parts
+
+
+@pytest.mark.parametrize(
+    "text, format_str, expected",
+    [
+        ("05/13/2018", "%m/%d/%Y", date(2018, 5, 13)),
+        ("5/13/2018", "%m/%d/%Y", date(2018, 5, 13)),
+        ("13.05.18", "%d.%m.%y", date(2018, 5, 13)),
+        ("5/3", "%-m/%-d", date(2026, 5, 3)),  # This year
+        ("20180513", "%Y%m%d", date(2018, 5, 13)),
+        ("day 3 mo 5", "Day %d Mo %m", date(2026, 5, 3)),
+        ("may 13 2018", "%b %d %Y", date(2018, 5, 13)),  # Through strptime
+    ],
+)
+def test_format_str(text, format_str, expected):
+    assert parse_date(text, format_str, today=TODAY) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2018-05-13", date(2018, 5, 13)),
+        ("2018-5-13", date(2018, 5, 13)),
+        ("2018/05/13", date(2018, 5, 13)),
+        ("2018.5.13", date(2018, 5, 13)),
+        ("05/13/2018", date(2018, 5, 13)),
+        ("5.13.18", date(2018, 5, 13)),
+        ("5 13 80", date(1980, 5, 13)),
+        ("5-13-2018", date(2018, 5, 13)),
+    ],
+)
+def test_numeric(text, expected):
+    assert _numeric(text, "%d.%m.%Y", TODAY) == expected
+
+
+@pytest.mark.parametrize("text", ["2018-05", "5/13", "a/b/c", "2018-05-13-1", "may"])
+def test_numeric_needs_three_numbers(text):
+    assert _numeric(text, "%m/%d/%Y", TODAY) is None
+
+
+@pytest.mark.parametrize("text", ["2018-13-01", "13/05/2018", "2/30/2026"])
+def test_numeric_out_of_range(text):
+    with pytest.raises(ValueError):
+        _numeric(text, "%m/%d/%Y", TODAY)
+
+
+@pytest.mark.parametrize(
+    "year, today, expected",
+    [
+        (18, date(2026, 1, 1), 2018),
+        (76, date(2026, 1, 1), 2076),
+        (77, date(2026, 1, 1), 1977),
+        (99, date(2026, 1, 1), 1999),
+        (0, date(2026, 1, 1), 2000),
+        (1, date(2099, 1, 1), 2101),
+        (98, date(2001, 1, 1), 1998),
+    ],
+)
+def test_two_digit_years_are_the_closest(year, today, expected):
+    assert _full_year(year, today) == expected
+
+
+def test_results_are_cached():
+    _parse.cache_clear()
+    for _ in range(3):
+        parse_date("next friday", today=TODAY)
+        with pytest.raises(ValueError):
+            parse_date("not a date", today=TODAY)
+    info = _parse.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_default_today():
+    assert parse_date("today") == date.today()
@@ -0,0 +1,99 @@
+"""Dependency graph tests"""
+
+import pytest
+
+from rebullet import CheckDependencies
+from rebullet.depgraph import DependencyGraph
+from rebullet.exceptions import CyclicDependenciesError, MissingDependenciesError
+
+TREE = (
+    ("A", ("C", "D")),
+    ("B", ("A",)),
+    ("C", ()),
+    ("D", ("C",)),
+    ("E", ("B",)),
+)
+
+
+def names(graph, indices):
+    return sorted(graph.choices[idx] for idx in indices)
+
+
+def test_requires_is_transitive():
+    graph = DependencyGraph(TREE)
+    assert names(graph, graph.requires(graph.index["E"])) == ["A", "B", "C", "D"]
+    assert names(graph, graph.requires(graph.index["C"])) == []
+
+
+def test_required_by_is_transitive():
+    graph = DependencyGraph(TREE)
+    assert names(graph, graph.required_by(graph.index["C"])) == ["A", "B", "D", "E"]
+    assert names(graph, graph.required_by(graph.index["E"])) == []
+
+
+def test_closures_are_cached():
+    graph = DependencyGraph(TREE)
+    idx = graph.index["E"]
+    assert graph.requires(idx) is graph.requires(idx)
+
+
+def test_diamond_is_not_a_cycle():
+    graph = DependencyGraph(
+        (("A", ("B", "C")), ("B", ("D",)), ("C", ("D",)), ("D", ()))
+    )
+    assert names(graph, graph.requires(0)) == ["B", "C", "D"]
+
+
+def test_missing_dependency():
+    with pytest.raises(MissingDependenciesError, match="'A' depends on 'Z'"):
+        DependencyGraph((("A", ("Z",)), ("B", ())))
+
+
+@pytest.mark.parametrize(
+    "tree, cycle",
+    [
+        ((("A", ("A",)),), ["A", "A"]),
+        ((("A", ("B",)), ("B", ("A",))), ["A", "B", "A"]),
+        (
+            (("A", ("B",)), ("B", ("C",)), ("C", ("D",)), ("D", ("B",))),
+            ["B", "C", "D", "B"],
+        ),
+    ],
+)
+def test_cycle_is_named(tree, cycle):
+    with pytest.raises(CyclicDependenciesError) as info:
+        DependencyGraph(tree)
+    assert info.value.cycle == cycle
+    assert " -> ".join(f"'{c}'" for c in cycle) in str(info.value)
+
+
+def test_cycle_behind_acyclic_choices():
+    tree = (("C", ()), ("A", ("C", "E")), ("B", ("A", "E")), ("E", ("B",)))
+    with pytest.raises(CyclicDependenciesError) as info:
+        DependencyGraph(tree)
+    cycle = info.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert sorted(cycle[:-1]) == ["A", "B", "E"]
+
+
+def test_check_dependencies_keeps_its_dependency_maps():
+    check = CheckDependencies("Pick:", TREE)
+    assert check.dependencies == dict(TREE)
+    assert check.dependants == {
+        "A": {"B"},
+        "B": {"E"},
+        "C": {"A", "D"},
+        "D": {"A"},
+    }
+
+
+def test_long_chain_does_not_recurse():
+    size = 100_000
+    tree = [(str(i), (str(i + 1),)) for i in range(size - 1)] + [(str(size - 1), ())]
+    graph = DependencyGraph(tree)
+    assert len(graph.requires(0)) == size - 1
+    assert len(graph.required_by(size - 1)) == size - 1
+    tree[-1] = (str(size - 1), ("0",))
+    with pytest.raises(CyclicDependenciesError) as info:
+        DependencyGraph(tree)
+    assert len(info.value.cycle) == size + 1
@@ -0,0 +1,113 @@
+"""Gap buffer tests"""
+
+import pytest
+
+from rebullet.gapbuffer import GapBuffer
+
+
+def test_text_starts_with_the_cursor_at_its_end():
+    buf = GapBuffer("hello")
+    assert str(buf) == "hello"
+    assert len(buf) == 5
+    assert buf.cursor == 5
+
+
+def test_capacity_leaves_room_for_the_text():
+    buf = GapBuffer("x" * 100, capacity=8)
+    assert len(buf.data) == 200
+    assert str(buf) == "x" * 100
+
+
+def test_insert_at_the_cursor():
+    buf = GapBuffer("hd")
+    buf.move(1)
+    buf.insert("ello worl")
+    assert str(buf) == "hello world"
+    assert buf.before() == "hello worl"
+    assert buf.after() == "d"
+
+
+def test_move_keeps_the_text():
+    buf = GapBuffer("abcdef")
+    for pos in (0, 6, 2, 5, 1, 1, 6):
+        buf.move(pos)
+        assert buf.cursor == pos
+        assert str(buf) == "abcdef"
+        assert buf.before() == "abcdef"[:pos]
+
+
+def test_delete_stops_at_the_end():
+    buf = GapBuffer("abcdef")
+    buf.move(4)
+    assert buf.delete(5) == 2
+    assert buf.delete() == 0
+    assert str(buf) == "abcd"
+
+
+def test_insert_grows_a_full_gap():
+    buf = GapBuffer("ab", capacity=4)
+    buf.move(1)
+    buf.insert("XY")  # Fills the gap exactly
+    assert len(buf.data) == 4
+    buf.insert("Z")
+    assert len(buf.data) == 8  # Doubled
+    assert str(buf) == "aXYZb"
+    assert buf.after() == "b"
+
+
+def test_insert_grows_past_double_for_long_text():
+    buf = GapBuffer("ab", capacity=4)
+    buf.move(1)
+    buf.insert("0123456789")
+    assert len(buf.data) >= 12
+    assert str(buf) == "a0123456789b"
+    assert buf.cursor == 11
+
+
+def test_growth_keeps_text_after_the_cursor():
+    buf = GapBuffer("", capacity=1)
+    for ch in "hello":
+        buf.insert(ch)
+        buf.move(0)
+    assert str(buf) == "olleh"
+    buf.move(len(buf))
+    buf.insert("!")
+    assert str(buf) == "olleh!"
+
+
+def test_indexing():
+    buf = GapBuffer("abcdef")
+    buf.move(2)
+    assert [buf[i] for i in range(len(buf))] == list("abcdef")
+    assert buf[-1] == "f"
+    with pytest.raises(IndexError):
+        buf[6]
+    with pytest.raises(IndexError):
+        buf[-7]
+
+
+def test_clear():
+    buf = GapBuffer("abc")
+    buf.move(1)
+    buf.clear()
+    assert str(buf) == ""
+    buf.insert("x")
+    assert str(buf) == "x"
+
+
+@pytest.mark.parametrize(
+    "pos, start, end",
+    [
+        (0, 0, 3),
+        (3, 0, 10),
+        (5, 0, 10),
+        (7, 5, 10),
+        (10, 5, 14),
+        (12, 5, 14),
+        (14, 12, 14),
+    ],
+)
+def test_word_bounds(pos, start, end):
+    buf = GapBuffer("one  three  xy")
+    assert buf.word_start(pos) == start
+    assert buf.word_end(pos) == end
@@ -0,0 +1,241 @@
+"""Key reader tests"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from rebullet import charDef as char
+from rebullet import keys
+from rebullet.keys import Key, KeyReader, Paste
+
+ESC = "\x1b"
+
+
+def read_all(*chunks):
+    reader = KeyReader()
+    for chunk in chunks:
+        reader.feed_text(chunk)
+    return reader
+
+
+def codes(reader):
+    return [keys.code(event) for event in reader.events]
+
+
+def test_typed_text():
+    reader = read_all("hé中\r")
+    assert list(reader.events) == ["h", "é", "中", "\r"]
+    assert not any(isinstance(event, Key) for event in reader.events)
+
+
+def test_unprintable_characters_are_undefined():
+    reader = read_all("\x02a\x0e")
+    assert list(reader.events) == [char.UNDEFINED_KEY, "a", char.UNDEFINED_KEY]
+
+
+@pytest.mark.parametrize(
+    "seq, key",
+    [
+        ("[A", char.ARROW_UP_KEY),
+        ("OB", char.ARROW_DOWN_KEY),  # SS3, application cursor mode
+        ("[H", char.HOME_KEY),
+        ("[F", char.END_KEY),
+        ("[1~", char.HOME_KEY),
+        ("[4~", char.END_KEY),
+        ("[7~", char.HOME_KEY),  # rxvt
+        ("[8~", char.END_KEY),  # rxvt
+        ("[3~", char.DELETE_KEY),
+        ("[5~", char.PG_UP_KEY),
+        ("[6~", char.PG_DOWN_KEY),
+        ("OP", char.F1_KEY),
+        ("[15~", char.F5_KEY),
+        ("[24~", char.F12_KEY),
+        ("[[A", char.F1_KEY),  # Linux console
+        ("[Z", char.BACK_TAB_KEY),
+        ("[1;2A", char.ARROW_UP_KEY + char.SHIFT_KEY_FLAG),
+        ("[1;5D", char.ARROW_LEFT_KEY + char.CTRL_KEY_FLAG),
+        ("[1;3C", char.ARROW_RIGHT_KEY + char.ALT_KEY_FLAG),
+        ("[3;6~", char.DELETE_KEY + char.SHIFT_KEY_FLAG + char.CTRL_KEY_FLAG),
+        ("[a", char.ARROW_UP_KEY + char.SHIFT_KEY_FLAG),  # rxvt
+        ("Od", char.ARROW_LEFT_KEY + char.CTRL_KEY_FLAG),  # rxvt
+        (ESC + "[B", char.ARROW_DOWN_KEY + char.ALT_KEY_FLAG),
+    ],
+)
+def test_sequences(seq, key):
+    reader = read_all(ESC + seq + "x")
+    assert codes(reader) == [key, ord("x")]
+    assert isinstance(reader.events[0], Key)
+    assert reader.pending == ""
+
+
+def test_home_is_not_followed_by_a_tilde():
+    assert codes(read_all(ESC + "[1~")) == [char.HOME_KEY]
+
+
+@pytest.mark.parametrize("split", range(1, 6))
+def test_sequence_split_across_reads(split):
+    data = ESC + "[15~a"
+    reader = read_all(data[:split], data[split:])
+    assert codes(reader) == [char.F5_KEY, ord("a")]
+
+
+def test_split_sequence_waits_in_pending():
+    reader = read_all("a" + ESC + "[1;")
+    assert list(reader.events) == ["a"]
+    assert reader.pending == ESC + "[1;"
+    reader.feed_text("5A")
+    assert codes(reader)[1:] == [char.ARROW_UP_KEY + char.CTRL_KEY_FLAG]
+    assert reader.pending == ""
+
+
+def test_alt_with_a_character():
+    reader = read_all(ESC + "b" + ESC + "f")
+    assert codes(reader) == [char.WORD_LEFT_KEY, char.WORD_RIGHT_KEY]
+
+
+def test_escape_then_a_sequence():
+    reader = read_all(ESC + ESC + "[A")
+    assert codes(reader) == [char.ARROW_UP_KEY + char.ALT_KEY_FLAG]
+    reader = read_all(ESC + ESC + "x")
+    assert codes(reader) == [char.ESC_KEY, ord("x") + char.ALT_KEY_FLAG]
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        "[99~",  # Unknown parameter
+        "[1;9A",  # Unknown modifier
+        "[?25h",  # Private parameter
+        "[200;1~",
+        "[1;2;3;4X",
+    ],
+)
+def test_unknown_csi_is_skipped_whole(seq):
+    reader = read_all(ESC + seq + "ok")
+    assert list(reader.events) == [char.UNDEFINED_KEY, "o", "k"]
+
+
+def test_unknown_csi_split_across_reads():
+    reader = read_all(ESC + "[99", "9~z")
+    assert list(reader.events) == [char.UNDEFINED_KEY, "z"]
+
+
+def test_unknown_csi_without_final_byte():
+    # A control character ends the parameters, and is a key of its own.
+    reader = read_all(ESC + "[9\r")
+    assert list(reader.events) == [char.UNDEFINED_KEY, "\r"]
+
+
+def test_unknown_ss3_and_non_ascii_alt():
+    reader = read_all(ESC + "OXa" + ESC + "é")
+    assert list(reader.events) == [char.UNDEFINED_KEY, "a", char.UNDEFINED_KEY]
+
+
+def test_paste():
+    reader = read_all("a\x1b[200~x\x1b[Ay\r\x1b[201~b")
+    events = list(reader.events)
+    assert events == ["a", "x\x1b[Ay\r", "b"]
+    assert isinstance(events[1], Paste)
+    assert codes(reader)[1] == char.PASTE_KEY
+
+
+def test_paste_split_across_reads():
+    reader = read_all("\x1b[20", "0~ab", "c\x1b[2", "01~")
+    assert list(reader.events) == ["abc"]
+    assert isinstance(reader.events[0], Paste)
+
+
+@pytest.mark.parametrize(
+    "pending, expected",
+    [
+        (ESC, [char.ESC_KEY]),
+        (ESC + ESC, [char.ESC_KEY, char.ESC_KEY]),
+        (ESC + "[", [ord("[") + char.ALT_KEY_FLAG]),
+        (ESC + "O", [ord("O") + char.ALT_KEY_FLAG]),
+        (ESC + "[1;", [char.UNDEFINED_KEY]),
+    ],
+)
+def test_flush(pending, expected):
+    reader = read_all(pending)
+    assert not reader.events
+    assert reader.pending == pending
+    reader.flush()
+    assert codes(reader) == expected
+    assert reader.pending == ""
+
+
+def test_multibyte_character_split_across_reads():
+    data = "é中".encode()
+    reader = KeyReader()
+    for byte in data:
+        reader.feed(bytes([byte]))
+    assert list(reader.events) == ["é", "中"]
+
+
+@pytest.fixture
+def pipe():
+    if sys.platform == "win32":
+        pytest.skip("select() only waits on sockets on Windows")
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_read_flushes_a_lone_escape_after_the_timeout(pipe):
+    read_fd, write_fd = pipe
+    os.write(write_fd, b"\x1b")
+    reader = KeyReader()
+    start = time.perf_counter()
+    reader.read(read_fd, timeout=0.05)
+    assert time.perf_counter() - start >= 0.04
+    assert codes(reader) == [char.ESC_KEY]
+    assert reader.pending == ""
+
+
+def test_read_waits_for_the_rest_of_a_sequence(pipe):
+    read_fd, write_fd = pipe
+    os.write(write_fd, b"\x1b[")
+    later = threading.Timer(0.02, os.write, (write_fd, b"B"))
+    later.start()
+    reader = KeyReader()
+    reader.read(read_fd, timeout=1)
+    later.join()
+    assert codes(reader) == [char.ARROW_DOWN_KEY]
+
+
+def test_read_does_not_wait_for_complete_keys(pipe):
+    read_fd, write_fd = pipe
+    os.write(write_fd, b"a\x1b[A")
+    reader = KeyReader()
+    start = time.perf_counter()
+    reader.read(read_fd, timeout=1)
+    assert time.perf_counter() - start < 0.5
+    assert codes(reader) == [ord("a"), char.ARROW_UP_KEY]
+
+
+@pytest.mark.parametrize(
+    "event, key",
+    [
+        ("a", ord("a")),
+        (" ", char.SPACE_CHAR),
+        ("\r", char.NEWLINE_KEY),
+        ("\x7f", char.BACK_SPACE_KEY),
+        ("é", ord("é")),
+        (Key(chr(char.ARROW_DOWN_KEY)), char.ARROW_DOWN_KEY),
+        (Key(chr(char.F1_KEY)), char.F1_KEY),
+        (Paste("text"), char.PASTE_KEY),
+        (char.UNDEFINED_KEY, char.UNDEFINED_KEY),
+        # Typed characters whose code point is a special key's code.
+        (chr(char.ARROW_DOWN_KEY), char.PRINTABLE_KEY),  # "ł"
+        (chr(char.ARROW_UP_KEY), char.PRINTABLE_KEY),  # "Ł"
+        (chr(char.F1_KEY), char.PRINTABLE_KEY),
+        (chr(char.RESIZE_KEY), char.PRINTABLE_KEY),
+        ("\u200b", char.UNDEFINED_KEY),  # Typed, but not printable
+    ],
+)
+def test_code(event, key):
+    assert keys.code(event) == key
@@ -0,0 +1,23 @@
+"""Package tests"""
+
+import importlib
+
+import pytest
+
+import rebullet
+
+
+def test_widgets_are_exported():
+    for name in rebullet.__all__:
+        assert getattr(rebullet, name).__name__ == name
+    assert set(rebullet.__all__) <= set(dir(rebullet))
+
+
+@pytest.mark.parametrize("name", ["colors", "utils", "charDef", "styles", "emojis"])
+def test_submodules_are_attributes(name):
+    assert getattr(rebullet, name) is importlib.import_module(f"rebullet.{name}")
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        rebullet.nope
@@ -0,0 +1,142 @@
+"""Fuzzy search tests"""
+
+import pytest
+
+from rebullet.search import FuzzySearch, Results, match
+from rebullet.sources import LiveChoices
+
+CHOICES = ["apple", "apricot", "banana", "Grape", "pineapple", "papaya"]
+
+
+def search(choices, query):
+    finder = FuzzySearch(choices)
+    for ch in query:
+        finder.push(ch)
+    return finder
+
+
+def shown(finder):
+    return sorted(finder.choices[idx] for idx in finder.results)
+
+
+@pytest.mark.parametrize(
+    "query, text, positions",
+    [
+        ("ap", "Grape", [2, 3]),
+        ("AP", "apple", [0, 1]),
+        ("ppe", "pineapple", [0, 5, 8]),  # Leftmost, not best
+        ("", "apple", []),
+        ("pa", "apple", None),
+    ],
+)
+def test_match(query, text, positions):
+    assert match(query, text) == positions
+
+
+def test_empty_query_has_no_results():
+    finder = FuzzySearch(CHOICES)
+    assert finder.query == ""
+    assert finder.results is None
+    finder.pop()  # Nothing to remove
+    assert finder.results is None
+
+
+def test_results_narrow_as_the_query_grows():
+    finder = FuzzySearch(CHOICES)
+    seen = []
+    for ch in "ape":
+        finder.push(ch)
+        seen.append(shown(finder))
+    assert finder.query == "ape"
+    assert seen == [
+        ["Grape", "apple", "apricot", "banana", "papaya", "pineapple"],
+        ["Grape", "apple", "apricot", "papaya", "pineapple"],
+        ["Grape", "apple", "pineapple"],
+    ]
+
+
+def test_narrowing_matches_a_fresh_search():
+    finder = search(CHOICES, "pp")
+    finder.push("l")
+    assert finder.results == search(CHOICES, "ppl").results
+
+
+def test_removing_a_character_returns_the_cached_results():
+    finder = search(CHOICES, "ap")
+    results = finder.results
+    finder.push("r")
+    assert shown(finder) == ["apricot"]
+    finder.pop()
+    assert finder.query == "ap"
+    assert finder.results is results
+    finder.pop()
+    finder.pop()
+    assert finder.results is None
+
+
+def test_best_match_first():
+    choices = ["xaxxxb", "cab", "ab", "a b", "xab", "ab again"]
+    finder = search(choices, "ab")
+    # At a word start and consecutive beats a word start alone, which
+    # beats consecutive alone; gaps come last. Ties keep the list order.
+    assert [choices[i] for i in finder.results] == [
+        "ab",
+        "ab again",
+        "a b",
+        "cab",
+        "xab",
+        "xaxxxb",
+    ]
+
+
+def test_positions_of_the_query():
+    finder = search(CHOICES, "ape")
+    assert finder.positions(CHOICES.index("pineapple")) == [4, 5, 8]
+
+
+@pytest.fixture
+def live():
+    choices = LiveChoices()
+    choices.extend(["apple", "banana"])
+    choices.merge()
+    yield choices
+    choices.close()
+
+
+def test_extend_adds_live_choices_to_every_level(live):
+    finder = FuzzySearch(list(live))
+    finder.push("a")
+    finder.push("p")
+    start = len(live)
+    live.extend(["grape", "papaya", "kiwi"])
+    live.merge()
+    finder.extend(live[start:])
+    assert sorted(live[idx] for idx in finder.results) == ["apple", "grape", "papaya"]
+    finder.pop()
+    assert sorted(live[idx] for idx in finder.results) == [
+        "apple",
+        "banana",
+        "grape",
+        "papaya",
+    ]
+    # The extended levels are the ones a fresh search would build.
+    finder.push("p")
+    assert finder.results == search(list(live), "ap").results
+
+
+def test_extend_without_a_query(live):
+    finder = FuzzySearch(list(live))
+    finder.extend(["grape"])
+    finder.push("g")
+    assert finder.results == [2]
+
+
+def test_results_show_the_matches_in_order():
+    finder = search(CHOICES, "ap")
+    results = Results(CHOICES, finder.results)
+    assert len(results) == 5
+    assert results[0] == CHOICES[finder.results[0]]
+    assert results[1:3] == [CHOICES[i] for i in finder.results[1:3]]
+    assert results.has(4) and not results.has(5)
+    assert results.fill(100) == 5
+    assert not Results(CHOICES, [])
@@ -0,0 +1,77 @@
+"""SGR tests"""
+
+import copy
+import pickle
+
+import pytest
+
+from rebullet import styles
+from rebullet.sgr import DEFAULT, Style, compile_style, transition
+
+STYLES = [
+    DEFAULT,
+    Style("36"),
+    Style(bg="44"),
+    Style("38;5;208", "48;2;1;2;3", frozenset({1, 4})),
+    compile_style("\x1b[1m\x1b[36m\x1b[44m"),
+]
+
+
+@pytest.mark.parametrize("style", STYLES)
+@pytest.mark.parametrize(
+    "clone",
+    [
+        copy.copy,
+        copy.deepcopy,
+        lambda style: pickle.loads(pickle.dumps(style)),
+        lambda style: pickle.loads(pickle.dumps(style, protocol=0)),
+    ],
+)
+def test_copy_and_pickle_keep_the_style(style, clone):
+    other = clone(style)
+    assert type(other) is Style
+    assert other == style
+    assert (other.fg, other.bg, other.flags) == (style.fg, style.bg, style.flags)
+
+
+def test_presets_copy_cleanly():
+    preset = copy.deepcopy(styles.Ocean)
+    assert preset == styles.Ocean
+    assert copy.copy(styles.Ocean["word_color"]) == "\x1b[36m"
+
+
+@pytest.mark.parametrize(
+    "prefix, fg, bg, flags",
+    [
+        ("", None, None, set()),
+        ("\x1b[36m", "36", None, set()),
+        ("\x1b[1m\x1b[36m\x1b[44m", "36", "44", {1}),
+        ("\x1b[1;4m\x1b[24m", None, None, {1}),
+        ("\x1b[31m\x1b[0m\x1b[7m", None, None, {7}),
+        ("\x1b[38;5;208m", "38;5;208", None, set()),
+        ("\x1b[48;2;1;2;3m\x1b[39m", None, "48;2;1;2;3", set()),
+    ],
+)
+def test_compile_style(prefix, fg, bg, flags):
+    style = compile_style(prefix)
+    assert (style.fg, style.bg, style.flags) == (fg, bg, flags)
+
+
+def test_compile_style_keeps_other_text():
+    assert compile_style("\x1b[2J") == "\x1b[2J"
+    assert not isinstance(compile_style("\x1b[2J"), Style)
+
+
+@pytest.mark.parametrize(
+    "current, style, seq",
+    [
+        (Style("36"), Style("36"), ""),
+        (Style("36"), Style("31"), "\x1b[31m"),
+        (Style("36", "44"), Style(bg="44"), "\x1b[39m"),
+        # A reset is shorter than turning bold off and dim on (22;2).
+        (Style(flags=frozenset({1})), Style(flags=frozenset({2})), "\x1b[0;2m"),
+        (Style("36", "44", frozenset({1, 4})), DEFAULT, "\x1b[0m"),
+    ],
+)
+def test_transition(current, style, seq):
+    assert transition(current, style) == seq
@@ -0,0 +1,90 @@
+"""Width tests"""
+
+import pytest
+
+from rebullet import screen
+from rebullet.width import VS16, char_width, pad, str_width, truncate
+
+
+@pytest.mark.parametrize(
+    "ch, width",
+    [
+        ("a", 1),
+        ("\x1b", 0),
+        ("\x85", 0),
+        ("é", 1),
+        ("\u0301", 0),  # Combining acute accent
+        ("\u200b", 0),  # Zero width space
+        ("中", 2),
+        ("！", 2),  # Fullwidth exclamation mark
+        ("😀", 2),
+        ("❤", 1),  # Text presentation by default
+        (VS16, 0),
+    ],
+)
+def test_char_width(ch, width):
+    assert char_width(ch) == width
+
+
+@pytest.mark.parametrize(
+    "s, width",
+    [
+        ("", 0),
+        ("plain", 5),
+        ("中文 ok", 7),
+        ("é", 1),
+        ("😀 smile", 8),
+    ],
+)
+def test_str_width(s, width):
+    assert str_width(s) == width
+
+
+@pytest.mark.parametrize(
+    "s, width",
+    [
+        ("❤" + VS16, 2),  # Narrow symbol, widened
+        ("a ❤" + VS16, 4),
+        ("#" + VS16, 2),  # ASCII symbol, widened
+        ("中#" + VS16, 4),  # ASCII symbol after wide text
+        ("😀" + VS16, 2),  # Already wide
+        ("中" + VS16, 2),
+        ("❤" + VS16 + VS16, 2),  # Only widens once
+        (VS16, 0),  # Nothing to widen
+        ("❤\u0301" + VS16, 2),  # Combining marks in between
+    ],
+)
+def test_vs16_widens_the_narrow_char_before_it(s, width):
+    assert str_width(s) == width
+    assert len(screen.cells(s)) == width
+
+
+def test_measurement_is_cached_per_string():
+    # Same non-ASCII chars, different ASCII ones.
+    assert str_width("a中") == 3
+    assert str_width("abc中") == 5
+    assert str_width("中#" + VS16) == 4
+    assert str_width("中x") == 3
+
+
+@pytest.mark.parametrize(
+    "s, columns, cut",
+    [
+        ("short", 10, "short"),
+        ("exactly", 7, "exactly"),
+        ("too long", 6, "too l…"),
+        ("中文中文", 5, "中文…"),
+        ("中文中文", 4, "中…"),  # No half of a wide char
+        ("❤" + VS16 + "abc", 4, "❤" + VS16 + "a…"),
+        ("😀" + VS16 + "abc", 4, "😀" + VS16 + "a…"),
+        ("abc", 0, ""),
+    ],
+)
+def test_truncate(s, columns, cut):
+    assert truncate(s, columns) == cut
+    assert str_width(cut) <= columns
+
+
+def test_pad():
+    assert pad("中", 4) == "中  "
+    assert str_width(pad("❤" + VS16, 5)) == 5